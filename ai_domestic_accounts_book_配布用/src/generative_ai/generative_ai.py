@@ -2,11 +2,33 @@
 初回作成日：2025/12/28
 ファイル名：generative_ai.py
 """
+from __future__ import annotations
+
+import hashlib
+import json
 import os
+import tempfile
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Iterable, Iterator
 from dotenv import load_dotenv
-from openai import AzureOpenAI, APIError, APITimeoutError
+from openai import AzureOpenAI, APIConnectionError, APIError, APITimeoutError
 from ..tool import logger_module as log_mod
+from ..tool import retry_util
+
+# モジュール用ロガー（呼び出し元ファイル名を保持）
+log = log_mod.get_logger(__file__)
+
+
+# ==================================================
+# 定数定義
+# ==================================================
+RESPONSE_CACHE_MAX_ENTRIES: int = 10000        # 応答キャッシュの最大件数
+DEFAULT_MAX_TOKENS: int = 1024                  # 応答の最大トークン数（既定値）
+DEFAULT_TEMPERATURE: float = 0.7                # 応答の温度（既定値）
 
 
 # ==================================================
@@ -14,64 +36,320 @@ from ..tool import logger_module as log_mod
 # ==================================================
 client: AzureOpenAI = None      # 生成AIクライアント
 model: str = 'gpt-4.1'          # 使用するモデル名
+_response_cache: OrderedDict[str, str] = OrderedDict()     # 応答キャッシュ（key: プロンプトのハッシュ値）
+_response_cache_path: Path | None = None                   # 応答キャッシュの保存先ファイルパス
+_response_cache_lock: threading.Lock = threading.Lock()    # 応答キャッシュ排他ロック
+_inflight_requests: dict[str, Future] = {}                 # 実行中リクエスト（key: プロンプトのハッシュ値）
+_client_lock: threading.Lock = threading.Lock()            # クライアント生成排他ロック
 
 
 class GenerativeAIResponse:
     """生成AIからのレスポンスを格納するクラス"""
-    def __init__(self, content: str = '', error_msg: str = '') -> None:
+    def __init__(self, content: str = '', error_msg: str = '', finish_reason: str = '') -> None:
         """
         GenerativeAIResponseコンストラクタ
 
         Args:
             content (str): 生成AIからの応答内容
             error_msg (str): エラーメッセージ
+            finish_reason (str): 応答の終了理由（'stop' 以外は max_tokens 到達などで途中終了）
 
         Returns:
             None
         """
         self.content: str = content
         self.error_msg: str = error_msg
+        self.finish_reason: str = finish_reason
 
 
-def init() -> None:
+def init(cache_path: Path | None = None, timeout_sec: float = 60.0) -> None:
     """
     生成AIクライアントの初期化
 
+    - クライアント（接続プール）はプロセス内で1つだけ生成し、2回目以降の呼び出しでは再利用する
+
     Args:
-        None
+        cache_path (Path | None): 応答キャッシュの保存先ファイルパス（None の場合は保存しない）
+        timeout_sec (float): リクエストのタイムアウト(秒)
 
     Returns:
         None
     """
     global client
+    global _response_cache_path
+
+    with _client_lock:
+        if client is None:
+            # .envファイルの内容を環境変数として読み込む
+            load_dotenv()
+
+            # 環境変数から値を取得
+            AZURE_ENDPOINT = os.getenv("AZURE_ENDPOINT")
+            AZURE_API_KEY = os.getenv("AZURE_API_KEY")
+
+            client = AzureOpenAI(
+                api_version="2024-12-01-preview",
+                azure_endpoint=AZURE_ENDPOINT,
+                api_key=AZURE_API_KEY,
+                timeout=timeout_sec,
+                max_retries=0,      # リトライは _create_chat_completion で制御する
+            )
+
+    # 応答キャッシュ読み込み
+    _response_cache_path = cache_path
+    _load_response_cache()
+
+    log.info("GENERATIVE AI INITIALIZED")
 
-    # .envファイルの内容を環境変数として読み込む
-    load_dotenv()
 
-    # 環境変数から値を取得
-    AZURE_ENDPOINT = os.getenv("AZURE_ENDPOINT")
-    AZURE_API_KEY = os.getenv("AZURE_API_KEY")
+def delete() -> None:
+    """
+    生成AIモジュールの終了処理（応答キャッシュを保存する）
 
-    client = AzureOpenAI(
-        api_version="2024-12-01-preview",
-        azure_endpoint=AZURE_ENDPOINT,
-        api_key=AZURE_API_KEY,
-    )
+    Args:
+        None
 
-    log_mod.info("GENERATIVE AI INITIALIZED")
+    Returns:
+        None
+    """
+    _save_response_cache()
+    log.info("GENERATIVE AI DELETED")
 
 
 def request_generative_ai(
         *,
         system_prompt: str = 'あなたは有能なアシスタントです。',
-        user_prompt: str = ''
+        user_prompt: str = '',
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        temperature: float = DEFAULT_TEMPERATURE,
+        cache: bool = True
 ) -> GenerativeAIResponse:
     """
     生成AIにリクエストを送信する
 
+    - 同一プロンプト・同一パラメータの応答はキャッシュから返す
+    - 同一プロンプトのリクエストが実行中の場合は、その結果を共有する
+    - 最後まで生成された応答（finish_reason が 'stop'）のみキャッシュする
+
     Args:
         system_prompt (str): システムプロンプト
         user_prompt (str): ユーザープロンプト
+        max_tokens (int): 応答の最大トークン数
+        temperature (float): 応答の温度（分類など決定的な応答が必要な場合は 0.0）
+        cache (bool): 応答をキャッシュするか
+            （False の場合、呼び出し側で内容を検証してから cache_response で登録する）
+
+    Returns:
+        GenerativeAIResponse: 生成AIからのレスポンスを格納(クラス)
+    """
+    if log.is_debug_enabled():
+        log.debug('SYSTEM PROMPT: ' + system_prompt)
+        log.debug('USER PROMPT: ' + user_prompt)
+
+    cache_key: str = _make_cache_key(system_prompt, user_prompt, max_tokens, temperature)
+    cached_content, inflight = _acquire_request(cache_key)
+
+    # キャッシュヒット、または実行中の同一リクエストの結果を共有
+    if cached_content is not None:
+        return GenerativeAIResponse(content=cached_content, finish_reason='stop')
+
+    response: GenerativeAIResponse = GenerativeAIResponse()
+    try:
+        messages: list[dict[str, str]] = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
+        response = _request_chat_completion(messages, max_tokens=max_tokens, temperature=temperature)
+
+        if cache and response.content and _is_complete_response(response.finish_reason):
+            _put_cached_response(cache_key, response.content)
+
+    finally:
+        # 途中で打ち切られた応答は待機中の呼び出し元へ共有しない
+        _release_request(
+            cache_key,
+            inflight,
+            response.content if _is_complete_response(response.finish_reason) else '',
+        )
+
+    return response
+
+
+def stream_generative_ai(
+        *,
+        system_prompt: str = 'あなたは有能なアシスタントです。',
+        user_prompt: str = '',
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        temperature: float = DEFAULT_TEMPERATURE,
+        cache: bool = True
+) -> Iterator[str]:
+    """
+    生成AIにストリーミングでリクエストを送信し、応答の断片を受信した順に返す
+
+    - キャッシュヒット時、または実行中の同一リクエストの結果を共有した場合は応答全体を1回で返す
+    - 最後まで生成された応答（finish_reason が 'stop'）のみキャッシュする（request_generative_ai と共通）
+
+    Args:
+        system_prompt (str): システムプロンプト
+        user_prompt (str): ユーザープロンプト
+        max_tokens (int): 応答の最大トークン数
+        temperature (float): 応答の温度（分類など決定的な応答が必要な場合は 0.0）
+        cache (bool): 応答をキャッシュするか
+            （False の場合、呼び出し側で内容を検証してから cache_response で登録する）
+
+    Returns:
+        Iterator[str]: 応答内容の断片
+
+    Raises:
+        APIError: リトライ対象外のエラー、または最大試行回数に達した場合
+        ValueError: 応答が空の場合、または最後まで生成されなかった場合
+    """
+    if log.is_debug_enabled():
+        log.debug('SYSTEM PROMPT: ' + system_prompt)
+        log.debug('USER PROMPT: ' + user_prompt)
+
+    cache_key: str = _make_cache_key(system_prompt, user_prompt, max_tokens, temperature)
+    cached_content, inflight = _acquire_request(cache_key)
+
+    # キャッシュヒット、または実行中の同一リクエストの結果を共有
+    if cached_content is not None:
+        yield cached_content
+        return
+
+    parts: list[str] = []
+    content: str = ''
+    finish_reason: str = ''
+    try:
+        messages: list[dict[str, str]] = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
+        log.info('REQUEST TO GENERATIVE AI (STREAM)')
+        stream = _create_chat_completion(messages, max_tokens=max_tokens, temperature=temperature, stream=True)
+
+        for chunk in stream:
+            # Azure では choices が空のチャンク（コンテンツフィルタ結果）が届く場合がある
+            if not chunk.choices:
+                continue
+            choice = chunk.choices[0]
+            delta: str | None = choice.delta.content
+            if delta:
+                parts.append(delta)
+                yield delta
+            if choice.finish_reason:
+                finish_reason = choice.finish_reason
+
+        content = ''.join(parts)
+        if content.strip() == '':
+            log.error('EMPTY RESPONSE FROM GENERATIVE AI')
+            content = ''
+            raise ValueError('EMPTY_RESPONSE_FROM_GENERATIVE_AI')
+
+        log.info('RECEIVED RESPONSE FROM GENERATIVE AI')
+        if log.is_debug_enabled():
+            log.debug('AI RESPONSE CONTENT: ' + content)
+
+        # 途中で打ち切られた応答は不完全なため、キャッシュせずエラーとする
+        if not _is_complete_response(finish_reason):
+            content = ''
+            raise ValueError(f'INCOMPLETE_RESPONSE_FROM_GENERATIVE_AI (finish_reason={finish_reason})')
+
+        if cache:
+            _put_cached_response(cache_key, content)
+
+    finally:
+        _release_request(cache_key, inflight, content)
+
+
+def cache_response(
+        *,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
+        temperature: float,
+        content: str
+) -> None:
+    """
+    検証済みの応答内容をキャッシュに登録する（cache=False でリクエストした応答用）
+
+    Args:
+        system_prompt (str): システムプロンプト
+        user_prompt (str): ユーザープロンプト
+        max_tokens (int): 応答の最大トークン数
+        temperature (float): 応答の温度
+        content (str): 応答内容
+
+    Returns:
+        None
+    """
+    if not content:
+        return
+    _put_cached_response(_make_cache_key(system_prompt, user_prompt, max_tokens, temperature), content)
+
+
+def iter_json_objects(chunks: Iterable[str], *, depth: int = 2) -> Iterator[str]:
+    """
+    JSON 文字列の断片から、指定した深さのオブジェクトを完成した順に文字列で返す
+
+    - 括弧の対応のみで区切るため、全体の受信完了を待たずに要素を取り出せる
+    - 深さは外側の {} / [] の数（{"items": [{...}, ...]} の各要素は 2）
+    - 指定した深さ以外の内容・JSON 外のテキストは読み飛ばす
+
+    Args:
+        chunks (Iterable[str]): JSON 文字列の断片
+        depth (int): 取り出すオブジェクトの深さ
+
+    Returns:
+        Iterator[str]: オブジェクト1件分の JSON 文字列
+    """
+    level: int = 0
+    in_string: bool = False
+    escaped: bool = False
+    buf: list[str] = []
+
+    for chunk in chunks:
+        start: int | None = 0 if buf else None
+        for i, ch in enumerate(chunk):
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif ch == '\\':
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+                continue
+
+            if ch == '"':
+                in_string = True
+            elif ch in '{[':
+                if ch == '{' and level == depth and start is None:
+                    start = i
+                level += 1
+            elif ch in '}]':
+                level -= 1
+                if ch == '}' and level == depth and start is not None:
+                    buf.append(chunk[start:i + 1])
+                    yield ''.join(buf)
+                    buf.clear()
+                    start = None
+
+        if start is not None:
+            buf.append(chunk[start:])
+
+
+def _request_chat_completion(
+        messages: list[dict[str, str]],
+        *,
+        max_tokens: int,
+        temperature: float
+) -> GenerativeAIResponse:
+    """
+    生成AIのチャット補完APIを呼び出す
+
+    Args:
+        messages (list[dict[str, str]]): 送信するメッセージリスト
+        max_tokens (int): 応答の最大トークン数
+        temperature (float): 応答の温度
 
     Returns:
         GenerativeAIResponse: 生成AIからのレスポンスを格納(クラス)
@@ -80,51 +358,303 @@ def request_generative_ai(
     global model
 
     response: GenerativeAIResponse = GenerativeAIResponse()
-    log_mod.debug('SYSTEM PROMPT: ' + system_prompt)
-    log_mod.debug('USER PROMPT: ' + user_prompt)
-    messages: list[dict[str, str]] = [
-        {"role": "system", "content": system_prompt},
-        {"role": "user", "content": user_prompt}
-    ]
 
     try:
-        log_mod.info('REQUEST TO GENERATIVE AI')
+        log.info('REQUEST TO GENERATIVE AI')
         start_time: float = time.perf_counter()
-        result = client.chat.completions.create(
-            model=model,
-            messages=messages,
-            max_tokens=1024,
-            temperature=0.7,
-        )
+        result = _create_chat_completion(messages, max_tokens=max_tokens, temperature=temperature)
 
         ai_content: str = result.choices[0].message.content
+        response.finish_reason = result.choices[0].finish_reason or ''
 
         if not ai_content:
-            log_mod.error('EMPTY RESPONSE FROM GENERATIVE AI')
+            log.error('EMPTY RESPONSE FROM GENERATIVE AI')
             response.error_msg = 'EMPTY_RESPONSE_FROM_GENERATIVE_AI'
         elif ai_content.strip() == '':
-            log_mod.error('BLANK RESPONSE FROM GENERATIVE AI')
+            log.error('BLANK RESPONSE FROM GENERATIVE AI')
             response.error_msg = 'BLANK_RESPONSE_FROM_GENERATIVE_AI'
         else:
-            log_mod.info('RECEIVED RESPONSE FROM GENERATIVE AI')
+            log.info('RECEIVED RESPONSE FROM GENERATIVE AI')
             response.content = ai_content
-            log_mod.debug('AI RESPONSE CONTENT: ' + ai_content)
-            end_time: float = time.perf_counter()
-            log_mod.debug(f'Time to receive response from Generative AI: {end_time - start_time} seconds.')
+            if not _is_complete_response(response.finish_reason):
+                log.error(f'INCOMPLETE RESPONSE FROM GENERATIVE AI (finish_reason={response.finish_reason})')
+            if log.is_debug_enabled():
+                log.debug('AI RESPONSE CONTENT: ' + ai_content)
+                end_time: float = time.perf_counter()
+                log.debug(f'Time to receive response from Generative AI: {end_time - start_time} seconds.')
 
     except APITimeoutError as e:
-        log_mod.info('API TIMEOUT ERROR')
-        log_mod.error('error message:', str(e))
+        log.info('API TIMEOUT ERROR')
+        log.error(f'error message: {e}')
         response.error_msg = 'API_TIMEOUT_ERROR'
 
     except APIError as e:
-        log_mod.info('API ERROR')
-        log_mod.error('error message:', str(e))
+        log.info('API ERROR')
+        log.error(f'error message: {e}')
         response.error_msg = 'API_ERROR'
 
     except Exception as e:
-        log_mod.info('UNEXPECTED ERROR')
-        log_mod.error('error message:', str(e))
+        log.info('UNEXPECTED ERROR')
+        log.error(f'error message: {e}')
         response.error_msg = 'UNEXPECTED_ERROR'
 
     return response
+
+
+def _create_chat_completion(
+        messages: list[dict[str, str]],
+        *,
+        max_tokens: int,
+        temperature: float,
+        stream: bool = False
+):
+    """
+    チャット補完APIを呼び出す（一時的なエラーは指数バックオフでリトライ）
+
+    - stream=True の場合、リトライ対象は接続確立（応答開始）までとする
+
+    Args:
+        messages (list[dict[str, str]]): 送信するメッセージリスト
+        max_tokens (int): 応答の最大トークン数
+        temperature (float): 応答の温度
+        stream (bool): ストリーミングで受信するか
+
+    Returns:
+        ChatCompletion | Stream[ChatCompletionChunk]: APIの応答
+
+    Raises:
+        APIError: リトライ対象外のエラー、または最大試行回数に達した場合
+    """
+    global client
+    global model
+
+    for attempt in range(retry_util.REQUEST_MAX_ATTEMPTS):
+        try:
+            return client.chat.completions.create(
+                model=model,
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                stream=stream,
+            )
+        except APIError as e:
+            if attempt + 1 >= retry_util.REQUEST_MAX_ATTEMPTS or not _is_retryable_error(e):
+                raise
+
+            delay: float = retry_util.retry_delay(e, attempt)
+            log.info(f'RETRY GENERATIVE AI REQUEST ({attempt + 1}/{retry_util.REQUEST_MAX_ATTEMPTS - 1}) AFTER {delay:.2f} sec: ({e})')
+            time.sleep(delay)
+
+
+def _is_retryable_error(e: APIError) -> bool:
+    """
+    リトライ対象のエラーか判定する
+
+    Args:
+        e (APIError): 発生したエラー
+
+    Returns:
+        bool: タイムアウト・接続エラー、またはリトライ対象のHTTPステータスの場合 True
+    """
+    if isinstance(e, (APITimeoutError, APIConnectionError)):
+        return True
+    return getattr(e, 'status_code', None) in retry_util.RETRYABLE_STATUS_CODES
+
+
+# ==================================================
+# 応答キャッシュ
+# ==================================================
+def _make_cache_key(system_prompt: str, user_prompt: str, max_tokens: int, temperature: float) -> str:
+    """
+    プロンプトとリクエストパラメータから応答キャッシュのキーを生成する
+
+    Args:
+        system_prompt (str): システムプロンプト
+        user_prompt (str): ユーザープロンプト
+        max_tokens (int): 応答の最大トークン数
+        temperature (float): 応答の温度
+
+    Returns:
+        str: キャッシュキー（SHA-256 の16進文字列）
+    """
+    text: str = f'{max_tokens}\x00{temperature}\x00' + system_prompt + '\x00' + user_prompt
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _reserve_request(key: str) -> tuple[str | None, Future, bool]:
+    """
+    応答キャッシュを参照し、未登録の場合は実行中リクエストとして予約する
+
+    Args:
+        key (str): キャッシュキー
+
+    Returns:
+        tuple[str | None, Future, bool]:
+            (キャッシュ済みの応答内容 or None, 実行中リクエストの Future, 自身がリクエストを実行するか)
+    """
+    with _response_cache_lock:
+        content: str | None = _response_cache.get(key)
+        if content is not None:
+            _response_cache.move_to_end(key)
+            return content, None, False
+
+        inflight: Future | None = _inflight_requests.get(key)
+        if inflight is not None:
+            return None, inflight, False
+
+        inflight = Future()
+        _inflight_requests[key] = inflight
+        return None, inflight, True
+
+
+def _acquire_request(key: str) -> tuple[str | None, Future | None]:
+    """
+    応答キャッシュ・実行中リクエストの結果を取得し、無い場合は自身が実行するリクエストとして予約する
+
+    - 同一プロンプトのリクエストが実行中の場合は、その結果を待つ
+    - 先行リクエストが失敗した場合は再度予約を試み、後続の待機者のうち1件のみがリクエストする
+
+    Args:
+        key (str): キャッシュキー
+
+    Returns:
+        tuple[str | None, Future | None]:
+            (キャッシュ済み・共有された応答内容 or None, 自身が実行するリクエストの Future or None)
+            応答内容が None の場合、呼び出し元はリクエスト後に必ず _release_request を呼び出すこと
+    """
+    while True:
+        cached_content, inflight, is_owner = _reserve_request(key)
+
+        # キャッシュヒット
+        if cached_content is not None:
+            log.info('GENERATIVE AI CACHE HIT')
+            return cached_content, None
+
+        if is_owner:
+            return None, inflight
+
+        # 同一プロンプトのリクエストが実行中の場合は、その結果を待つ
+        log.info('WAIT FOR IN-FLIGHT GENERATIVE AI REQUEST')
+        shared_content: str = inflight.result()
+        if shared_content:
+            return shared_content, None
+        # 先行リクエストが失敗した場合は再度予約する
+
+
+def _release_request(key: str, inflight: Future, content: str) -> None:
+    """
+    実行中リクエストの予約を解除し、待機中の呼び出し元へ結果を通知する
+
+    Args:
+        key (str): キャッシュキー
+        inflight (Future): 実行中リクエストの Future
+        content (str): 応答内容（失敗時・途中で打ち切られた場合は空文字）
+
+    Returns:
+        None
+    """
+    with _response_cache_lock:
+        _inflight_requests.pop(key, None)
+    inflight.set_result(content)
+
+
+def _put_cached_response(key: str, content: str) -> None:
+    """
+    応答キャッシュに内容を登録する（上限超過時は古いものから破棄）
+
+    Args:
+        key (str): キャッシュキー
+        content (str): 応答内容
+
+    Returns:
+        None
+    """
+    with _response_cache_lock:
+        _response_cache[key] = content
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > RESPONSE_CACHE_MAX_ENTRIES:
+            _response_cache.popitem(last=False)
+
+
+def _is_complete_response(finish_reason: str) -> bool:
+    """
+    応答が最後まで生成されたか判定する
+
+    Args:
+        finish_reason (str): 応答の終了理由
+
+    Returns:
+        bool: finish_reason が 'stop' の場合 True（'length' / 'content_filter' などは途中終了）
+    """
+    return finish_reason == 'stop'
+
+
+def _load_response_cache() -> None:
+    """
+    応答キャッシュをファイルから読み込む
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    if _response_cache_path is None or not _response_cache_path.exists():
+        return
+
+    try:
+        with _response_cache_path.open('r', encoding='utf-8') as f:
+            data: dict[str, str] = json.load(f)
+    except (OSError, ValueError) as e:
+        log.error(f'FAILED TO LOAD GENERATIVE AI CACHE: ({e})')
+        return
+
+    with _response_cache_lock:
+        _response_cache.clear()
+        _response_cache.update(data)
+        while len(_response_cache) > RESPONSE_CACHE_MAX_ENTRIES:
+            _response_cache.popitem(last=False)
+
+    log.info(f'GENERATIVE AI CACHE LOADED: {len(_response_cache)} ENTRIES')
+
+
+def _save_response_cache() -> None:
+    """
+    応答キャッシュをファイルへ保存する
+
+    - 同じディレクトリの一時ファイルへ書き込んでから os.replace で置き換える
+    - 保存中のクラッシュ・同時書き込みで保存先ファイルが途中までの内容にならないようにするため
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    if _response_cache_path is None:
+        return
+
+    tmp_path: Path | None = None
+    try:
+        _response_cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with _response_cache_lock:
+            data: dict[str, str] = dict(_response_cache)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=_response_cache_path.parent,
+            prefix=_response_cache_path.name + '.',
+            suffix='.tmp',
+        )
+        tmp_path = Path(tmp_name)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, _response_cache_path)
+    except OSError as e:
+        log.error(f'FAILED TO SAVE GENERATIVE AI CACHE: ({e})')
+        if tmp_path is not None:
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+        return
+
+    log.info(f'GENERATIVE AI CACHE SAVED: {len(data)} ENTRIES')
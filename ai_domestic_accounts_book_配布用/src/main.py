@@ -5,9 +5,12 @@
 """
 from __future__ import annotations
 
+import asyncio
 import json
-import re
+import os
+import shutil
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from datetime import date
 from pathlib import Path
@@ -17,6 +20,9 @@ from .receipt import receipt_manager
 from .receipt import type_def
 from .notify import monthly_mailer
 
+# モジュール用ロガー（呼び出し元ファイル名を保持）
+log = log_mod.get_logger(__file__)
+
 
 # ==================================================
 # 定数定義
@@ -32,8 +38,10 @@ OUTPUT_CSV_DIR: Path = OUTPUT_DIR / "csv"                               # CSV出
 PROCESSED_DIR: Path = DATA_DIR / "processed"                            # 処理済みディレクトリ
 ERROR_DIR: Path = DATA_DIR / "error"                                    # エラーディレクトリ
 OUTPUT_SUMMARY_DIR: Path = OUTPUT_DIR / "summary"                       # サマリー出力ディレクトリ
-# レシート画像拡張子
-RECEIPT_IMAGE_EXTS: tuple[str, ...] = (
+LLM_CACHE_PATH: Path = DATA_DIR / "cache" / "llm_cache.json"            # 生成AI応答キャッシュファイルパス
+LEDGER_DB_PATH: Path = DATA_DIR / "ledger.sqlite"                       # 処理済みレシート台帳ファイルパス
+# レシート画像拡張子（小文字・ドット付き。判定は set の所属判定で行う）
+RECEIPT_IMAGE_EXTS: frozenset[str] = frozenset({
     ".jpg",
     ".jpeg",
     ".png",
@@ -43,9 +51,11 @@ RECEIPT_IMAGE_EXTS: tuple[str, ...] = (
     ".pdf",
     ".heic",
     ".heif",
-)
-INVALID_FILENAME_CHARS: re.Pattern[str] = re.compile(r'[\\/:*?"<>|]+')                                                      # ファイル名使用不可文字パターン
+})
+CLOUD_COPY_BUFFER_SIZE: int = 1024 * 1024                                                                                   # cloud 取り込み時のコピーバッファサイズ(byte)
+INVALID_FILENAME_TABLE: dict[int, str] = str.maketrans(dict.fromkeys('\\/:*?"<>|', "_"))                                    # ファイル名使用不可文字の置換テーブル
 RECEIPT_TAGS_PROMPT_PATH: Path = CURRENT_PATH / "prompt" / "receipt_tags_prompt_english.md"                                 # レシート画像のタグ判断用プロンプトファイルパス
+RECEIPT_TAGS_BATCH_PROMPT_PATH: Path = CURRENT_PATH / "prompt" / "receipt_tags_batch_prompt_english.md"                     # 複数レシートのタグ判断用プロンプトファイルパス
 MONTHLY_EXPENSE_SUMMARY_PROMPT_PATH: Path = CURRENT_PATH / "prompt" / "monthly_expense_summary_prompt_english.md"           # 月次支出サマリの出力用プロンプトファイルパス(英語版)
 # ==================================================
 # グローバル変数
@@ -53,8 +63,18 @@ MONTHLY_EXPENSE_SUMMARY_PROMPT_PATH: Path = CURRENT_PATH / "prompt" / "monthly_e
 app_config: dict[str, Any] = {}                                         # アプリ設定データ
 rcpt_mgr: receipt_manager.ReceiptManager | None = None                  # レシートマネージャ
 receipt_tags_prompt: str = ""                                           # レシート画像のタグ判断用プロンプト
+receipt_tags_batch_prompt: str = ""                                     # 複数レシートのタグ判断用プロンプト
 monthly_expense_summary_prompt: str = ""                                # 月次支出サマリの出力用プロンプト
 mailer: monthly_mailer.MonthlyMailer | None = None                      # 月次メール送信クラス
+# 以下は init() で app_config から展開する設定値
+enable_cloud_import: bool = False                                       # cloud からのレシート取り込み有無
+cloud_inbox_dir: Path | None = None                                     # cloud 取り込み元ディレクトリ
+cloud_processed_dir: Path | None = None                                 # cloud 処理済みディレクトリ
+cloud_error_dir: Path | None = None                                     # cloud エラーディレクトリ
+receipt_max_concurrency: int = 1                                        # レシート処理の最大同時実行数
+receipt_tagging_batch_size: int = 1                                     # AIタグ判定を1回にまとめるレシート件数
+mail_enable_send: bool = False                                          # 月次メール送信有無
+mail_send_day: int = 0                                                  # 月次メール送信日
 
 
 def init() -> None:
@@ -70,12 +90,31 @@ def init() -> None:
     global app_config
     global rcpt_mgr
     global receipt_tags_prompt
+    global receipt_tags_batch_prompt
     global monthly_expense_summary_prompt
     global mailer
+    global enable_cloud_import
+    global cloud_inbox_dir
+    global cloud_processed_dir
+    global cloud_error_dir
+    global receipt_max_concurrency
+    global receipt_tagging_batch_size
+    global mail_enable_send
+    global mail_send_day
 
     install_config()
     load_system_prompt()
 
+    # 処理中に参照する設定値を展開
+    enable_cloud_import = app_config["CLOUD_SYNC"]["ENABLE_CLOUD_RECEIPT_IMPORT"]
+    cloud_inbox_dir = Path(app_config["CLOUD_SYNC"]["CLOUD_INBOX_PATH"])
+    cloud_processed_dir = Path(app_config["CLOUD_SYNC"]["CLOUD_PROCESSED_PATH"])
+    cloud_error_dir = Path(app_config["CLOUD_SYNC"]["CLOUD_ERROR_PATH"])
+    receipt_max_concurrency = max(1, app_config["RECEIPT_PROCESS"]["MAX_CONCURRENCY"])
+    receipt_tagging_batch_size = max(1, app_config["RECEIPT_PROCESS"]["TAGGING_BATCH_SIZE"])
+    mail_enable_send = app_config["MAIL"]["ENABLE_SEND"]
+    mail_send_day = app_config["MAIL"]["MONTHLY_REPORT_SEND_DAY"]
+
     log_mod.init(
         enable_console=app_config["LOG_CONFIG"]["ENABLE_OUTPUT_CONSOLE"],
         console_level=app_config["LOG_CONFIG"]["OUTPUT_CONSOLE_LEVEL"],
@@ -83,7 +122,26 @@ def init() -> None:
         file_level=app_config["LOG_CONFIG"]["FILE_SAVE_LEVEL"],
         log_dir=app_config["LOG_CONFIG"]["FILE_SAVE_PATH"],
     )
-    log_mod.info("APP START")
+    log.info("APP START")
+
+    # 出力先ディレクトリ作成（処理中に毎回作成しないよう、ここで一括作成する）
+    for dir_path in (
+        INPUT_DIR,
+        OUTPUT_JSON_DIR,
+        OUTPUT_CSV_DIR,
+        PROCESSED_DIR,
+        ERROR_DIR,
+        OUTPUT_SUMMARY_DIR,
+        OUTPUT_DIR / "graph",
+    ):
+        dir_path.mkdir(parents=True, exist_ok=True)
+
+    if enable_cloud_import:
+        try:
+            cloud_processed_dir.mkdir(parents=True, exist_ok=True)
+            cloud_error_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            log.error(f"CLOUD DIR CREATE FAILED: ({e})")
 
     # receipt_manager 初期化
     rcpt_mgr = receipt_manager.ReceiptManager(
@@ -92,6 +150,12 @@ def init() -> None:
         receipt_image_exts=RECEIPT_IMAGE_EXTS,
         receipt_tags_prompt=receipt_tags_prompt,
         monthly_expense_summary_prompt=monthly_expense_summary_prompt,
+        receipt_tags_batch_prompt=receipt_tags_batch_prompt,
+        llm_cache_path=LLM_CACHE_PATH,
+        generative_ai_timeout_sec=app_config["AZURE_REQUEST"]["GENERATIVE_AI_TIMEOUT_SEC"],
+        receipt_ai_connection_timeout_sec=app_config["AZURE_REQUEST"]["RECEIPT_AI_CONNECTION_TIMEOUT_SEC"],
+        receipt_ai_read_timeout_sec=app_config["AZURE_REQUEST"]["RECEIPT_AI_READ_TIMEOUT_SEC"],
+        ledger_path=LEDGER_DB_PATH,
     )
 
     # 月次メール送信クラス初期化
@@ -99,7 +163,7 @@ def init() -> None:
 
     # レシート画像が1件もない場合は警告ログを出す
     if not rcpt_mgr.get_receipt_images():
-        log_mod.info("NO RECEIPT IMAGES IN INPUT DIR")
+        log.info("NO RECEIPT IMAGES IN INPUT DIR")
 
 
 def delete() -> None:
@@ -112,7 +176,12 @@ def delete() -> None:
     Returns:
         None
     """
-    log_mod.info("APP DELETE")
+    global rcpt_mgr
+
+    if rcpt_mgr is not None:
+        rcpt_mgr.close()
+
+    log.info("APP DELETE")
     log_mod.delete()
 
 
@@ -133,11 +202,10 @@ def main() -> None:
     Returns:
         None
     """
-    global app_config
     global rcpt_mgr
     global mailer
 
-    log_mod.info("APP MAIN START")
+    log.info("APP MAIN START")
     start_time: float = time.perf_counter()
 
     # local src → cloud src 対応表
@@ -147,24 +215,20 @@ def main() -> None:
         # ==================================================
         # cloud → input 取り込み
         # ==================================================
-        if app_config["CLOUD_SYNC"]["ENABLE_CLOUD_RECEIPT_IMPORT"]:
-            cloud_inbox = Path(app_config["CLOUD_SYNC"]["CLOUD_INBOX_PATH"])
-            cloud_error = Path(app_config["CLOUD_SYNC"]["CLOUD_ERROR_PATH"])
-
-            for cloud_src in cloud_inbox.iterdir():
-                if not cloud_src.is_file():
-                    continue
+        if enable_cloud_import:
+            # DirEntry の種別情報を使い、ファイルごとの stat（cloud 上では通信が発生）を省く
+            with os.scandir(cloud_inbox_dir) as it:
+                cloud_srcs: list[Path] = [Path(entry.path) for entry in it if entry.is_file()]
 
+            for cloud_src in cloud_srcs:
                 local_dst = INPUT_DIR / cloud_src.name
                 try:
-                    local_dst.parent.mkdir(parents=True, exist_ok=True)
-                    local_dst.write_bytes(cloud_src.read_bytes())
+                    _copy_from_cloud(cloud_src, local_dst)
                     cloud_src_map[local_dst] = cloud_src
                 except Exception as e:
-                    log_mod.error(f"CLOUD COPY FAILED: {cloud_src.name} ({e})")
+                    log.error(f"CLOUD COPY FAILED: {cloud_src.name} ({e})")
                     try:
-                        cloud_error.mkdir(parents=True, exist_ok=True)
-                        cloud_src.replace(cloud_error / cloud_src.name)
+                        cloud_src.replace(cloud_error_dir / cloud_src.name)
                     except Exception:
                         pass
 
@@ -174,54 +238,19 @@ def main() -> None:
         rcpt_mgr.reload_receipt_images()
 
         # ==================================================
-        # レシート処理
+        # レシート処理（並列）
         # ==================================================
-        for src in rcpt_mgr.get_receipt_images():
-            proc: type_def.ReceiptProcessResult = rcpt_mgr.process_receipt(
-                src=src,
-                invalid_filename_chars=INVALID_FILENAME_CHARS,
-                output_json_dir=OUTPUT_JSON_DIR,
-                output_csv_dir=OUTPUT_CSV_DIR,
-                processed_dir=PROCESSED_DIR,
-                error_dir=ERROR_DIR,
+        asyncio.run(
+            run_receipt_tasks(
+                srcs=rcpt_mgr.get_receipt_images(),
+                cloud_src_map=cloud_src_map,
+                max_concurrency=receipt_max_concurrency,
+                batch_size=receipt_tagging_batch_size,
             )
-
-            # cloud src 取得
-            cloud_src: Path | None = cloud_src_map.get(src)
-
-            # ------------------------------
-            # cloud 側移動
-            # ------------------------------
-            if cloud_src:
-                try:
-                    if proc.ok:
-                        cloud_processed = Path(
-                            app_config["CLOUD_SYNC"]["CLOUD_PROCESSED_PATH"]
-                        )
-                        cloud_processed.mkdir(parents=True, exist_ok=True)
-                        cloud_src.replace(cloud_processed / cloud_src.name)
-                        log_mod.info(f"CLOUD MOVE TO PROCESSED: {cloud_src.name}")
-                    else:
-                        cloud_error = Path(
-                            app_config["CLOUD_SYNC"]["CLOUD_ERROR_PATH"]
-                        )
-                        cloud_error.mkdir(parents=True, exist_ok=True)
-                        cloud_src.replace(cloud_error / cloud_src.name)
-                        log_mod.info(f"CLOUD MOVE TO ERROR: {cloud_src.name}")
-                except Exception as e:
-                    log_mod.error(
-                        f"CLOUD MOVE FAILED: {cloud_src.name} ({e})"
-                    )
-
-            if proc.ok:
-                log_mod.info(f"RECEIPT PROCESS SUCCESS: {src.name}")
-            else:
-                log_mod.error(
-                    f"RECEIPT PROCESS FAILED: {src.name} ({proc.error_reason})"
-                )
+        )
 
     except KeyboardInterrupt:
-        log_mod.info("APP INTERRUPTED BY USER")
+        log.info("APP INTERRUPTED BY USER")
 
     finally:
         try:
@@ -233,70 +262,85 @@ def main() -> None:
             )
 
             # ------------------------------
-            # 月次グラフ生成
+            # 月次AIサマリ生成＋月次グラフ生成（並列）
             # ------------------------------
-            for year, month in existing_year_months:
-                # 月次グラフ生成
-                rcpt_mgr.generate_monthly_graph(
-                    year=year,
-                    month=month,
-                    output_csv_dir=OUTPUT_CSV_DIR,
-                    output_graph_dir=OUTPUT_DIR / "graph",
-                )
-
-                # 月次AIサマリ生成
-                rcpt_mgr.generate_monthly_ai_summary(
-                    year=year,
-                    month=month,
-                    output_csv_dir=OUTPUT_CSV_DIR,
-                    output_summary_dir=OUTPUT_SUMMARY_DIR
-                )
+            # サマリ生成は生成AIの応答待ちが支配的なため、月ごとに並列で実行する
+            # （グラフ生成は Figure を個別に生成するためスレッドセーフであり、同じく並列で実行する）
+            with ThreadPoolExecutor(
+                max_workers=receipt_max_concurrency
+            ) as executor:
+                futures = {}    # {Future: (年, 月, 処理名)}
+                for year, month in existing_year_months:
+                    futures[executor.submit(
+                        rcpt_mgr.generate_monthly_ai_summary,
+                        year=year,
+                        month=month,
+                        output_csv_dir=OUTPUT_CSV_DIR,
+                        output_summary_dir=OUTPUT_SUMMARY_DIR,
+                    )] = (year, month, "MONTHLY AI SUMMARY")
+                    futures[executor.submit(
+                        rcpt_mgr.generate_monthly_graph,
+                        year=year,
+                        month=month,
+                        output_csv_dir=OUTPUT_CSV_DIR,
+                        output_graph_dir=OUTPUT_DIR / "graph",
+                    )] = (year, month, "MONTHLY GRAPH")
+
+                # 完了待ち（1件の失敗で他の月・メール送信・年次グラフ生成を止めない）
+                for future, (year, month, job_name) in futures.items():
+                    try:
+                        future.result()
+                    except Exception as e:
+                        log.error(f"{job_name} FAILED: {year}-{month:02d} ({e})")
 
             # ------------------------------
             # 月次メール送信
             # ------------------------------
-            if app_config["MAIL"]["ENABLE_SEND"]:
-                today: date = date.today()    # 今日の日付取得
-
-                # 指定日に当月分を送信
-                if today.day == app_config["MAIL"]["MONTHLY_REPORT_SEND_DAY"]:
-                    year = today.year
-                    month = today.month
-
-                    summary_path = (
-                        OUTPUT_SUMMARY_DIR
-                        / str(year)
-                        / f"{year}{month:02d}_summary.txt"
-                    )
-                    graph_path = (
-                        OUTPUT_DIR
-                        / "graph"
-                        / str(year)
-                        / f"{year}{month:02d}_graph.png"
-                    )
-
-                    if summary_path.exists() and graph_path.exists():
-                        summary_text = summary_path.read_text(
-                            encoding="utf-8"
-                        )
-
-                        mailer.send_monthly_report(
-                            year=year,
-                            month=month,
-                            summary_text=summary_text,
-                            graph_paths=[graph_path],
-                        )
-                        log_mod.debug(
-                            f"MONTHLY MAIL SENT: {year}-{month:02d}"
-                        )
-                        log_mod.debug(
-                            f"MONTHLY SUMMARY: {summary_text}"
+            if mail_enable_send:
+                # with ブロック内では SMTP 接続を使い回す
+                with mailer:
+                    today: date = date.today()    # 今日の日付取得
+
+                    # 指定日に当月分を送信
+                    if today.day == mail_send_day:
+                        year = today.year
+                        month = today.month
+
+                        summary_path = (
+                            OUTPUT_SUMMARY_DIR
+                            / str(year)
+                            / f"{year}{month:02d}_summary.txt"
                         )
-                    else:
-                        log_mod.error(
-                            f"MONTHLY MAIL FILE NOT FOUND: {year}-{month:02d}"
+                        graph_path = (
+                            OUTPUT_DIR
+                            / "graph"
+                            / str(year)
+                            / f"{year}{month:02d}_graph.png"
                         )
 
+                        if summary_path.exists() and graph_path.exists():
+                            summary_text = summary_path.read_text(
+                                encoding="utf-8"
+                            )
+
+                            mailer.send_monthly_report(
+                                year=year,
+                                month=month,
+                                summary_text=summary_text,
+                                graph_paths=[graph_path],
+                            )
+                            log.debug(
+                                f"MONTHLY MAIL SENT: {year}-{month:02d}"
+                            )
+                            if log.is_debug_enabled():
+                                log.debug(
+                                    f"MONTHLY SUMMARY: {summary_text}"
+                                )
+                        else:
+                            log.error(
+                                f"MONTHLY MAIL FILE NOT FOUND: {year}-{month:02d}"
+                            )
+
             # ------------------------------
             # 年次グラフ生成
             # ------------------------------
@@ -309,10 +353,195 @@ def main() -> None:
                 )
 
         except Exception as e:
-            log_mod.error(f"GRAPH GENERATION FAILED: ({e})")
+            log.error(f"GRAPH GENERATION FAILED: ({e})")
 
         elapsed_time = time.perf_counter() - start_time
-        log_mod.info(f"APP MAIN END (ELAPSED: {elapsed_time:.4f} sec)")
+        log.info(f"APP MAIN END (ELAPSED: {elapsed_time:.4f} sec)")
+
+
+async def run_receipt_tasks(
+    *,
+    srcs: list[Path],
+    cloud_src_map: dict[Path, Path],
+    max_concurrency: int,
+    batch_size: int = 1,
+) -> None:
+    """
+    レシート画像を並列に処理する。
+
+    - Azure への通信待ちが支配的なため、asyncio で同時に処理する
+    - 同時実行数は Semaphore で制限する（Azure のレート制限対策）
+    - batch_size > 1 の場合、batch_size 件ごとに AI タグ判定を1回にまとめる
+
+    Args:
+        srcs (list[Path]): 処理対象のレシート画像ファイルパスリスト
+        cloud_src_map (dict[Path, Path]): local src → cloud src 対応表
+        max_concurrency (int): 最大同時実行数
+        batch_size (int): AIタグ判定を1回にまとめるレシート件数
+
+    Returns:
+        None
+    """
+    sem: asyncio.Semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    if batch_size > 1:
+        groups: list[list[Path]] = [
+            srcs[i:i + batch_size]
+            for i in range(0, len(srcs), batch_size)
+        ]
+        tasks = [
+            process_receipt_batch_task(sem=sem, srcs=group, cloud_src_map=cloud_src_map)
+            for group in groups
+        ]
+        names: list[str] = [", ".join(src.name for src in group) for group in groups]
+    else:
+        tasks = [
+            process_receipt_task(sem=sem, src=src, cloud_src_map=cloud_src_map)
+            for src in srcs
+        ]
+        names = [src.name for src in srcs]
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    for name, r in zip(names, results):
+        if isinstance(r, Exception):
+            log.error(f"RECEIPT TASK FAILED: {name} ({r})")
+
+
+async def process_receipt_task(
+    *,
+    sem: asyncio.Semaphore,
+    src: Path,
+    cloud_src_map: dict[Path, Path],
+) -> None:
+    """
+    レシート1件分の処理と、cloud 側ファイルの移動を行う。
+
+    Args:
+        sem (asyncio.Semaphore): 同時実行数制御用セマフォ
+        src (Path): レシート画像ファイルパス
+        cloud_src_map (dict[Path, Path]): local src → cloud src 対応表
+
+    Returns:
+        None
+    """
+    global rcpt_mgr
+
+    async with sem:
+        proc: type_def.ReceiptProcessResult = await rcpt_mgr.process_receipt_async(
+            src=src,
+            invalid_filename_table=INVALID_FILENAME_TABLE,
+            output_json_dir=OUTPUT_JSON_DIR,
+            output_csv_dir=OUTPUT_CSV_DIR,
+            processed_dir=PROCESSED_DIR,
+            error_dir=ERROR_DIR,
+        )
+
+    finish_receipt(src=src, proc=proc, cloud_src_map=cloud_src_map)
+
+
+async def process_receipt_batch_task(
+    *,
+    sem: asyncio.Semaphore,
+    srcs: list[Path],
+    cloud_src_map: dict[Path, Path],
+) -> None:
+    """
+    複数レシートの処理（AIタグ判定は1回にまとめる）と、cloud 側ファイルの移動を行う。
+
+    Args:
+        sem (asyncio.Semaphore): 同時実行数制御用セマフォ
+        srcs (list[Path]): レシート画像ファイルパス一覧
+        cloud_src_map (dict[Path, Path]): local src → cloud src 対応表
+
+    Returns:
+        None
+    """
+    global rcpt_mgr
+
+    async with sem:
+        procs: list[type_def.ReceiptProcessResult] = await rcpt_mgr.process_receipts_batch_async(
+            srcs,
+            invalid_filename_table=INVALID_FILENAME_TABLE,
+            output_json_dir=OUTPUT_JSON_DIR,
+            output_csv_dir=OUTPUT_CSV_DIR,
+            processed_dir=PROCESSED_DIR,
+            error_dir=ERROR_DIR,
+        )
+
+    for src, proc in zip(srcs, procs):
+        finish_receipt(src=src, proc=proc, cloud_src_map=cloud_src_map)
+
+
+def finish_receipt(
+    *,
+    src: Path,
+    proc: type_def.ReceiptProcessResult,
+    cloud_src_map: dict[Path, Path],
+) -> None:
+    """
+    レシート処理結果に応じて cloud 側ファイルを移動し、結果をログ出力する。
+
+    Args:
+        src (Path): レシート画像ファイルパス
+        proc (ReceiptProcessResult): レシート処理結果
+        cloud_src_map (dict[Path, Path]): local src → cloud src 対応表
+
+    Returns:
+        None
+    """
+    # cloud src 取得
+    cloud_src: Path | None = cloud_src_map.get(src)
+
+    # ------------------------------
+    # cloud 側移動
+    # ------------------------------
+    if cloud_src:
+        try:
+            if proc.ok:
+                cloud_src.replace(cloud_processed_dir / cloud_src.name)
+                log.info(f"CLOUD MOVE TO PROCESSED: {cloud_src.name}")
+            else:
+                cloud_src.replace(cloud_error_dir / cloud_src.name)
+                log.info(f"CLOUD MOVE TO ERROR: {cloud_src.name}")
+        except Exception as e:
+            log.error(
+                f"CLOUD MOVE FAILED: {cloud_src.name} ({e})"
+            )
+
+    if proc.duplicate:
+        log.info(f"RECEIPT DUPLICATE SKIPPED: {src.name}")
+    elif proc.ok:
+        log.info(f"RECEIPT PROCESS SUCCESS: {src.name}")
+    else:
+        log.error(
+            f"RECEIPT PROCESS FAILED: {src.name} ({proc.error_reason})"
+        )
+
+
+def _copy_from_cloud(src: Path, dst: Path) -> None:
+    """
+    cloud 上のファイルを input へコピーする。
+
+    cloud 同期フォルダ（OneDrive 等）はカーネルの高速コピーに対応しないことが多いため、
+    大きめのバッファで順次読み込みコピーする（全体をメモリに読み込まない）。
+
+    Args:
+        src (Path): コピー元(cloud)ファイルパス
+        dst (Path): コピー先(input)ファイルパス
+
+    Returns:
+        None
+    """
+    with src.open("rb") as fsrc, dst.open("wb") as fdst:
+        # 先読みのヒント（対応OSのみ）
+        if hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(fsrc.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass
+
+        shutil.copyfileobj(fsrc, fdst, length=CLOUD_COPY_BUFFER_SIZE)
 
 
 def install_config() -> None:
@@ -342,12 +571,17 @@ def load_system_prompt() -> None:
         None
     """
     global receipt_tags_prompt
+    global receipt_tags_batch_prompt
     global monthly_expense_summary_prompt
 
     # タグ判断用プロンプト読み込み
     with RECEIPT_TAGS_PROMPT_PATH.open("r", encoding="utf-8") as f:
         receipt_tags_prompt = f.read()
 
+    # 複数レシートのタグ判断用プロンプト読み込み
+    with RECEIPT_TAGS_BATCH_PROMPT_PATH.open("r", encoding="utf-8") as f:
+        receipt_tags_batch_prompt = f.read()
+
     # 月次支出サマリ用プロンプト読み込み
     with MONTHLY_EXPENSE_SUMMARY_PROMPT_PATH.open("r", encoding="utf-8") as f:
         monthly_expense_summary_prompt = f.read()
@@ -14,6 +14,7 @@
 - Receipt 系モジュールには依存しない
 - main.py からは send() のみを呼び出す
 - 設定値（from / to 等）は初期化時に注入する
+- with 文で使用した場合、ブロック内では SMTP 接続を使い回す
 - 将来の HTML 化・通知手段追加を考慮し、クラス構成とする
 
 備考:
@@ -30,6 +31,9 @@ from dotenv import load_dotenv
 
 from ..tool import logger_module as log_mod
 
+# モジュール用ロガー（呼び出し元ファイル名を保持）
+log = log_mod.get_logger(__file__)
+
 
 class MonthlyMailer:
     """月次サマリー＋グラフをメール送信するクラス"""
@@ -72,7 +76,38 @@ class MonthlyMailer:
         self._smtp_user: str = os.getenv("GMAIL_SMTP_ID")
         self._smtp_password: str = os.getenv("GMAIL_SMTP_PASSWORD")
 
-        log_mod.info("MONTHLY MAILER INITIALIZED")
+        self._server: smtplib.SMTP | None = None     # 接続中のSMTPサーバー（未接続時は None）
+        self._keep_connection: bool = False         # with ブロック内で接続を維持するか
+
+        log.info("MONTHLY MAILER INITIALIZED")
+
+    def __enter__(self) -> MonthlyMailer:
+        """
+        with ブロック開始（SMTP 接続は初回送信時に確立し、ブロック終了まで維持する）
+
+        Args:
+            None
+
+        Returns:
+            MonthlyMailer: 自身
+        """
+        self._keep_connection = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        with ブロック終了（SMTP 接続を切断する）
+
+        Args:
+            exc_type: 例外の型
+            exc_value: 例外インスタンス
+            traceback: トレースバック
+
+        Returns:
+            None
+        """
+        self._keep_connection = False
+        self._disconnect()
 
     # ==================================================
     # Public API
@@ -90,7 +125,7 @@ class MonthlyMailer:
         Returns:
             None
         """
-        log_mod.info(f"SEND MONTHLY MAIL START: {year}-{month:02d}")
+        log.info(f"SEND MONTHLY MAIL START: {year}-{month:02d}")
 
         subject: str = self.SUBJECT_TEMPLATE.format(year=year, month=month)
         body: str = self.BODY_TEMPLATE.format(year=year, month=month, summary=summary_text)
@@ -104,7 +139,7 @@ class MonthlyMailer:
         # 添付ファイル追加
         for path in graph_paths:
             if not path.exists():
-                log_mod.error(f"ATTACHMENT NOT FOUND: {path}")
+                log.error(f"ATTACHMENT NOT FOUND: {path}")
                 continue
 
             data = path.read_bytes()
@@ -115,23 +150,85 @@ class MonthlyMailer:
                 filename=path.name,
             )
 
-        log_mod.debug(
+        log.debug(
             f"MAIL ATTACHMENTS: {[p.name for p in graph_paths]}"
         )
 
         # SMTP送信
         try:
-            with smtplib.SMTP(self.SMTP_HOST, self.SMTP_PORT) as server:
-                server.starttls()
-                server.login(self._smtp_user, self._smtp_password)
-                server.send_message(msg)
-
-            log_mod.info(
+            try:
+                self._get_server().send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                # 維持していた接続が切断されていた場合は再接続して再送する
+                log.info("SMTP SERVER DISCONNECTED. RECONNECT")
+                self._disconnect()
+                self._get_server().send_message(msg)
+
+            log.info(
                 f"SEND MONTHLY MAIL SUCCESS: {year}-{month:02d}"
             )
 
         except Exception as e:
-            log_mod.error(
+            log.error(
                 f"SEND MONTHLY MAIL FAILED: {year}-{month:02d} ({e})"
             )
+            self._disconnect()
+            raise
+
+        finally:
+            if not self._keep_connection:
+                self._disconnect()
+
+    # ==================================================
+    # SMTP接続管理
+    # ==================================================
+    def _get_server(self) -> smtplib.SMTP:
+        """
+        SMTP 接続を取得する（未接続・切断済みの場合は接続する）
+
+        Args:
+            None
+
+        Returns:
+            smtplib.SMTP: ログイン済みの SMTP 接続
+        """
+        if self._server is not None:
+            try:
+                self._server.noop()
+                return self._server
+            except (smtplib.SMTPException, OSError):
+                log.info("SMTP CONNECTION LOST. RECONNECT")
+                self._disconnect()
+
+        server = smtplib.SMTP(self.SMTP_HOST, self.SMTP_PORT)
+        try:
+            server.starttls()
+            server.login(self._smtp_user, self._smtp_password)
+        except Exception:
+            server.close()
             raise
+
+        self._server = server
+        log.debug("SMTP CONNECTED")
+        return server
+
+    def _disconnect(self) -> None:
+        """
+        SMTP 接続を切断する
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self._server is None:
+            return
+
+        try:
+            self._server.quit()
+        except (smtplib.SMTPException, OSError):
+            self._server.close()
+        finally:
+            self._server = None
+            log.debug("SMTP DISCONNECTED")
@@ -7,6 +7,8 @@
 from __future__ import annotations
 
 import os
+import threading
+import time
 from pathlib import Path
 from typing import Any
 
@@ -14,37 +16,56 @@ from dotenv import load_dotenv
 
 from azure.ai.formrecognizer import DocumentAnalysisClient
 from azure.core.credentials import AzureKeyCredential
+from azure.core.exceptions import HttpResponseError, ServiceRequestError, ServiceResponseError
 
 from ..tool import logger_module as log_mod
+from ..tool import retry_util
+
+# モジュール用ロガー（呼び出し元ファイル名を保持）
+log = log_mod.get_logger(__file__)
 
 # ==================================================
 # グローバル変数定義
 # ==================================================
 client: DocumentAnalysisClient | None = None        # Azure Document Intelligenceクライアント
+_client_lock: threading.Lock = threading.Lock()     # クライアント生成排他ロック
 
 
-def init() -> None:
+def init(connection_timeout_sec: float = 30.0, read_timeout_sec: float = 120.0) -> None:
     """
-    生成AIクライアントを初期化する
+    Azure Document Intelligenceクライアントを初期化する
+
+    - クライアント（接続プール）はプロセス内で1つだけ生成し、2回目以降の呼び出しでは再利用する
 
     Args:
-        None
+        connection_timeout_sec (float): 接続タイムアウト(秒)
+        read_timeout_sec (float): 読み取りタイムアウト(秒)
 
     Returns:
         None
     """
     global client
 
-    load_dotenv()
+    with _client_lock:
+        if client is not None:
+            return
 
-    endpoint: str = os.getenv("AZURE_DI_ENDPOINT", "").strip()
-    key: str = os.getenv("AZURE_DI_KEY", "").strip()
+        load_dotenv()
 
-    if not endpoint or not key:
-        log_mod.error("AZURE_DI_ENDPOINT or AZURE_DI_KEY is empty")
+        endpoint: str = os.getenv("AZURE_DI_ENDPOINT", "").strip()
+        key: str = os.getenv("AZURE_DI_KEY", "").strip()
 
-    client = DocumentAnalysisClient(endpoint=endpoint, credential=AzureKeyCredential(key))
-    log_mod.info("RECEIPT AI INITIALIZED")
+        if not endpoint or not key:
+            log.error("AZURE_DI_ENDPOINT or AZURE_DI_KEY is empty")
+
+        client = DocumentAnalysisClient(
+            endpoint=endpoint,
+            credential=AzureKeyCredential(key),
+            connection_timeout=connection_timeout_sec,
+            read_timeout=read_timeout_sec,
+            retry_total=0,      # リトライは _analyze_document で制御する
+        )
+    log.info("RECEIPT AI INITIALIZED")
 
 
 def analyze_receipt(receipt_path: str) -> dict[str, Any]:
@@ -60,17 +81,60 @@ def analyze_receipt(receipt_path: str) -> dict[str, Any]:
     global client
 
     if client is None:
-        log_mod.error("RECEIPT AI NOT INITIALIZED")
+        log.error("RECEIPT AI NOT INITIALIZED")
 
     path: Path = Path(receipt_path)
     if not path.exists():
-        log_mod.error(f"RECEIPT FILE NOT FOUND: {receipt_path}")
+        log.error(f"RECEIPT FILE NOT FOUND: {receipt_path}")
 
-    with path.open("rb") as f:
-        poller: Any = client.begin_analyze_document(model_id="prebuilt-receipt", document=f)
-        result: Any = poller.result()
+    result: Any = _analyze_document(path)
 
     data: dict[str, Any] = result.to_dict()
     # このログは出すぎるので注意！
-    # log_mod.debug(f"RECEIPT AI ANALYZE RESULT: {data}")
+    # log.debug(f"RECEIPT AI ANALYZE RESULT: {data}")
     return data
+
+
+def _analyze_document(path: Path) -> Any:
+    """
+    Azure Document Intelligence で解析する（一時的なエラーは指数バックオフでリトライ）
+
+    Args:
+        path (Path): レシート画像ファイルのパス
+
+    Returns:
+        AnalyzeResult: 解析結果
+
+    Raises:
+        HttpResponseError | ServiceRequestError | ServiceResponseError:
+            リトライ対象外のエラー、または最大試行回数に達した場合
+    """
+    global client
+
+    for attempt in range(retry_util.REQUEST_MAX_ATTEMPTS):
+        try:
+            with path.open("rb") as f:
+                poller: Any = client.begin_analyze_document(model_id="prebuilt-receipt", document=f)
+                return poller.result()
+        except (HttpResponseError, ServiceRequestError, ServiceResponseError) as e:
+            if attempt + 1 >= retry_util.REQUEST_MAX_ATTEMPTS or not _is_retryable_error(e):
+                raise
+
+            delay: float = retry_util.retry_delay(e, attempt)
+            log.info(f"RETRY RECEIPT AI REQUEST ({attempt + 1}/{retry_util.REQUEST_MAX_ATTEMPTS - 1}) AFTER {delay:.2f} sec: {path.name} ({e})")
+            time.sleep(delay)
+
+
+def _is_retryable_error(e: Exception) -> bool:
+    """
+    リトライ対象のエラーか判定する
+
+    Args:
+        e (Exception): 発生したエラー
+
+    Returns:
+        bool: 通信エラー、またはリトライ対象のHTTPステータスの場合 True
+    """
+    if isinstance(e, (ServiceRequestError, ServiceResponseError)):
+        return True
+    return getattr(e, "status_code", None) in retry_util.RETRYABLE_STATUS_CODES
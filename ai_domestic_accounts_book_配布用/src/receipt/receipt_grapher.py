@@ -8,17 +8,21 @@
 
 from __future__ import annotations
 
-import csv
-from collections import defaultdict
+import os
+import threading
 from pathlib import Path
 from typing import Dict
 
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 
+from . import receipt_store
 from . import type_def
 from ..tool import logger_module as log_mod
 from matplotlib import rcParams
 
+# モジュール用ロガー（呼び出し元ファイル名を保持）
+log = log_mod.get_logger(__file__)
+
 
 # ==================================================
 # 定数定義
@@ -44,6 +48,14 @@ CATEGORY_COLOR_MAP: dict[str, str] = {
 }
 
 
+# ==================================================
+# グローバル変数定義
+# ==================================================
+# 月別CSVの集計結果キャッシュ（key: CSVパス, value: (更新時刻ns, ファイルサイズ, 集計結果)）
+_category_totals_cache: dict[Path, tuple[int, int, Dict[str, int]]] = {}
+_category_totals_cache_lock: threading.Lock = threading.Lock()     # 集計結果キャッシュ排他ロック
+
+
 # ==================================================
 # Public API
 # ==================================================
@@ -71,7 +83,7 @@ def generate_monthly_category_bar_graph(
 
     if not csv_path.exists():
         msg = f"MONTHLY CSV NOT FOUND: {csv_path}"
-        log_mod.error(msg)
+        log.error(msg)
         raise FileNotFoundError(msg)
 
     # --------------------------------------------------
@@ -81,7 +93,7 @@ def generate_monthly_category_bar_graph(
 
     if not totals:
         msg = f"NO DATA TO PLOT: {csv_path.name}"
-        log_mod.error(msg)
+        log.error(msg)
         raise ValueError(msg)
 
     # --------------------------------------------------
@@ -109,7 +121,7 @@ def generate_monthly_category_bar_graph(
         out_path=out_path,
     )
 
-    log_mod.info(f"MONTHLY GRAPH GENERATED: {out_path}")
+    log.info(f"MONTHLY GRAPH GENERATED: {out_path}")
     return out_path
 
 
@@ -137,28 +149,33 @@ def generate_annual_category_bar_graph(
 
     if not year_dir.exists():
         msg = f"ANNUAL CSV DIR NOT FOUND: {year_dir}"
-        log_mod.error(msg)
+        log.error(msg)
         raise FileNotFoundError(msg)
 
     # --------------------------------------------------
     # 月別CSVをすべて集計（存在する分だけ）
     # --------------------------------------------------
-    annual_totals: Dict[str, int] = defaultdict(int)
-
-    csv_files = sorted(year_dir.glob("*_items.csv"))
+    # DirEntry の名前・種別で判定し、該当ファイルのみ Path を生成する
+    with os.scandir(year_dir) as it:
+        csv_files = sorted(
+            Path(entry.path)
+            for entry in it
+            if entry.name.endswith("_items.csv") and entry.is_file(follow_symlinks=False)
+        )
     if not csv_files:
         msg = f"NO CSV FILES FOR YEAR: {year}"
-        log_mod.error(msg)
+        log.error(msg)
         raise ValueError(msg)
 
+    # 月別の集計結果（月次グラフ生成時のキャッシュ）を合算する
+    annual_totals: Dict[str, int] = {}
     for csv_path in csv_files:
-        monthly_totals = _aggregate_by_category(csv_path)
-        for tag, amount in monthly_totals.items():
-            annual_totals[tag] += amount
+        for tag, amount in _aggregate_by_category(csv_path).items():
+            annual_totals[tag] = annual_totals.get(tag, 0) + amount
 
     if not annual_totals:
         msg = f"NO DATA TO PLOT (ANNUAL): {year}"
-        log_mod.error(msg)
+        log.error(msg)
         raise ValueError(msg)
 
     # --------------------------------------------------
@@ -191,7 +208,7 @@ def generate_annual_category_bar_graph(
         out_path=out_path,
     )
 
-    log_mod.info(f"ANNUAL GRAPH GENERATED: {out_path}")
+    log.info(f"ANNUAL GRAPH GENERATED: {out_path}")
     return out_path
 
 
@@ -202,32 +219,31 @@ def _aggregate_by_category(csv_path: Path) -> Dict[str, int]:
     """
     月別CSVからカテゴリー別に支出金額を集計する。
 
+    - CSV の更新時刻・サイズが前回集計時と同じ場合はキャッシュを返す
+      （返却値はキャッシュと共有のため、呼び出し側で変更しないこと）
+
     Args:
         csv_path (Path): 月別CSVパス
 
     Returns:
         dict[str, int]: {カテゴリー名: 合計金額}
     """
-    totals: Dict[str, int] = defaultdict(int)
-
-    with csv_path.open("r", encoding="utf-8-sig", newline="") as f:
-        reader = csv.DictReader(f)
-
-        for row in reader:
-            tag = (row.get("item_tag") or "").strip()
-            price_raw = row.get("total_price_yen")
+    st = csv_path.stat()
 
-            if not tag:
-                tag = type_def.ReceiptTag.UNKNOWN.value
+    with _category_totals_cache_lock:
+        cached = _category_totals_cache.get(csv_path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
 
-            try:
-                price = int(price_raw)
-            except (TypeError, ValueError):
-                continue
-
-            totals[tag] += price
+    # タグが空の行は「不明」として集計する
+    totals: Dict[str, int] = receipt_store.aggregate_category_csv(
+        csv_path,
+        empty_tag=type_def.ReceiptTag.UNKNOWN.value,
+    )
 
-    return dict(totals)
+    with _category_totals_cache_lock:
+        _category_totals_cache[csv_path] = (st.st_mtime_ns, st.st_size, totals)
+    return totals
 
 
 def _plot_horizontal_bar(
@@ -249,7 +265,9 @@ def _plot_horizontal_bar(
     Returns:
         None
     """
-    plt.figure(figsize=(10, max(4, len(categories) * 0.5)))
+    # pyplot のグローバル状態を使わず Figure を直接生成する（スレッドセーフ）
+    fig = Figure(figsize=(10, max(4, len(categories) * 0.5)))
+    ax = fig.subplots()
 
     y_pos = range(len(categories))
 
@@ -259,15 +277,15 @@ def _plot_horizontal_bar(
         for cat in categories
     ]
 
-    plt.barh(y_pos, amounts, color=colors)
-    plt.yticks(y_pos, categories)
-    plt.xlabel("支出金額（円）")
-    plt.title(title)
+    ax.barh(y_pos, amounts, color=colors)
+    ax.set_yticks(y_pos)
+    ax.set_yticklabels(categories)
+    ax.set_xlabel("支出金額（円）")
+    ax.set_title(title)
 
     # 金額ラベル表示
     for i, value in enumerate(amounts):
-        plt.text(value, i, f" {value:,}円", va="center")
+        ax.text(value, i, f" {value:,}円", va="center")
 
-    plt.tight_layout()
-    plt.savefig(out_path)
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(out_path)
@@ -0,0 +1,132 @@
+"""
+初回作成日：2026/10/14
+作成者：kadoya
+ファイル名：receipt_ledger.py
+
+処理済みレシートの台帳（内容ハッシュ）を管理するモジュール。
+
+責務:
+- レシート画像ファイルの内容ハッシュ(SHA-256)算出
+- 処理済みハッシュの登録・照会（SQLite）
+
+備考:
+- 同じ画像が再投入された場合に、Azure への解析・タグ判定リクエストを省略するために使用する
+"""
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+
+from ..tool import logger_module as log_mod
+
+# モジュール用ロガー（呼び出し元ファイル名を保持）
+log = log_mod.get_logger(__file__)
+
+
+# ==================================================
+# 定数定義
+# ==================================================
+HASH_READ_CHUNK_SIZE: int = 1024 * 1024     # ハッシュ算出時の読み込みサイズ(byte)
+
+
+class ReceiptLedger:
+    """処理済みレシートの内容ハッシュを SQLite で管理するクラス"""
+
+    def __init__(self, db_path: Path) -> None:
+        """
+        ReceiptLedger 初期化（テーブルが無い場合は作成する）
+
+        Args:
+            db_path (Path): 台帳DBファイルパス
+
+        Returns:
+            None
+        """
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock: threading.Lock = threading.Lock()       # DB接続排他ロック（並列処理用）
+        self._conn: sqlite3.Connection = sqlite3.connect(str(db_path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS processed ("
+                " hash TEXT PRIMARY KEY,"
+                " year INTEGER,"
+                " month INTEGER,"
+                " json_path TEXT"
+                ")"
+            )
+
+        log.info("RECEIPT LEDGER INITIALIZED")
+
+    def close(self) -> None:
+        """
+        台帳DBを閉じる
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._conn.close()
+        log.info("RECEIPT LEDGER CLOSED")
+
+    @staticmethod
+    def compute_hash(path: Path) -> str:
+        """
+        ファイル内容の SHA-256 を算出する（全体をメモリに読み込まない）
+
+        Args:
+            path (Path): 対象ファイルパス
+
+        Returns:
+            str: SHA-256 の16進文字列
+        """
+        with path.open("rb") as f:
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, "sha256").hexdigest()
+
+            h = hashlib.sha256()
+            while chunk := f.read(HASH_READ_CHUNK_SIZE):
+                h.update(chunk)
+            return h.hexdigest()
+
+    def find(self, content_hash: str) -> str | None:
+        """
+        処理済みハッシュを照会する
+
+        Args:
+            content_hash (str): 内容ハッシュ
+
+        Returns:
+            str | None: 処理済みの場合は保存済み JSON ファイルパス、未処理の場合は None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT json_path FROM processed WHERE hash = ?",
+                (content_hash,),
+            ).fetchone()
+
+        return None if row is None else (row[0] or "")
+
+    def add(self, content_hash: str, *, year: int | None, month: int | None, json_path: Path) -> None:
+        """
+        処理済みハッシュを登録する（登録済みの場合は何もしない）
+
+        Args:
+            content_hash (str): 内容ハッシュ
+            year (int | None): レシートの年
+            month (int | None): レシートの月
+            json_path (Path): 保存済み JSON ファイルパス
+
+        Returns:
+            None
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO processed (hash, year, month, json_path) VALUES (?, ?, ?, ?)",
+                (content_hash, year, month, str(json_path)),
+            )
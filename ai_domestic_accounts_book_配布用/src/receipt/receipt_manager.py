@@ -6,19 +6,30 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any
-import re
+from typing import Any, Iterator, TextIO
+import asyncio
+import io
+import os
 import json
-import csv
+import threading
+
+try:
+    import orjson
+except ImportError:     # orjson が無い環境では json モジュールを使用する
+    orjson = None
 
 from ..tool import logger_module as log_mod
 from . import receipt_ai
 from . import receipt_parser
 from . import receipt_store
 from . import receipt_grapher
+from . import receipt_ledger
 from . import type_def
 from ..generative_ai import generative_ai
 
+# モジュール用ロガー（呼び出し元ファイル名を保持）
+log = log_mod.get_logger(__file__)
+
 
 class ReceiptManager:
     """
@@ -70,6 +81,25 @@ class ReceiptManager:
         type_def.ReceiptTag.UNKNOWN: "unknown",
     }
 
+    # 月次AIサマリーの応答 JSON に必要なキー
+    MONTHLY_SUMMARY_KEYS: tuple[str, ...] = (
+        "monthly_summary",
+        "monthly_characteristics",
+        "positive_points",
+        "advice_for_next_month",
+    )
+
+    # basename 生成失敗時のエラーメッセージ
+    BASENAME_FAILED_MSG: str = "FAILED TO BUILD BASENAME"
+
+    # AIタグ判定のリクエストパラメータ（分類用途のため決定的かつ短い応答とする）
+    TAGGING_TEMPERATURE: float = 0.0                # 応答の温度
+    TAGGING_MAX_TOKENS_BASE: int = 32               # 応答の最大トークン数（JSON の外枠分）
+    TAGGING_MAX_TOKENS_PER_ITEM: int = 128          # 応答の最大トークン数（1 item あたり。name / tag / 日本語の reason 分）
+    TAGGING_MAX_TOKENS_LIMIT: int = 4096            # 応答の最大トークン数の上限（デプロイの出力上限を超えないようにする）
+    # 複数レシートをまとめて判定する際の最大 item 数（応答の最大トークン数の上限に収まる数）
+    TAGGING_MAX_ITEMS_PER_BATCH: int = (TAGGING_MAX_TOKENS_LIMIT - TAGGING_MAX_TOKENS_BASE) // TAGGING_MAX_TOKENS_PER_ITEM
+
     # AIタグ -> ReceiptTag マップ
     AI_TAG_TO_RECEIPT_TAG: dict[str, type_def.ReceiptTag] = {
         "Food": type_def.ReceiptTag.FOOD,
@@ -87,14 +117,22 @@ class ReceiptManager:
         "Other": type_def.ReceiptTag.OTHER,
         "Unknown": type_def.ReceiptTag.UNKNOWN,
     }
+    # AIタグ（小文字） -> ReceiptTag マップ（大文字・小文字の揺れを吸収するため）
+    _AI_TAG_CI: dict[str, type_def.ReceiptTag] = {k.lower(): v for k, v in AI_TAG_TO_RECEIPT_TAG.items()}
 
     def __init__(
         self,
         input_dir: Path,
         error_dir: Path,
-        receipt_image_exts: tuple[str, ...],
+        receipt_image_exts: frozenset[str],
         receipt_tags_prompt: str,
         monthly_expense_summary_prompt: str,
+        receipt_tags_batch_prompt: str = "",
+        llm_cache_path: Path | None = None,
+        generative_ai_timeout_sec: float = 60.0,
+        receipt_ai_connection_timeout_sec: float = 30.0,
+        receipt_ai_read_timeout_sec: float = 120.0,
+        ledger_path: Path | None = None,
     ) -> None:
         """
         レシートマネージャ初期化
@@ -102,15 +140,24 @@ class ReceiptManager:
         Args:
             input_dir (Path): レシート画像入力ディレクトリパス
             error_dir (Path): エラーディレクトリパス
-            receipt_image_exts (tuple[str, ...]): レシート画像拡張子タプル
+            receipt_image_exts (frozenset[str]): レシート画像拡張子セット
             receipt_tags_prompt (str): レシートタグ判断用システムプロンプト
             monthly_expense_summary_prompt (str): 月次支出サマリ用システムプロンプト
+            receipt_tags_batch_prompt (str): 複数レシートのタグ判断用システムプロンプト
+            llm_cache_path (Path | None): 生成AI応答キャッシュの保存先ファイルパス
+            generative_ai_timeout_sec (float): 生成AIリクエストのタイムアウト(秒)
+            receipt_ai_connection_timeout_sec (float): Azure Document Intelligence 接続タイムアウト(秒)
+            receipt_ai_read_timeout_sec (float): Azure Document Intelligence 読み取りタイムアウト(秒)
+            ledger_path (Path | None): 処理済みレシート台帳の DB ファイルパス（None の場合は重複チェックしない）
 
         Returns:
             None
         """
         # Azure Document Intelligenceクライアント初期化
-        receipt_ai.init()
+        receipt_ai.init(
+            connection_timeout_sec=receipt_ai_connection_timeout_sec,
+            read_timeout_sec=receipt_ai_read_timeout_sec,
+        )
 
         # レシート画像収集
         self._receipt_images: list[Path] = receipt_store.load_receipt_image(
@@ -120,21 +167,46 @@ class ReceiptManager:
         )
 
         # 生成AIクライアント初期化
-        generative_ai.init()
+        generative_ai.init(
+            cache_path=llm_cache_path,
+            timeout_sec=generative_ai_timeout_sec,
+        )
 
         self._receipt_tags_prompt: str = receipt_tags_prompt                                # レシートタグ判断用システムプロンプト
+        self._receipt_tags_batch_prompt: str = receipt_tags_batch_prompt                    # 複数レシートのタグ判断用システムプロンプト
         self._input_dir = input_dir                                                         # レシート画像入力ディレクトリパス
         self._error_dir = error_dir                                                         # エラーディレクトリパス
-        self._receipt_image_exts = receipt_image_exts                                       # レシート画像拡張子タプル
+        self._receipt_image_exts = receipt_image_exts                                       # レシート画像拡張子セット
         self._monthly_expense_summary_prompt: str = monthly_expense_summary_prompt          # 月次支出サマリ用システムプロンプト
+        self._store_lock: threading.Lock = threading.Lock()                                 # 保存・移動処理の排他ロック（並列処理用）
+        self._year_totals_cache: dict[Path, tuple[Any, dict[int, dict[str, int]]]] = {}     # 年別CSV集計結果キャッシュ（key: 年ディレクトリ）
+        self._year_totals_lock: threading.Lock = threading.Lock()                           # 年別CSV集計排他ロック
+        self._ledger: receipt_ledger.ReceiptLedger | None = None                            # 処理済みレシート台帳
+        if ledger_path is not None:
+            self._ledger = receipt_ledger.ReceiptLedger(ledger_path)
 
-        log_mod.info("RECEIPT MANAGER INITIALIZED")
+        log.info("RECEIPT MANAGER INITIALIZED")
+
+    def close(self) -> None:
+        """
+        レシートマネージャ終了処理（生成AI応答キャッシュの保存など）
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        generative_ai.delete()
+        if self._ledger is not None:
+            self._ledger.close()
+        log.info("RECEIPT MANAGER CLOSED")
 
     def process_receipt(
         self,
         src: Path,
         *,
-        invalid_filename_chars: re.Pattern[str],
+        invalid_filename_table: dict[int, str],
         output_json_dir: Path,
         output_csv_dir: Path,
         processed_dir: Path,
@@ -144,6 +216,7 @@ class ReceiptManager:
         レシート1件分の処理をまとめて実行する Facade API。
 
         処理内容:
+            0) 処理済み台帳と内容ハッシュが一致する場合は processed へ移動して終了
             1) レシート画像を AI 解析
             2) 解析結果をパース
             3) basename 生成
@@ -154,7 +227,7 @@ class ReceiptManager:
 
         Args:
             src (Path): レシート画像ファイルパス
-            invalid_filename_chars (re.Pattern[str]): ファイル名使用不可文字パターン
+            invalid_filename_table (dict[int, str]): ファイル名使用不可文字の置換テーブル（str.maketrans）
             output_json_dir (Path): JSON 出力ディレクトリ
             output_csv_dir (Path): CSV 出力ディレクトリ
             processed_dir (Path): processed ディレクトリ
@@ -165,15 +238,23 @@ class ReceiptManager:
                 ok=True  : 正常完了
                 ok=False : 処理失敗（error_reason に理由）
         """
-        log_mod.info(f"RECEIPT PROCESS START: {src.name}")
+        log.info(f"RECEIPT PROCESS START: {src.name}")
 
         try:
+            # ==================================================
+            # 重複チェック（処理済みの画像は解析を省略）
+            # ==================================================
+            content_hash, duplicate = self._skip_if_duplicate(src, processed_dir)
+            if duplicate is not None:
+                return duplicate
+
             # ==================================================
             # 解析 + パース
             # ==================================================
             analyze_result = self.analyze_and_parse(str(src))
             if not analyze_result.ok:
-                receipt_store.move_to_error(src, error_dir)
+                with self._store_lock:
+                    receipt_store.move_to_error(src, error_dir)
                 return analyze_result
 
             result: type_def.ReceiptResult = analyze_result.result  # type: ignore
@@ -184,68 +265,205 @@ class ReceiptManager:
             self._judge_receipt_tags_by_ai(result)
 
             # ==================================================
-            # basename 生成
+            # 保存・移動
             # ==================================================
-            receipt_id: str = receipt_store.build_base_name(
+            return self._store_receipt(
+                src,
                 result,
-                invalid_filename_chars,
-            )
-            if not receipt_id:
-                msg = "FAILED TO BUILD BASENAME"
-                log_mod.error(msg)
-                receipt_store.move_to_error(src, error_dir)
-                return type_def.ReceiptProcessResult.failed(msg)
-
-            # ==================================================
-            # JSON 保存
-            # ==================================================
-            saved_json: Path = receipt_store.save_result_json(
-                result=result,
-                base=receipt_id,
+                content_hash=content_hash,
+                invalid_filename_table=invalid_filename_table,
                 output_json_dir=output_json_dir,
-            )
-
-            # ==================================================
-            # CSV 追記
-            # ==================================================
-            csv_path: Path = receipt_store.get_monthly_receipt_csv_path(
-                result=result,
-                output_csv_root=output_csv_dir,
-                receipt_id=receipt_id,
-            )
-
-            rows: list[dict[str, Any]] = receipt_store.build_receipt_summary_csv_row(
-                result=result,
-                receipt_id=receipt_id,
-                saved_json_path=saved_json,
-            )
-
-            receipt_store.append_monthly_receipt_item_csv(
-                csv_path=csv_path,
-                rows=rows,
-            )
-
-            # ==================================================
-            # processed へ移動（ローカルのみ）
-            # ==================================================
-            receipt_store.move_to_processed(
-                src=src,
-                base=receipt_id,
+                output_csv_dir=output_csv_dir,
                 processed_dir=processed_dir,
+                error_dir=error_dir,
             )
 
-            log_mod.info(f"RECEIPT PROCESS END: {receipt_id}")
-            return type_def.ReceiptProcessResult.success(result)
-
         except ValueError as e:
             # レシート不成立（NOT A RECEIPT など）
-            log_mod.info(f"RECEIPT SKIPPED: {src.name} ({e})")
+            log.info(f"RECEIPT SKIPPED: {src.name} ({e})")
             return type_def.ReceiptProcessResult.failed(str(e))
 
         except Exception as e:
-            log_mod.error(f"RECEIPT ANALYZE FAILED: {src.name} ({e})")
+            log.error(f"RECEIPT ANALYZE FAILED: {src.name} ({e})")
             return type_def.ReceiptProcessResult.failed(str(e))
 
+    async def process_receipt_async(
+        self,
+        src: Path,
+        *,
+        invalid_filename_table: dict[int, str],
+        output_json_dir: Path,
+        output_csv_dir: Path,
+        processed_dir: Path,
+        error_dir: Path
+    ) -> type_def.ReceiptProcessResult:
+        """
+        process_receipt の非同期版。
+
+        - Azure への通信（同期SDK）を含む process_receipt をワーカースレッドで実行する
+        - 同時実行数の制御は呼び出し側（asyncio.Semaphore）で行う
+
+        Args:
+            src (Path): レシート画像ファイルパス
+            invalid_filename_table (dict[int, str]): ファイル名使用不可文字の置換テーブル（str.maketrans）
+            output_json_dir (Path): JSON 出力ディレクトリ
+            output_csv_dir (Path): CSV 出力ディレクトリ
+            processed_dir (Path): processed ディレクトリ
+            error_dir (Path): error ディレクトリ
+
+        Returns:
+            ReceiptProcessResult: process_receipt と同じ
+        """
+        return await asyncio.to_thread(
+            self.process_receipt,
+            src,
+            invalid_filename_table=invalid_filename_table,
+            output_json_dir=output_json_dir,
+            output_csv_dir=output_csv_dir,
+            processed_dir=processed_dir,
+            error_dir=error_dir,
+        )
+
+    def process_receipts_batch(
+        self,
+        srcs: list[Path],
+        *,
+        invalid_filename_table: dict[int, str],
+        output_json_dir: Path,
+        output_csv_dir: Path,
+        processed_dir: Path,
+        error_dir: Path
+    ) -> list[type_def.ReceiptProcessResult]:
+        """
+        複数レシートをまとめて処理する Facade API。
+
+        処理内容は process_receipt と同じだが、AI によるタグ判定を
+        全レシート分まとめて1回のリクエストで行う（item 数が多い場合は分割）。
+        CSV への追記も月別CSVごとにまとめて最後に1回で行う。
+
+        Args:
+            srcs (list[Path]): レシート画像ファイルパス一覧
+            invalid_filename_table (dict[int, str]): ファイル名使用不可文字の置換テーブル（str.maketrans）
+            output_json_dir (Path): JSON 出力ディレクトリ
+            output_csv_dir (Path): CSV 出力ディレクトリ
+            processed_dir (Path): processed ディレクトリ
+            error_dir (Path): error ディレクトリ
+
+        Returns:
+            list[ReceiptProcessResult]: srcs と同じ順序の処理結果一覧
+        """
+        procs: list[type_def.ReceiptProcessResult | None] = [None] * len(srcs)
+        targets: list[tuple[int, type_def.ReceiptResult]] = []
+        content_hashes: list[str] = [""] * len(srcs)
+
+        # ==================================================
+        # 重複チェック + 解析 + パース
+        # ==================================================
+        for i, src in enumerate(srcs):
+            log.info(f"RECEIPT PROCESS START: {src.name}")
+
+            content_hashes[i], duplicate = self._skip_if_duplicate(src, processed_dir)
+            if duplicate is not None:
+                procs[i] = duplicate
+                continue
+
+            analyze_result = self.analyze_and_parse(str(src))
+            if not analyze_result.ok:
+                try:
+                    with self._store_lock:
+                        receipt_store.move_to_error(src, error_dir)
+                except Exception as e:
+                    log.error(f"RECEIPT ANALYZE FAILED: {src.name} ({e})")
+                procs[i] = analyze_result
+                continue
+
+            targets.append((i, analyze_result.result))  # type: ignore
+
+        # ==================================================
+        # AI によるタグ判定（まとめて1回）
+        # ==================================================
+        if targets:
+            self._judge_receipts_tags_by_ai_batch([result for _, result in targets])
+
+        # ==================================================
+        # 保存（CSV 行は月別CSVごとにまとめて最後に追記）
+        # ※processed 移動・台帳登録は CSV 追記に成功してから行う
+        # ==================================================
+        pending_by_csv: dict[Path, list[tuple[int, type_def.ReceiptResult, str, Path, list[tuple[Any, ...]]]]] = {}
+        for i, result in targets:
+            src = srcs[i]
+            try:
+                with self._store_lock:
+                    prepared = self._prepare_store(
+                        src,
+                        result,
+                        invalid_filename_table=invalid_filename_table,
+                        output_json_dir=output_json_dir,
+                        output_csv_dir=output_csv_dir,
+                        error_dir=error_dir,
+                    )
+                if prepared is None:
+                    procs[i] = type_def.ReceiptProcessResult.failed(self.BASENAME_FAILED_MSG)
+                    continue
+
+                receipt_id, saved_json, csv_path, rows = prepared
+                pending_by_csv.setdefault(csv_path, []).append((i, result, receipt_id, saved_json, rows))
+
+            except ValueError as e:
+                log.info(f"RECEIPT SKIPPED: {src.name} ({e})")
+                procs[i] = type_def.ReceiptProcessResult.failed(str(e))
+
+            except Exception as e:
+                log.error(f"RECEIPT ANALYZE FAILED: {src.name} ({e})")
+                procs[i] = type_def.ReceiptProcessResult.failed(str(e))
+
+        # ==================================================
+        # CSV 追記 → processed 移動・台帳登録
+        # ==================================================
+        self._flush_pending_receipts(
+            pending_by_csv,
+            procs,
+            srcs=srcs,
+            content_hashes=content_hashes,
+            processed_dir=processed_dir,
+        )
+
+        return procs  # type: ignore
+
+    async def process_receipts_batch_async(
+        self,
+        srcs: list[Path],
+        *,
+        invalid_filename_table: dict[int, str],
+        output_json_dir: Path,
+        output_csv_dir: Path,
+        processed_dir: Path,
+        error_dir: Path
+    ) -> list[type_def.ReceiptProcessResult]:
+        """
+        process_receipts_batch の非同期版（ワーカースレッドで実行する）
+
+        Args:
+            srcs (list[Path]): レシート画像ファイルパス一覧
+            invalid_filename_table (dict[int, str]): ファイル名使用不可文字の置換テーブル（str.maketrans）
+            output_json_dir (Path): JSON 出力ディレクトリ
+            output_csv_dir (Path): CSV 出力ディレクトリ
+            processed_dir (Path): processed ディレクトリ
+            error_dir (Path): error ディレクトリ
+
+        Returns:
+            list[ReceiptProcessResult]: process_receipts_batch と同じ
+        """
+        return await asyncio.to_thread(
+            self.process_receipts_batch,
+            srcs,
+            invalid_filename_table=invalid_filename_table,
+            output_json_dir=output_json_dir,
+            output_csv_dir=output_csv_dir,
+            processed_dir=processed_dir,
+            error_dir=error_dir,
+        )
+
     def analyze_and_parse(self, receipt_path: str) -> type_def.ReceiptProcessResult:
         """
         レシート画像を解析し、処理結果を ReceiptProcessResult として返却する。
@@ -268,7 +486,7 @@ class ReceiptManager:
         try:
             if not path.exists():
                 msg = f"RECEIPT FILE NOT FOUND: {receipt_path}"
-                log_mod.error(msg)
+                log.error(msg)
                 return type_def.ReceiptProcessResult.failed(msg)
 
             raw: dict[str, Any] = receipt_ai.analyze_receipt(receipt_path)
@@ -281,7 +499,7 @@ class ReceiptManager:
             return type_def.ReceiptProcessResult.success(result)
 
         except Exception as e:
-            log_mod.error(f"RECEIPT ANALYZE FAILED: {path.name} ({e})")
+            log.error(f"RECEIPT ANALYZE FAILED: {path.name} ({e})")
             return type_def.ReceiptProcessResult.failed(str(e))
 
     def get_receipt_images(self) -> list[Path]:
@@ -312,36 +530,12 @@ class ReceiptManager:
         """
         csv_root = self._input_dir.parent / "output" / "csv"
 
-        if not csv_root.exists():
+        year_months = receipt_store.scan_monthly_csv_year_months(csv_root)
+        if not year_months:
             return None
 
-        candidates: list[tuple[int, int]] = []
-
-        for year_dir in csv_root.iterdir():
-            if not year_dir.is_dir():
-                continue
-
-            try:
-                int(year_dir.name)
-            except ValueError:
-                continue
-
-            for csv_file in year_dir.glob("*_items.csv"):
-                m = re.match(r"(\d{6})_items\.csv", csv_file.name)
-                if not m:
-                    continue
-
-                yyyymm = m.group(1)
-                y = int(yyyymm[:4])
-                m_ = int(yyyymm[4:6])
-
-                candidates.append((y, m_))
-
-        if not candidates:
-            return None
-
-        # 年月で最大（＝最新）を返す
-        return max(candidates)
+        # 年月昇順のため末尾が最新
+        return year_months[-1]
 
     def get_existing_year_months(
             self,
@@ -356,30 +550,7 @@ class ReceiptManager:
         Returns:
             list[tuple[int, int]]: [(year, month), ...]
         """
-        results: set[tuple[int, int]] = set()
-
-        if not output_csv_dir.exists():
-            return []
-
-        for year_dir in output_csv_dir.iterdir():
-            if not year_dir.is_dir():
-                continue
-
-            try:
-                year = int(year_dir.name)
-            except ValueError:
-                continue
-
-            for csv_file in year_dir.glob("*_items.csv"):
-                m = re.match(r"(\d{6})_items\.csv", csv_file.name)
-                if not m:
-                    continue
-
-                yyyymm = m.group(1)
-                month = int(yyyymm[4:6])
-                results.add((year, month))
-
-        return sorted(results)
+        return list(receipt_store.scan_monthly_csv_year_months(output_csv_dir))
 
     def import_from_cloud(self, cloud_inbox_dir: Path, cloud_error_dir: Path,) -> int:
         """
@@ -408,7 +579,7 @@ class ReceiptManager:
         Returns:
             None
         """
-        log_mod.info("RELOAD RECEIPT IMAGES")
+        log.info("RELOAD RECEIPT IMAGES")
         self._receipt_images = receipt_store.load_receipt_image(
             input_dir=self._input_dir,
             error_dir=self._error_dir,
@@ -435,7 +606,7 @@ class ReceiptManager:
         Returns:
             Path: 生成したグラフPNGのパス
         """
-        log_mod.info(f"GENERATE MONTHLY GRAPH START: {year}-{month:02d}")
+        log.info(f"GENERATE MONTHLY GRAPH START: {year}-{month:02d}")
 
         graph_path = receipt_grapher.generate_monthly_category_bar_graph(
             csv_root=output_csv_dir,
@@ -444,7 +615,7 @@ class ReceiptManager:
             month=month,
         )
 
-        log_mod.info(f"GENERATE MONTHLY GRAPH END: {graph_path.name}")
+        log.info(f"GENERATE MONTHLY GRAPH END: {graph_path.name}")
         return graph_path
 
     def generate_annual_graph(
@@ -468,7 +639,7 @@ class ReceiptManager:
         Returns:
             Path: 生成したグラフPNGのパス
         """
-        log_mod.info(f"GENERATE ANNUAL GRAPH START: {year}")
+        log.info(f"GENERATE ANNUAL GRAPH START: {year}")
 
         graph_path = receipt_grapher.generate_annual_category_bar_graph(
             csv_root=output_csv_dir,
@@ -476,7 +647,7 @@ class ReceiptManager:
             year=year,
         )
 
-        log_mod.info(f"GENERATE ANNUAL GRAPH END: {graph_path.name}")
+        log.info(f"GENERATE ANNUAL GRAPH END: {graph_path.name}")
         return graph_path
 
     def generate_monthly_ai_summary(
@@ -499,7 +670,7 @@ class ReceiptManager:
         Returns:
             str: AI生成サマリー（失敗時は空文字）
         """
-        log_mod.info(f"GENERATE MONTHLY AI SUMMARY START: {year}-{month:02d}")
+        log.info(f"GENERATE MONTHLY AI SUMMARY START: {year}-{month:02d}")
 
         try:
             # ---- 集計 ----
@@ -510,7 +681,7 @@ class ReceiptManager:
             )
 
             if not current_totals:
-                log_mod.info("NO DATA FOR CURRENT MONTH SUMMARY")
+                log.info("NO DATA FOR CURRENT MONTH SUMMARY")
                 return ""
 
             prev_year, prev_month = self._get_previous_year_month(year, month)
@@ -530,24 +701,45 @@ class ReceiptManager:
                 prev_totals=prev_totals,
             )
 
-            log_mod.debug(f"MONTHLY AI SUMMARY USER PROMPT:\n{user_prompt}")
+            if log.is_debug_enabled():
+                log.debug(f"MONTHLY AI SUMMARY USER PROMPT:\n{user_prompt}")
 
             # ---- AI 呼び出し ----
+            # ※応答は JSON として検証できてからキャッシュに登録する
             response = generative_ai.request_generative_ai(
                 system_prompt=self._monthly_expense_summary_prompt,
                 user_prompt=user_prompt,
+                cache=False,
             )
 
             raw_content = response.content.strip()
 
             # ---- JSONパース ----
             try:
-                summary_json = json.loads(raw_content)
+                summary_json = self._loads_json(raw_content)
             except json.JSONDecodeError as e:
-                log_mod.error(f"FAILED TO PARSE AI SUMMARY JSON: ({e})")
-                log_mod.error(f"RAW AI RESPONSE:\n{raw_content}")
+                log.error(f"FAILED TO PARSE AI SUMMARY JSON: ({e})")
+                log.error(f"RAW AI RESPONSE:\n{raw_content}")
+                return ""
+
+            if not isinstance(summary_json, dict):
+                log.error("AI SUMMARY JSON IS NOT AN OBJECT")
+                log.error(f"RAW AI RESPONSE:\n{raw_content}")
                 return ""
 
+            # ---- キャッシュ登録（必須キーが揃っている応答のみ）----
+            missing_keys = [key for key in self.MONTHLY_SUMMARY_KEYS if key not in summary_json]
+            if missing_keys:
+                log.error(f"AI SUMMARY JSON MISSING KEYS: {missing_keys}")
+            else:
+                generative_ai.cache_response(
+                    system_prompt=self._monthly_expense_summary_prompt,
+                    user_prompt=user_prompt,
+                    max_tokens=generative_ai.DEFAULT_MAX_TOKENS,
+                    temperature=generative_ai.DEFAULT_TEMPERATURE,
+                    content=response.content,
+                )
+
             # ---- 必須キー取得（安全）----
             monthly_summary = summary_json.get("monthly_summary", "")
             monthly_characteristics = summary_json.get("monthly_characteristics", "")
@@ -569,12 +761,12 @@ class ReceiptManager:
             summary_path = year_dir / f"{year}{month:02d}_summary.txt"
             summary_path.write_text(summary_text, encoding="utf-8")
 
-            log_mod.info(f"MONTHLY SUMMARY SAVED: {summary_path}")
+            log.info(f"MONTHLY SUMMARY SAVED: {summary_path}")
 
             return summary_text
 
         except Exception as e:
-            log_mod.error(f"FAILED TO GENERATE MONTHLY AI SUMMARY: ({e})")
+            log.error(f"FAILED TO GENERATE MONTHLY AI SUMMARY: ({e})")
             return ""
 
     # ==================================================
@@ -600,85 +792,364 @@ class ReceiptManager:
         """
         try:
             # ------------------------------
-            # user_prompt 作成
+            # AI 呼び出し（ストリーミング）
+            # ※応答は件数チェックまで通過してからキャッシュに登録する
             # ------------------------------
-            user_prompt: str = json.dumps(
-                {
-                    "items": [
-                        {
-                            "name": item.name,
-                            "total_price": item.total_price_yen,
-                            "unit_price": item.unit_price_yen,
-                            "quantity": item.quantity,
-                        }
-                        for item in result.items
-                    ]
-                },
-                ensure_ascii=False,
-                indent=2,
+            user_prompt: str = self._build_tags_user_prompt(result)
+            max_tokens: int = self._tagging_max_tokens(result)
+            chunks = generative_ai.stream_generative_ai(
+                system_prompt=self._receipt_tags_prompt,
+                user_prompt=user_prompt,
+                max_tokens=max_tokens,
+                temperature=self.TAGGING_TEMPERATURE,
+                cache=False,
             )
 
-            # ------------------------------
-            # AI 呼び出し
-            # ------------------------------
-            response: generative_ai.GenerativeAIResponse = (
-                generative_ai.request_generative_ai(
-                    system_prompt=self._receipt_tags_prompt,
-                    user_prompt=user_prompt,
-                )
-            )
+            # 受信した断片（検証後のキャッシュ登録用）
+            parts: list[str] = []
 
-            raw_content = response.content.strip()
+            def _record(stream: Iterator[str]) -> Iterator[str]:
+                for part in stream:
+                    parts.append(part)
+                    yield part
 
             # ------------------------------
-            # JSON パース
+            # タグ反映（応答全体を待たず、items の要素を受信した順に反映）
             # ------------------------------
-            try:
-                parsed = json.loads(raw_content)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"FAILED TO PARSE TAGGING JSON: {e}")
+            n_ai_items: int = 0
+            for item_json in generative_ai.iter_json_objects(_record(chunks), depth=2):
+                try:
+                    ai_item = self._loads_json(item_json)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"FAILED TO PARSE TAGGING JSON: {e}")
 
-            ai_items = parsed.get("items")
-            if not isinstance(ai_items, list):
-                raise ValueError("AI RESPONSE DOES NOT CONTAIN 'items' ARRAY")
+                self._apply_ai_item(result, ai_item)
+                n_ai_items += 1
 
             # ------------------------------
             # 件数チェック（最重要）
             # ------------------------------
-            if len(ai_items) != len(result.items):
+            if n_ai_items != len(result.items):
                 raise ValueError(
-                    f"ITEM COUNT MISMATCH: input={len(result.items)}, output={len(ai_items)}"
+                    f"ITEM COUNT MISMATCH: input={len(result.items)}, output={n_ai_items}"
                 )
 
+            generative_ai.cache_response(
+                system_prompt=self._receipt_tags_prompt,
+                user_prompt=user_prompt,
+                max_tokens=max_tokens,
+                temperature=self.TAGGING_TEMPERATURE,
+                content="".join(parts),
+            )
+
+            self._debug_tagging_result(result)
+
+        except Exception as e:
+            log.error(f"ITEM TAGGING FAILED: ({e})")
+            self._set_unknown_tags(result)
+
+    def _judge_receipts_tags_by_ai_batch(
+        self,
+        results: list[type_def.ReceiptResult],
+    ) -> None:
+        """
+        複数レシートのタグ判定をまとめて生成AIに依頼する。
+
+        - 複数レシートを {"receipts": [{"id": i, "items": [...]}, ...]} として1回で送信する
+        - item 総数が TAGGING_MAX_ITEMS_PER_BATCH、または応答の最大トークン数が TAGGING_MAX_TOKENS_LIMIT を超える場合は分割して送信する
+        - 応答に含まれない・件数が一致しないレシートは1件ずつ再判定する
+
+        Args:
+            results (list[ReceiptResult]): パース済みレシート解析結果一覧
+
+        Returns:
+            None
+        """
+        for chunk in self._split_tagging_batches(results):
+            # 1件のみ、または複数レシート用プロンプト未設定の場合は1件ずつ判定
+            if len(chunk) == 1 or not self._receipt_tags_batch_prompt:
+                for result in chunk:
+                    self._judge_receipt_tags_by_ai(result)
+                continue
+
             # ------------------------------
-            # name -> ReceiptItem マップ
+            # user_prompt 作成（id はチャンク内の位置）
             # ------------------------------
-            item_map = {item.name: item for item in result.items}
+            user_prompt: str = self._dumps_json(
+                {
+                    "receipts": [
+                        {"id": i, "items": self._build_tags_items(result)}
+                        for i, result in enumerate(chunk)
+                    ]
+                }
+            )
 
             # ------------------------------
-            # タグ反映
+            # AI 呼び出し
             # ------------------------------
-            for ai_item in ai_items:
-                name = ai_item.get("name", "")
-                tag_raw = ai_item.get("tag", "")
-                reason = ai_item.get("reason", "")
-
-                item = item_map.get(name)
-                if not item:
-                    log_mod.error(f"UNKNOWN ITEM NAME FROM AI: {name}")
-                    continue
+            # ※応答は全レシートのタグを反映できた場合のみキャッシュに登録する
+            ai_receipts: dict[int, Any] = {}
+            max_tokens: int = min(
+                sum(self._tagging_max_tokens(result) for result in chunk),
+                self.TAGGING_MAX_TOKENS_LIMIT,
+            )
+            response: generative_ai.GenerativeAIResponse = generative_ai.GenerativeAIResponse()
+            try:
+                response = generative_ai.request_generative_ai(
+                    system_prompt=self._receipt_tags_batch_prompt,
+                    user_prompt=user_prompt,
+                    max_tokens=max_tokens,
+                    temperature=self.TAGGING_TEMPERATURE,
+                    cache=False,
+                )
 
-                # タグ変換(AIタグ -> ReceiptTag)
-                tag_enum = self.AI_TAG_TO_RECEIPT_TAG.get(tag_raw)
-                if tag_enum is None:
-                    log_mod.error(f"UNKNOWN AI TAG: {tag_raw}")
-                    item.tag = type_def.ReceiptTag.UNKNOWN
-                else:
-                    item.tag = tag_enum
+                try:
+                    parsed = self._loads_json(response.content.strip())
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"FAILED TO PARSE BATCH TAGGING JSON: {e}")
+
+                receipts = parsed.get("receipts") if isinstance(parsed, dict) else None
+                if not isinstance(receipts, list):
+                    raise ValueError("AI RESPONSE DOES NOT CONTAIN 'receipts' ARRAY")
+
+                ai_receipts = {
+                    r.get("id"): r.get("items")
+                    for r in receipts
+                    if isinstance(r, dict)
+                }
+
+            except Exception as e:
+                log.error(f"BATCH ITEM TAGGING FAILED: ({e})")
+
+            # ------------------------------
+            # タグ反映（失敗したレシートは1件ずつ再判定）
+            # ------------------------------
+            all_applied: bool = bool(ai_receipts)
+            for i, result in enumerate(chunk):
+                try:
+                    self._apply_ai_items(result, ai_receipts.get(i))
+                except Exception as e:
+                    log.error(f"BATCH ITEM TAGGING FAILED: {result.source_file} ({e}) -> RETRY SINGLE")
+                    all_applied = False
+                    self._judge_receipt_tags_by_ai(result)
+
+            if all_applied:
+                generative_ai.cache_response(
+                    system_prompt=self._receipt_tags_batch_prompt,
+                    user_prompt=user_prompt,
+                    max_tokens=max_tokens,
+                    temperature=self.TAGGING_TEMPERATURE,
+                    content=response.content,
+                )
+
+    def _split_tagging_batches(
+        self,
+        results: list[type_def.ReceiptResult],
+    ) -> list[list[type_def.ReceiptResult]]:
+        """
+        item 総数が TAGGING_MAX_ITEMS_PER_BATCH、応答の最大トークン数の合計が
+        TAGGING_MAX_TOKENS_LIMIT を超えないようにレシートを分割する
+        （レシートごとに JSON の外枠分のトークンが加わるため、item 数だけでなくトークン数でも判定する）
+
+        Args:
+            results (list[ReceiptResult]): パース済みレシート解析結果一覧
+
+        Returns:
+            list[list[ReceiptResult]]: 分割したレシート一覧
+        """
+        chunks: list[list[type_def.ReceiptResult]] = []
+        chunk: list[type_def.ReceiptResult] = []
+        chunk_items: int = 0
+        chunk_tokens: int = 0
+
+        for result in results:
+            n_items: int = len(result.items)
+            n_tokens: int = self._tagging_max_tokens(result)
+            if chunk and (
+                chunk_items + n_items > self.TAGGING_MAX_ITEMS_PER_BATCH
+                or chunk_tokens + n_tokens > self.TAGGING_MAX_TOKENS_LIMIT
+            ):
+                chunks.append(chunk)
+                chunk, chunk_items, chunk_tokens = [], 0, 0
+
+            chunk.append(result)
+            chunk_items += n_items
+            chunk_tokens += n_tokens
+
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    def _build_tags_items(self, result: type_def.ReceiptResult) -> list[dict[str, Any]]:
+        """
+        タグ判定用に送信する items を作成する（idx は result.items 内の位置）
+
+        Args:
+            result (ReceiptResult): パース済みレシート解析結果
+
+        Returns:
+            list[dict[str, Any]]: items
+        """
+        return [
+            {
+                "idx": idx,
+                "name": item.name,
+                "total_price": item.total_price_yen,
+                "unit_price": item.unit_price_yen,
+                "quantity": item.quantity,
+            }
+            for idx, item in enumerate(result.items)
+        ]
+
+    def _build_tags_user_prompt(self, result: type_def.ReceiptResult) -> str:
+        """
+        タグ判定用の user_prompt を作成する
+
+        Args:
+            result (ReceiptResult): パース済みレシート解析結果
+
+        Returns:
+            str: user_prompt（JSON文字列）
+        """
+        return self._dumps_json({"items": self._build_tags_items(result)})
+
+    @staticmethod
+    def _dumps_json(data: Any) -> str:
+        """
+        生成AIへ送信する JSON 文字列を作成する（インデントなしで送信トークンを抑える）
+
+        Args:
+            data (Any): 送信データ
+
+        Returns:
+            str: JSON文字列
+        """
+        if orjson is not None:
+            return orjson.dumps(data).decode("utf-8")
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+    @staticmethod
+    def _loads_json(text: str) -> Any:
+        """
+        生成AIの応答(JSON文字列)をパースする
+
+        Args:
+            text (str): JSON文字列
+
+        Returns:
+            Any: パース結果
+
+        Raises:
+            json.JSONDecodeError: JSON として不正な場合（orjson.JSONDecodeError も同クラスの派生）
+        """
+        if orjson is not None:
+            return orjson.loads(text)
+        return json.loads(text)
+
+    def _tagging_max_tokens(self, result: type_def.ReceiptResult) -> int:
+        """
+        タグ判定の応答に必要な最大トークン数を item 数から求める（TAGGING_MAX_TOKENS_LIMIT が上限）
 
-                item.tag_reason = reason or ""
+        Args:
+            result (ReceiptResult): パース済みレシート解析結果
 
-            log_mod.debug(
+        Returns:
+            int: 応答の最大トークン数
+        """
+        return min(
+            self.TAGGING_MAX_TOKENS_BASE + self.TAGGING_MAX_TOKENS_PER_ITEM * len(result.items),
+            self.TAGGING_MAX_TOKENS_LIMIT,
+        )
+
+    def _apply_ai_items(self, result: type_def.ReceiptResult, ai_items: Any) -> None:
+        """
+        生成AIが判定した items を result.items に反映する
+
+        Args:
+            result (ReceiptResult): パース済みレシート解析結果
+            ai_items (Any): 生成AIの応答に含まれる items
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: items が不正な場合
+        """
+        if not isinstance(ai_items, list):
+            raise ValueError("AI RESPONSE DOES NOT CONTAIN 'items' ARRAY")
+
+        # ------------------------------
+        # 件数チェック（最重要）
+        # ------------------------------
+        if len(ai_items) != len(result.items):
+            raise ValueError(
+                f"ITEM COUNT MISMATCH: input={len(result.items)}, output={len(ai_items)}"
+            )
+
+        # ------------------------------
+        # タグ反映
+        # ------------------------------
+        for ai_item in ai_items:
+            self._apply_ai_item(result, ai_item)
+
+        self._debug_tagging_result(result)
+
+    def _apply_ai_item(self, result: type_def.ReceiptResult, ai_item: Any) -> None:
+        """
+        生成AIが判定した item 1件分を result.items に反映する
+
+        - idx（result.items 内の位置）で対応付け、idx が無い場合のみ name で照合する
+
+        Args:
+            result (ReceiptResult): パース済みレシート解析結果
+            ai_item (Any): 生成AIの応答に含まれる item
+
+        Returns:
+            None
+        """
+        if not isinstance(ai_item, dict):
+            log.error(f"INVALID ITEM FROM AI: {ai_item}")
+            return
+
+        idx = ai_item.get("idx")
+        tag_raw = ai_item.get("tag", "")
+        reason = ai_item.get("reason", "")
+
+        items: list[type_def.ReceiptItem] = result.items
+        if type(idx) is int and 0 <= idx < len(items):
+            item = items[idx]
+        else:
+            name = ai_item.get("name", "")
+            item = next((i for i in items if i.name == name), None)
+            if not item:
+                log.error(f"UNKNOWN ITEM FROM AI: idx={idx}, name={name}")
+                return
+
+        # タグ変換(AIタグ -> ReceiptTag)
+        tag_enum = (
+            self._AI_TAG_CI.get(tag_raw.strip().lower())
+            if isinstance(tag_raw, str) else None
+        )
+        if tag_enum is None:
+            log.error(f"UNKNOWN AI TAG: {tag_raw}")
+            item.tag = type_def.ReceiptTag.UNKNOWN
+        else:
+            item.tag = tag_enum
+
+        item.tag_reason = reason or ""
+
+    def _debug_tagging_result(self, result: type_def.ReceiptResult) -> None:
+        """
+        タグ判定結果を DEBUG ログに出力する
+
+        Args:
+            result (ReceiptResult): タグ判定済みのレシート解析結果
+
+        Returns:
+            None
+        """
+        if log.is_debug_enabled():
+            log.debug(
                 "ITEM TAGGING RESULT: "
                 + ", ".join(
                     f"{i.name}={i.tag.value if i.tag else 'None'}"
@@ -686,13 +1157,317 @@ class ReceiptManager:
                 )
             )
 
+    def _set_unknown_tags(self, result: type_def.ReceiptResult) -> None:
+        """
+        フェイルセーフ：全 item のタグを UNKNOWN にする
+
+        Args:
+            result (ReceiptResult): パース済みレシート解析結果
+
+        Returns:
+            None
+        """
+        for item in result.items:
+            item.tag = type_def.ReceiptTag.UNKNOWN
+            item.tag_reason = ""
+
+    # ==================================================
+    # Private Methods（保存・移動用）
+    # ==================================================
+    def _store_receipt(
+        self,
+        src: Path,
+        result: type_def.ReceiptResult,
+        *,
+        content_hash: str,
+        invalid_filename_table: dict[int, str],
+        output_json_dir: Path,
+        output_csv_dir: Path,
+        processed_dir: Path,
+        error_dir: Path,
+    ) -> type_def.ReceiptProcessResult:
+        """
+        タグ判定済みのレシートを保存し、processed へ移動する。
+        （並列実行時のファイル名衝突を防ぐため排他）
+
+        Args:
+            src (Path): レシート画像ファイルパス
+            result (ReceiptResult): タグ判定済みのレシート解析結果
+            content_hash (str): レシート画像の内容ハッシュ（空文字の場合は台帳に登録しない）
+            invalid_filename_table (dict[int, str]): ファイル名使用不可文字の置換テーブル（str.maketrans）
+            output_json_dir (Path): JSON 出力ディレクトリ
+            output_csv_dir (Path): CSV 出力ディレクトリ
+            processed_dir (Path): processed ディレクトリ
+            error_dir (Path): error ディレクトリ
+
+        Returns:
+            ReceiptProcessResult: 処理結果
+        """
+        with self._store_lock:
+            prepared = self._prepare_store(
+                src,
+                result,
+                invalid_filename_table=invalid_filename_table,
+                output_json_dir=output_json_dir,
+                output_csv_dir=output_csv_dir,
+                error_dir=error_dir,
+            )
+            if prepared is None:
+                return type_def.ReceiptProcessResult.failed(self.BASENAME_FAILED_MSG)
+
+            receipt_id, saved_json, csv_path, rows = prepared
+
+            # ------------------------------
+            # CSV 追記（失敗時は JSON を削除し、画像は input に残す）
+            # ------------------------------
+            try:
+                receipt_store.append_monthly_receipt_item_csv(
+                    csv_path=csv_path,
+                    rows=rows,
+                )
+            except Exception as e:
+                msg = f"CSV APPEND FAILED: {csv_path} ({e})"
+                log.error(msg)
+                self._discard_saved_json(saved_json)
+                return type_def.ReceiptProcessResult.failed(msg)
+
+            return self._finalize_store(
+                src,
+                result,
+                receipt_id=receipt_id,
+                saved_json=saved_json,
+                content_hash=content_hash,
+                processed_dir=processed_dir,
+            )
+
+    def _prepare_store(
+        self,
+        src: Path,
+        result: type_def.ReceiptResult,
+        *,
+        invalid_filename_table: dict[int, str],
+        output_json_dir: Path,
+        output_csv_dir: Path,
+        error_dir: Path,
+    ) -> tuple[str, Path, Path, list[tuple[Any, ...]]] | None:
+        """
+        basename 生成・JSON 保存・CSV 行生成を行う（_store_lock 取得中に呼び出すこと）
+
+        Args:
+            src (Path): レシート画像ファイルパス
+            result (ReceiptResult): タグ判定済みのレシート解析結果
+            invalid_filename_table (dict[int, str]): ファイル名使用不可文字の置換テーブル（str.maketrans）
+            output_json_dir (Path): JSON 出力ディレクトリ
+            output_csv_dir (Path): CSV 出力ディレクトリ
+            error_dir (Path): error ディレクトリ
+
+        Returns:
+            tuple[str, Path, Path, list[tuple]] | None:
+                (receipt_id, 保存した JSON パス, 月別CSVパス, CSV行リスト)
+                basename 生成に失敗した場合は None（画像は error へ移動済み）
+        """
+        # ------------------------------
+        # basename 生成
+        # ------------------------------
+        receipt_id: str = receipt_store.build_base_name(
+            result,
+            invalid_filename_table,
+        )
+        if not receipt_id:
+            log.error(self.BASENAME_FAILED_MSG)
+            receipt_store.move_to_error(src, error_dir)
+            return None
+
+        # ------------------------------
+        # JSON 保存
+        # ------------------------------
+        saved_json: Path = receipt_store.save_result_json(
+            result=result,
+            base=receipt_id,
+            output_json_dir=output_json_dir,
+        )
+
+        # ------------------------------
+        # CSV 行生成
+        # ------------------------------
+        csv_path: Path = receipt_store.get_monthly_receipt_csv_path(
+            result=result,
+            output_csv_root=output_csv_dir,
+            receipt_id=receipt_id,
+        )
+
+        rows: list[tuple[Any, ...]] = receipt_store.build_receipt_summary_csv_row(
+            result=result,
+            receipt_id=receipt_id,
+            saved_json_path=saved_json,
+        )
+
+        return receipt_id, saved_json, csv_path, rows
+
+    def _finalize_store(
+        self,
+        src: Path,
+        result: type_def.ReceiptResult,
+        *,
+        receipt_id: str,
+        saved_json: Path,
+        content_hash: str,
+        processed_dir: Path,
+    ) -> type_def.ReceiptProcessResult:
+        """
+        CSV 追記済みのレシート画像を processed へ移動し、処理済み台帳へ登録する（_store_lock 取得中に呼び出すこと）
+
+        Args:
+            src (Path): レシート画像ファイルパス
+            result (ReceiptResult): タグ判定済みのレシート解析結果
+            receipt_id (str): レシートID（basename）
+            saved_json (Path): 保存した JSON パス
+            content_hash (str): レシート画像の内容ハッシュ（空文字の場合は台帳に登録しない）
+            processed_dir (Path): processed ディレクトリ
+
+        Returns:
+            ReceiptProcessResult: 処理結果（成功）
+        """
+        # ------------------------------
+        # processed へ移動（ローカルのみ）
+        # ------------------------------
+        receipt_store.move_to_processed(
+            src=src,
+            base=receipt_id,
+            processed_dir=processed_dir,
+        )
+
+        # ------------------------------
+        # 処理済み台帳へ登録
+        # ------------------------------
+        if self._ledger is not None and content_hash:
+            year_month: str = receipt_id[:6]
+            self._ledger.add(
+                content_hash,
+                year=int(year_month[:4]) if year_month.isdigit() else None,
+                month=int(year_month[4:]) if year_month.isdigit() else None,
+                json_path=saved_json,
+            )
+
+        log.info(f"RECEIPT PROCESS END: {receipt_id}")
+        return type_def.ReceiptProcessResult.success(result)
+
+    def _flush_pending_receipts(
+        self,
+        pending_by_csv: dict[Path, list[tuple[int, type_def.ReceiptResult, str, Path, list[tuple[Any, ...]]]]],
+        procs: list[type_def.ReceiptProcessResult | None],
+        *,
+        srcs: list[Path],
+        content_hashes: list[str],
+        processed_dir: Path,
+    ) -> None:
+        """
+        保存待ちのレシートを月別CSVごとに1回で追記し、追記できたレシートのみ processed 移動・台帳登録する。
+
+        - CSV 追記に失敗した月のレシートは失敗扱いとし、画像は input に残す（保存済みの JSON は削除する）
+        - 次回実行時に重複扱いされず、再処理されるようにするため
+
+        Args:
+            pending_by_csv (dict[Path, list[tuple]]):
+                {月別CSVパス: [(srcs のインデックス, 解析結果, receipt_id, 保存した JSON パス, CSV行リスト)]}
+            procs (list[ReceiptProcessResult | None]): 処理結果一覧（srcs と同じ順序。本関数で更新する）
+            srcs (list[Path]): レシート画像ファイルパス一覧
+            content_hashes (list[str]): レシート画像の内容ハッシュ一覧（srcs と同じ順序）
+            processed_dir (Path): processed ディレクトリ
+
+        Returns:
+            None
+        """
+        with self._store_lock:
+            for csv_path, pending in pending_by_csv.items():
+                try:
+                    receipt_store.append_monthly_receipt_item_csv(
+                        csv_path=csv_path,
+                        rows=[row for *_, rows in pending for row in rows],
+                    )
+                except Exception as e:
+                    msg = f"CSV APPEND FAILED: {csv_path} ({e})"
+                    log.error(msg)
+                    for i, _, _, saved_json, _ in pending:
+                        self._discard_saved_json(saved_json)
+                        procs[i] = type_def.ReceiptProcessResult.failed(msg)
+                    continue
+
+                for i, result, receipt_id, saved_json, _ in pending:
+                    try:
+                        procs[i] = self._finalize_store(
+                            srcs[i],
+                            result,
+                            receipt_id=receipt_id,
+                            saved_json=saved_json,
+                            content_hash=content_hashes[i],
+                            processed_dir=processed_dir,
+                        )
+                    except Exception as e:
+                        log.error(f"RECEIPT ANALYZE FAILED: {srcs[i].name} ({e})")
+                        procs[i] = type_def.ReceiptProcessResult.failed(str(e))
+
+    def _discard_saved_json(self, saved_json: Path) -> None:
+        """
+        CSV 追記に失敗したレシートの保存済み JSON を削除する
+
+        - 次回実行時に重複扱いされず、再処理されるようにするため
+
+        Args:
+            saved_json (Path): 保存した JSON パス
+
+        Returns:
+            None
+        """
+        try:
+            saved_json.unlink(missing_ok=True)
+        except OSError as e:
+            log.error(f"FAILED TO REMOVE JSON: {saved_json} ({e})")
+
+    def _skip_if_duplicate(
+        self,
+        src: Path,
+        processed_dir: Path,
+    ) -> tuple[str, type_def.ReceiptProcessResult | None]:
+        """
+        処理済み台帳と照合し、処理済みの画像であれば processed へ移動する。
+
+        Args:
+            src (Path): レシート画像ファイルパス
+            processed_dir (Path): processed ディレクトリ
+
+        Returns:
+            tuple[str, ReceiptProcessResult | None]:
+                (内容ハッシュ, 重複の場合はスキップ結果 / 未処理の場合は None)
+        """
+        if self._ledger is None:
+            return "", None
+
+        try:
+            content_hash: str = self._ledger.compute_hash(src)
+            json_path: str | None = self._ledger.find(content_hash)
         except Exception as e:
-            log_mod.error(f"ITEM TAGGING FAILED: ({e})")
+            log.error(f"RECEIPT LEDGER LOOKUP FAILED: {src.name} ({e})")
+            return "", None
 
-            # フェイルセーフ：全 UNKNOWN
-            for item in result.items:
-                item.tag = type_def.ReceiptTag.UNKNOWN
-                item.tag_reason = ""
+        if json_path is None:
+            return content_hash, None
+
+        # 保存済み JSON と同じ basename で processed へ移動
+        try:
+            with self._store_lock:
+                receipt_store.move_to_processed(
+                    src=src,
+                    base=Path(json_path).stem if json_path else src.stem,
+                    processed_dir=processed_dir,
+                )
+        except Exception as e:
+            msg = f"DUPLICATE MOVE FAILED: {src.name} ({e})"
+            log.error(msg)
+            return content_hash, type_def.ReceiptProcessResult.failed(msg)
+
+        log.info(f"DUPLICATE SKIPPED: {src.name} ({json_path})")
+        return content_hash, type_def.ReceiptProcessResult.skipped_duplicate()
 
     def _build_monthly_comparison_user_prompt(
         self,
@@ -710,30 +1485,32 @@ class ReceiptManager:
         Returns:
             str: user_prompt
         """
-        lines: list[str] = []
+        # 行リストを作らず、1つのバッファへ直接書き込む（各行の前に改行を書く）
+        buf = io.StringIO()
 
         # ---- This Month ----
-        lines.append(f"[This Month ({year}-{month:02d})]")
-        lines.extend(
-            self._build_current_month_lines(
-                year=year,
-                month=month,
-                current_totals=current_totals,
-            )
+        buf.write(f"[This Month ({year}-{month:02d})]")
+        self._write_current_month_lines(
+            buf,
+            year=year,
+            month=month,
+            current_totals=current_totals,
         )
 
         # ---- Comparison ----
-        comparison_lines = self._build_monthly_comparison_lines(
+        comparison_buf = io.StringIO()
+        self._write_monthly_comparison_lines(
+            comparison_buf,
             current_totals=current_totals,
             prev_totals=prev_totals,
         )
 
-        if comparison_lines:
-            lines.append("")
-            lines.append(f"[Comparison with Previous Month ({prev_year}-{prev_month:02d})]")
-            lines.extend(comparison_lines)
+        if comparison_buf.tell() > 0:
+            buf.write("\n")
+            buf.write(f"\n[Comparison with Previous Month ({prev_year}-{prev_month:02d})]")
+            buf.write(comparison_buf.getvalue())
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def _aggregate_monthly_csv(
         self,
@@ -745,6 +1522,9 @@ class ReceiptManager:
         """
         月次CSVからカテゴリ別支出額を集計する。
 
+        - 同じ年の月次CSVをまとめて集計した結果（_aggregate_year_csvs）から取り出す
+          （返却値はキャッシュと共有のため、呼び出し側で変更しないこと）
+
         Args:
             year (int): 年
             month (int): 月
@@ -753,35 +1533,56 @@ class ReceiptManager:
         Returns:
             dict[str, int]: {category: total_amount}
         """
-        csv_path = (
-            output_csv_dir
-            / f"{year}"
-            / f"{year}{month:02d}_items.csv"
-        )
+        return self._aggregate_year_csvs(year=year, output_csv_dir=output_csv_dir).get(month, {})
 
-        if not csv_path.exists():
-            return {}
+    def _aggregate_year_csvs(
+        self,
+        *,
+        year: int,
+        output_csv_dir: Path,
+    ) -> dict[int, dict[str, int]]:
+        """
+        指定した年の月次CSVをまとめて読み込み、月別・カテゴリ別支出額を集計する。
 
-        totals: dict[str, int] = {}
+        - 各月次CSVの更新時刻・サイズが前回集計時と同じ場合はキャッシュを返す
+        - 月次サマリーを並列生成する際に同じ年を重複して集計しないよう、集計中は排他する
 
-        with csv_path.open("r", encoding="utf-8", newline="") as f:
-            reader = csv.DictReader(f)
+        Args:
+            year (int): 年
+            output_csv_dir (Path): CSV出力ルートディレクトリ
 
-            for row in reader:
-                tag = row.get("item_tag")
-                price_raw = row.get("total_price_yen")
+        Returns:
+            dict[int, dict[str, int]]: {month: {category: total_amount}}
+        """
+        year_dir = output_csv_dir / f"{year}"
+        if not year_dir.exists():
+            return {}
 
-                if not tag or not price_raw:
+        csv_paths: dict[int, Path] = {}
+        stats: list[tuple[int, int, int]] = []
+        with os.scandir(year_dir) as it:
+            for entry in it:
+                name: str = entry.name
+                if name[6:] != "_items.csv" or not name[:6].isdigit() or name[:4] != f"{year}":
                     continue
+                month: int = int(name[4:6])
+                st = entry.stat()
+                csv_paths[month] = Path(entry.path)
+                stats.append((month, st.st_mtime_ns, st.st_size))
 
-                try:
-                    price = int(price_raw)
-                except ValueError:
-                    continue
+        if not csv_paths:
+            return {}
+
+        key: tuple[tuple[int, int, int], ...] = tuple(sorted(stats))
+        with self._year_totals_lock:
+            cached = self._year_totals_cache.get(year_dir)
+            if cached is not None and cached[0] == key:
+                return cached[1]
 
-                totals[tag] = totals.get(tag, 0) + price
+            totals_by_month: dict[int, dict[str, int]] = receipt_store.aggregate_category_csvs(csv_paths)
 
-        return totals
+            self._year_totals_cache[year_dir] = (key, totals_by_month)
+            return totals_by_month
 
     def _get_previous_year_month(self, year: int, month: int) -> tuple[int, int]:
         """
@@ -798,32 +1599,36 @@ class ReceiptManager:
             return year - 1, 12
         return year, month - 1
 
-    def _build_current_month_lines(
+    def _write_current_month_lines(
         self,
+        buf: TextIO,
         *,
         year: int,
         month: int,
         current_totals: dict[str, int],
-    ) -> list[str]:
+    ) -> None:
         """
-        今月の支出一覧文を生成する。
+        今月の支出一覧文を書き込む（各行の前に改行を書く）。
 
         Args:
+            buf (TextIO): 書き込み先バッファ
             year (int): 年
             month (int): 月
             current_totals (dict[str, int]): {category: total_amount}
 
         Returns:
-            list[str]: 支出一覧文行リスト
+            None
         """
-        lines: list[str] = []
+        write = buf.write
+        fmt_current_month = self.FORMAT_CURRENT_MONTH.format
 
         for tag, amount in sorted(current_totals.items()):
             if amount <= 0:
                 continue
 
-            lines.append(
-                self.FORMAT_CURRENT_MONTH.format(
+            write(
+                "\n"
+                + fmt_current_month(
                     year=year,
                     month=month,
                     tag=self._tag_to_en(tag),
@@ -831,82 +1636,66 @@ class ReceiptManager:
                 )
             )
 
-        return lines
-
-    def _build_monthly_comparison_lines(
+    def _write_monthly_comparison_lines(
         self,
+        buf: TextIO,
         *,
         current_totals: dict[str, int],
         prev_totals: dict[str, int],
-    ) -> list[str]:
+    ) -> None:
         """
-        今月と先月の支出を比較し、5パターンの比較文を生成する。
+        今月と先月の支出を比較し、5パターンの比較文を書き込む（各行の前に改行を書く）。
 
         Args:
+            buf (TextIO): 書き込み先バッファ
             current_totals (dict[str, int]): 今月の {category: total_amount}
             prev_totals (dict[str, int]): 先月の {category: total_amount}
 
         Returns:
-            list[str]: 比較文行リスト
+            None
         """
-        lines: list[str] = []
-
-        all_tags = set(current_totals.keys()) | set(prev_totals.keys())
+        # dict の keys ビュー同士の和集合で、中間の set を作らずに全タグを得る
+        all_tags = current_totals.keys() | prev_totals.keys()
+
+        # ループ内の属性参照を減らすためローカルに束縛する
+        current_get = current_totals.get
+        prev_get = prev_totals.get
+        tag_to_en = self._tag_to_en
+        write = buf.write
+        fmt_new = self.FORMAT_NEW.format
+        fmt_increase = self.FORMAT_INCREASE.format
+        fmt_decrease = self.FORMAT_DECREASE.format
+        fmt_disappeared = self.FORMAT_DISAPPEARED.format
+        fmt_no_change = self.FORMAT_NO_CHANGE.format
 
         for tag in sorted(all_tags):
-            current = current_totals.get(tag, 0)
-            prev = prev_totals.get(tag, 0)
+            current = current_get(tag, 0)
+            prev = prev_get(tag, 0)
 
             # 両方0円は出さない
             if current == 0 and prev == 0:
                 continue
 
             # ここで英語タグに変換
-            tag_en = self._tag_to_en(tag)
+            tag_en = tag_to_en(tag)
 
             # ① 今月 > 先月（増加）
             if current > prev:
                 if prev == 0:
-                    lines.append(
-                        self.FORMAT_NEW.format(
-                            tag=tag_en,
-                            amount=current,
-                        )
-                    )
+                    write("\n" + fmt_new(tag=tag_en, amount=current))
                 else:
-                    lines.append(
-                        self.FORMAT_INCREASE.format(
-                            tag=tag_en,
-                            diff=current - prev,
-                        )
-                    )
+                    write("\n" + fmt_increase(tag=tag_en, diff=current - prev))
 
             # ② 今月 < 先月（減少）
             elif current < prev:
                 if current == 0:
-                    lines.append(
-                        self.FORMAT_DISAPPEARED.format(
-                            tag=tag_en,
-                        )
-                    )
+                    write("\n" + fmt_disappeared(tag=tag_en))
                 else:
-                    lines.append(
-                        self.FORMAT_DECREASE.format(
-                            tag=tag_en,
-                            diff=prev - current,
-                        )
-                    )
+                    write("\n" + fmt_decrease(tag=tag_en, diff=prev - current))
 
             # ⑤ 今月 = 先月（変化なし）
             else:
-                lines.append(
-                    self.FORMAT_NO_CHANGE.format(
-                        tag=tag_en,
-                        amount=current,
-                    )
-                )
-
-        return lines
+                write("\n" + fmt_no_change(tag=tag_en, amount=current))
 
     def _tag_to_en(self, tag: str) -> str:
         """
@@ -918,9 +1707,4 @@ class ReceiptManager:
         Returns:
             str: 英語タグ文字列
         """
-        try:
-            tag_enum = type_def.ReceiptTag(tag)
-        except ValueError:
-            return "unknown"
-
-        return self.RECEIPT_TAG_EN_MAP.get(tag_enum, "unknown")
+        return self.RECEIPT_TAG_EN_MAP.get(tag, "unknown")
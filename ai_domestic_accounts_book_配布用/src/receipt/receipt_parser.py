@@ -12,6 +12,26 @@ import re
 from ..tool import logger_module as log_mod
 from . import type_def
 
+# モジュール用ロガー（呼び出し元ファイル名を保持）
+log = log_mod.get_logger(__file__)
+
+
+# ==================================================
+# 定数定義
+# ==================================================
+DATE_RE: re.Pattern[str] = re.compile(r"(\d{4})\D+(\d{1,2})\D+(\d{1,2})")              # 日付（YYYY?MM?DD）
+TIME_RE: re.Pattern[str] = re.compile(r"(\d{1,2})\D+(\d{1,2})(?:\D+(\d{1,2}))?")       # 時刻（HH?MM[?SS]）
+# レシート本文の合計金額（「金額…円」「合計…」「¥…」を1回の走査で検出）
+# ※各パターンを先読みで包み、重なり合う位置の候補も取りこぼさないようにする
+TOTAL_TEXT_RE: re.Pattern[str] = re.compile(
+    r"(?=金額[:：]?\s*(?P<amount>[0-9,]+)\s*円)"
+    r"|(?=合計[:：]?\s*¥?\s*(?P<total>[0-9,]+))"
+    r"|(?=¥\s*(?P<yen>[0-9,]+))"
+)
+TOTAL_TEXT_GROUPS: tuple[str, ...] = ("amount", "total", "yen")                        # 合計金額の採用優先順
+TEXT_VALUE_KEYS: tuple[str, ...] = ("valueString", "content", "value", "valueDate", "valueTime")   # 文字列値の参照順
+_MISSING: Any = object()                                                               # フィールド未存在を表す番兵
+
 
 # ==================================================
 # Public API
@@ -49,28 +69,31 @@ def parse_receipt_dict(raw: dict[str, Any], source_file: str) -> type_def.Receip
         text = raw.get("content") or ""
         summary.total = _extract_total_from_text(text)
         if summary.total is not None:
-            log_mod.info(f"TOTAL FALLBACK FROM TEXT: {summary.total}")
+            log.info(f"TOTAL FALLBACK FROM TEXT: {summary.total}")
 
     # 正規化
-    summary.date_iso = _normalize_date_iso(summary.date)
+    summary.date_obj = _normalize_date(summary.date)
+    d: date | None = summary.date_obj
+    summary.date_iso = f"{d.year:04d}-{d.month:02d}-{d.day:02d}" if d is not None else ""
     summary.time_norm = _normalize_time_norm(summary.time)
     summary.total_yen = _to_yen_int(summary.total)
     summary.tax_yen = _to_yen_int(summary.tax)
 
     # DEBUGログ
-    log_mod.debug(f"merchant_name: {summary.merchant_name}")
-    log_mod.debug(f"date: {summary.date}")
-    log_mod.debug(f"date_iso: {summary.date_iso}")
-    log_mod.debug(f"time: {summary.time}")
-    log_mod.debug(f"time_norm: {summary.time_norm}")
-    log_mod.debug(f"total: {summary.total}")
-    log_mod.debug(f"total_yen: {summary.total_yen}")
+    if log.is_debug_enabled():
+        log.debug(f"merchant_name: {summary.merchant_name}")
+        log.debug(f"date: {summary.date}")
+        log.debug(f"date_iso: {summary.date_iso}")
+        log.debug(f"time: {summary.time}")
+        log.debug(f"time_norm: {summary.time_norm}")
+        log.debug(f"total: {summary.total}")
+        log.debug(f"total_yen: {summary.total_yen}")
 
     items: list[type_def.ReceiptItem] = _parse_items(fields)
 
     # レシート成立判定
     if (summary.total_yen is None and len(items) == 0):
-        log_mod.info(
+        log.info(
             "NOT A RECEIPT DETECTED"
             f"(merchant_name='{summary.merchant_name}', "
             f"total_yen={summary.total_yen}, items=0)"
@@ -79,7 +102,7 @@ def parse_receipt_dict(raw: dict[str, Any], source_file: str) -> type_def.Receip
 
     # 明細が一切取れなかった場合、合計金額から疑似明細を生成する
     if not items and summary.total_yen is not None:
-        log_mod.info("CREATE PSEUDO ITEM (NO LINE ITEMS)")
+        log.info("CREATE PSEUDO ITEM (NO LINE ITEMS)")
         pseudo = type_def.ReceiptItem(
             name=summary.merchant_name or "UNKNOWN",
             total_price=summary.total,
@@ -95,7 +118,7 @@ def parse_receipt_dict(raw: dict[str, Any], source_file: str) -> type_def.Receip
     # 明細の有無フラグ設定
     summary.has_items = len(items) > 0
     if not summary.has_items:
-        log_mod.info("NO RECEIPT ITEMS DETECTED")
+        log.info("NO RECEIPT ITEMS DETECTED")
 
     return type_def.ReceiptResult(
         source_file=source_file,
@@ -143,31 +166,30 @@ def _parse_items(fields: dict[str, Any]) -> list[type_def.ReceiptItem]:
         quantity: float | None = _pick_num_field(obj, ("Quantity", "Qty"))
         unit_price: float | None = _pick_num_field(obj, ("UnitPrice", "UnitCost", "Price"))
 
+        # どれも取れないゴミ要素は捨てる（ReceiptItem を生成する前に判定する）
+        if (total_price is None) and (unit_price is None) and (name.strip() == ""):
+            continue
+
+        # 正規化（円は int に寄せる）も含めて1回で生成する
         item: type_def.ReceiptItem = type_def.ReceiptItem(
             name=name,
             total_price=total_price,
             quantity=quantity,
             unit_price=unit_price,
+            total_price_yen=_to_yen_int(total_price),
+            unit_price_yen=_to_yen_int(unit_price),
+            tag=type_def.ReceiptTag.UNKNOWN,
+            tag_reason="",
         )
 
-        item.tag = type_def.ReceiptTag.UNKNOWN
-        item.tag_reason = ""
-
-        # 正規化（円は int に寄せる）
-        item.total_price_yen = _to_yen_int(item.total_price)
-        item.unit_price_yen = _to_yen_int(item.unit_price)
-
-        # どれも取れないゴミ要素は捨てる
-        if (item.name.strip() == "") and (item.total_price is None) and (item.unit_price is None):
-            continue
-
         # 明細が取れているかの確認ログ（DEBUG）
-        log_mod.debug(f"item.name: {item.name}")
-        log_mod.debug(f"item.total_price: {item.total_price}")
-        log_mod.debug(f"item.total_price_yen: {item.total_price_yen}")
-        log_mod.debug(f"item.quantity: {item.quantity}")
-        log_mod.debug(f"item.unit_price: {item.unit_price}")
-        log_mod.debug(f"item.unit_price_yen: {item.unit_price_yen}")
+        if log.is_debug_enabled():
+            log.debug(f"item.name: {item.name}")
+            log.debug(f"item.total_price: {item.total_price}")
+            log.debug(f"item.total_price_yen: {item.total_price_yen}")
+            log.debug(f"item.quantity: {item.quantity}")
+            log.debug(f"item.unit_price: {item.unit_price}")
+            log.debug(f"item.unit_price_yen: {item.unit_price_yen}")
 
         items.append(item)
 
@@ -184,12 +206,7 @@ def _extract_value_array(node: Any) -> list[Any]:
     Returns:
         list[Any]: 明細要素の配列
     """
-    if node is None:
-        return []
-
-    if isinstance(node, list):
-        return node
-
+    # Azure の応答は {"valueArray": [...]} 形式が大半のため、dict を最初に判定する
     if isinstance(node, dict):
         va: Any = node.get("valueArray")
         if isinstance(va, list):
@@ -204,6 +221,11 @@ def _extract_value_array(node: Any) -> list[Any]:
             if isinstance(va2, list):
                 return va2
 
+        return []
+
+    if isinstance(node, list):
+        return node
+
     return []
 
 
@@ -243,11 +265,11 @@ def _pick_str_field(fields: dict[str, Any], candidates: tuple[str, ...]) -> str:
         str: 抽出した文字列フィールド（見つからない場合は空文字列）
     """
     for key in candidates:
-        if key not in fields:
+        v: Any = fields.get(key, _MISSING)
+        if v is _MISSING:
             continue
-        v: Any = fields.get(key)
         text: str = _extract_text_value(v)
-        if text.strip():
+        if text and not text.isspace():
             return text
     return ""
 
@@ -264,9 +286,9 @@ def _pick_num_field(fields: dict[str, Any], candidates: tuple[str, ...]) -> floa
         float | None: 抽出した数値フィールド（見つからない場合は None）
     """
     for key in candidates:
-        if key not in fields:
+        v: Any = fields.get(key, _MISSING)
+        if v is _MISSING:
             continue
-        v: Any = fields.get(key)
         n: float | None = _extract_number_value(v)
         if n is not None:
             return n
@@ -288,16 +310,10 @@ def _extract_text_value(node: Any) -> str:
     if isinstance(node, str):
         return node
     if isinstance(node, dict):
-        if "valueString" in node and isinstance(node["valueString"], str):
-            return node["valueString"]
-        if "content" in node and isinstance(node["content"], str):
-            return node["content"]
-        if "value" in node and isinstance(node["value"], str):
-            return node["value"]
-        if "valueDate" in node and isinstance(node["valueDate"], str):
-            return node["valueDate"]
-        if "valueTime" in node and isinstance(node["valueTime"], str):
-            return node["valueTime"]
+        for key in TEXT_VALUE_KEYS:
+            v: Any = node.get(key)
+            if isinstance(v, str):
+                return v
     return ""
 
 
@@ -318,11 +334,12 @@ def _extract_number_value(node: Any) -> float | None:
         return float(node)
 
     if isinstance(node, dict):
-        if "valueNumber" in node and isinstance(node["valueNumber"], (int, float)):
-            return float(node["valueNumber"])
+        num: Any = node.get("valueNumber")
+        if isinstance(num, (int, float)):
+            return float(num)
 
-        if "valueCurrency" in node and isinstance(node["valueCurrency"], dict):
-            cur: dict[str, Any] = node["valueCurrency"]
+        cur: Any = node.get("valueCurrency")
+        if isinstance(cur, dict):
             amt: Any = cur.get("amount")
             if isinstance(amt, (int, float)):
                 return float(amt)
@@ -334,36 +351,36 @@ def _extract_number_value(node: Any) -> float | None:
     return None
 
 
-def _normalize_date_iso(text: str) -> str:
+def _normalize_date(text: str) -> date | None:
     """
-    日付文字列を "YYYY-MM-DD" に正規化する。
+    日付文字列を date 型に正規化する。
 
     Args:
         text (str): 日付文字列
 
     Returns:
-        str: 正規化済み日付文字列（パース不可の場合は空文字列）
+        date | None: 正規化済み日付（パース不可の場合は None）
     """
     s: str = (text or "").strip()
     if s == "":
-        return ""
+        return None
 
     try:
-        return datetime.fromisoformat(s).date().strftime("%Y-%m-%d")
+        return datetime.fromisoformat(s).date()
     except ValueError:
         pass
 
-    m = re.search(r"(\d{4})\D+(\d{1,2})\D+(\d{1,2})", s)
+    m = DATE_RE.search(s)
     if m:
         try:
             yyyy: int = int(m.group(1))
             mm: int = int(m.group(2))
             dd: int = int(m.group(3))
-            return date(yyyy, mm, dd).strftime("%Y-%m-%d")
+            return date(yyyy, mm, dd)
         except ValueError:
-            return ""
+            return None
 
-    return ""
+    return None
 
 
 def _normalize_time_norm(text: str) -> str:
@@ -380,29 +397,50 @@ def _normalize_time_norm(text: str) -> str:
     if s == "":
         return ""
 
-    m = re.search(r"(\d{1,2})\D+(\d{1,2})(?:\D+(\d{1,2}))?", s)
+    m = TIME_RE.search(s)
     if m:
         try:
             hh = int(m.group(1))
             mm = int(m.group(2))
             ss = int(m.group(3)) if m.group(3) is not None else 0
-            return datetime(2000, 1, 1, hh, mm, ss).time().strftime("%H:%M:%S")
+            return _format_hms(hh, mm, ss)
         except ValueError:
             pass
 
-    digits = re.sub(r"\D+", "", s)
+    # 数字のみ抽出（str.isdecimal は正規表現の \d と同じ Unicode 10進数字を判定する）
+    digits = "".join(filter(str.isdecimal, s))
     if len(digits) in (4, 6):
         try:
             hh = int(digits[0:2])
             mm = int(digits[2:4])
             ss = int(digits[4:6]) if len(digits) == 6 else 0
-            return datetime(2000, 1, 1, hh, mm, ss).time().strftime("%H:%M:%S")
+            return _format_hms(hh, mm, ss)
         except ValueError:
             return ""
 
     return ""
 
 
+def _format_hms(hh: int, mm: int, ss: int) -> str:
+    """
+    時・分・秒を "HH:MM:SS" に整形する。
+
+    Args:
+        hh (int): 時
+        mm (int): 分
+        ss (int): 秒
+
+    Returns:
+        str: "HH:MM:SS" 形式の時刻文字列
+
+    Raises:
+        ValueError: 時刻として範囲外の場合
+    """
+    if not (0 <= hh < 24 and 0 <= mm < 60 and 0 <= ss < 60):
+        raise ValueError(f"time out of range: {hh}:{mm}:{ss}")
+    return f"{hh:02d}:{mm:02d}:{ss:02d}"
+
+
 def _to_yen_int(v: Any) -> int | None:
     """
     金額を「円のint」に寄せるための変換関数。
@@ -416,7 +454,8 @@ def _to_yen_int(v: Any) -> int | None:
     if v is None:
         return None
     try:
-        return int(round(float(v)))
+        # パーサ由来の値は float のため、float() による再変換を省く
+        return int(round(v if isinstance(v, float) else float(v)))
     except (TypeError, ValueError):
         return None
 
@@ -434,17 +473,18 @@ def _extract_total_from_text(text: str) -> float | None:
     if not text:
         return None
 
-    patterns = [
-        r"金額[:：]?\s*([0-9,]+)\s*円",
-        r"合計[:：]?\s*¥?\s*([0-9,]+)",
-        r"¥\s*([0-9,]+)",
-    ]
+    # 種類ごとに最初に見つかった値を記録する（全種類が揃った時点で走査終了）
+    found: dict[str, str] = {}
+    for m in TOTAL_TEXT_RE.finditer(text):
+        group: str = m.lastgroup
+        found.setdefault(group, m.group(group))
+        if len(found) == len(TOTAL_TEXT_GROUPS):
+            break
 
-    for p in patterns:
-        m = re.search(p, text)
-        if m:
+    for group in TOTAL_TEXT_GROUPS:
+        if group in found:
             try:
-                return float(m.group(1).replace(",", ""))
+                return float(found[group].replace(",", ""))
             except ValueError:
                 pass
 
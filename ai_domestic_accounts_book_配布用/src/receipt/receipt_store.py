@@ -5,19 +5,40 @@
 """
 from __future__ import annotations
 
+import codecs
 import csv
+import errno
+import io
+import os
 import re
 import shutil
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from datetime import datetime, date
 from pathlib import Path
 from PIL import Image
 import pillow_heif
 
+try:
+    import orjson
+except ImportError:     # orjson が無い環境では json モジュールを使用する
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pa_compute
+    import pyarrow.csv as pa_csv
+except ImportError:     # pyarrow が無い環境では csv モジュールで集計する
+    pa = None
+
 from ..tool import logger_module as log_mod
 from . import type_def
 
+# モジュール用ロガー（呼び出し元ファイル名を保持）
+log = log_mod.get_logger(__file__)
+
 
 # ==================================================
 # CSV 出力定義（receiptサマリ）
@@ -37,22 +58,44 @@ RECEIPT_SUMMARY_CSV_HEADERS: tuple[str, ...] = (
     "source_file",
     "json_file",
 )
+# カテゴリー別集計に使用するCSV列
+CATEGORY_AGGREGATE_CSV_COLUMNS: tuple[str, ...] = ("item_tag", "total_price_yen")
 # ==================================================
 # Image conversion settings (Azure Document Intelligence)
 # ==================================================
+HEIF_IMAGE_EXTS: frozenset[str] = frozenset({".heic", ".heif"})     # JPG変換対象の拡張子
 MAX_IMAGE_EDGE_PX: int = 2000           # 画像の最大辺(px)
 OUTPUT_IMAGE_FORMAT: str = "JPEG"       # 出力画像形式
 OUTPUT_IMAGE_QUALITY: int = 85          # 出力画像品質（1-100）
+IMAGE_RESIZE_REDUCING_GAP: float = 2.0  # 縮小時に粗い縮小を先行させる倍率（Image.thumbnail の reducing_gap）
+# ==================================================
+# クラウド取り込み設定
+# ==================================================
+CLOUD_IMPORT_MAX_WORKERS: int = 8       # コピー・HEIC変換の最大並列数
+# ==================================================
+# 正規表現
+# ==================================================
+DATE_RE: re.Pattern[str] = re.compile(r"(\d{4})\D+(\d{1,2})\D+(\d{1,2})")      # 日付（YYYY?MM?DD）
 
 
 # HEIF形式画像対応登録
 pillow_heif.register_heif_opener()
 
 
+# ==================================================
+# グローバル変数定義
+# ==================================================
+# 月次CSVの年月一覧キャッシュ（key: CSVルート, value: (ディレクトリ更新時刻のタプル, 年月一覧)）
+_year_months_cache: dict[Path, tuple[tuple[Any, ...], tuple[tuple[int, int], ...]]] = {}
+_year_months_cache_lock: threading.Lock = threading.Lock()     # 年月一覧キャッシュ排他ロック
+# 作成済み（存在確認済み）の出力ディレクトリ（同じディレクトリへの mkdir を繰り返さない）
+_ensured_dirs: set[Path] = set()
+
+
 def load_receipt_image(
     input_dir: Path,
     error_dir: Path,
-    receipt_image_exts: tuple[str, ...],
+    receipt_image_exts: frozenset[str],
 ) -> list[Path]:
     """
     入力ディレクトリ(data/input)を走査し、処理対象のレシート画像を収集する。
@@ -60,7 +103,7 @@ def load_receipt_image(
     Args:
         input_dir (Path): 入力ディレクトリパス
         error_dir (Path): errorディレクトリパス
-        receipt_image_exts (tuple[str, ...]): 処理対象のレシート画像拡張子タプル
+        receipt_image_exts (frozenset[str]): 処理対象のレシート画像拡張子セット
 
     Returns:
         list[Path]: 処理対象のレシート画像ファイルパスリスト
@@ -70,25 +113,28 @@ def load_receipt_image(
 
     receipt_images: list[Path] = []
 
-    for p in input_dir.iterdir():
-        if not p.is_file():
-            continue
+    # DirEntry の種別情報を使い、ファイルごとの stat を省く
+    with os.scandir(input_dir) as it:
+        entries: list[os.DirEntry] = [entry for entry in it if entry.is_file()]
+
+    for entry in entries:
+        p = Path(entry.path)
 
-        if p.suffix.lower() not in receipt_image_exts:
-            log_mod.error(f"INVALID EXTENSION -> MOVE TO ERROR: {p.name}")
+        if os.path.splitext(entry.name)[1].lower() not in receipt_image_exts:
+            log.error(f"INVALID EXTENSION -> MOVE TO ERROR: {p.name}")
             move_to_error(p, error_dir)
             continue
 
         receipt_images.append(p)
 
     receipt_images.sort(key=lambda x: x.name)
-    log_mod.info("ALL LOAD RECEIPT IMAGES")
+    log.info("ALL LOAD RECEIPT IMAGES")
     return receipt_images
 
 
 def build_base_name(
     result: type_def.ReceiptResult,
-    invalid_filename_chars: re.Pattern[str],
+    invalid_filename_table: dict[int, str],
 ) -> str:
     """
     解析結果から保存用の basename を生成する。
@@ -98,7 +144,7 @@ def build_base_name(
 
     Args:
         result (ReceiptResult): レシート解析結果オブジェクト
-        invalid_filename_chars (re.Pattern): ファイル名に使えない文字の正規表現パターン
+        invalid_filename_table (dict[int, str]): ファイル名に使えない文字の置換テーブル（str.maketrans）
 
     Returns:
         str: 生成したベースファイル名（拡張子なし）
@@ -110,12 +156,7 @@ def build_base_name(
     # --------------------------------------------------
     # 1. date_iso 優先
     # --------------------------------------------------
-    date_iso: str = summary.date_iso.strip()
-    if date_iso:
-        try:
-            d = datetime.fromisoformat(date_iso).date()
-        except ValueError:
-            d = None
+    d = _summary_date(summary)
 
     # --------------------------------------------------
     # 2. raw date パース
@@ -131,7 +172,7 @@ def build_base_name(
             src = Path(result.source_file)
             if src.exists():
                 d = datetime.fromtimestamp(src.stat().st_mtime).date()
-                log_mod.debug(
+                log.debug(
                     f"USE FILE MTIME FOR BASENAME DATE: {result.source_file} -> {d}"
                 )
         except Exception:
@@ -142,7 +183,7 @@ def build_base_name(
     # --------------------------------------------------
     if d is None:
         d = datetime.now().date()
-        log_mod.debug("USE CURRENT DATE FOR BASENAME")
+        log.debug("USE CURRENT DATE FOR BASENAME")
 
     # --------------------------------------------------
     # time
@@ -163,9 +204,35 @@ def build_base_name(
     # shop
     # --------------------------------------------------
     shop: str = summary.merchant_name.strip() or "UNKNOWN"
-    shop = invalid_filename_chars.sub("_", shop)
+    shop = shop.translate(invalid_filename_table)
+
+    return f"{d.year:04d}{d.month:02d}{d.day:02d}_{hhmmss}_{shop}"
+
 
-    return f"{d:%Y%m%d}_{hhmmss}_{shop}"
+def _summary_date(summary: type_def.ReceiptSummary) -> date | None:
+    """
+    サマリの購入日（date_iso）を date 型で取得する。
+
+    - パーサが設定した date_obj があればそのまま使用する（再パースしない）
+    - date_obj が無い場合のみ date_iso をパースする
+
+    Args:
+        summary (ReceiptSummary): レシートサマリ
+
+    Returns:
+        date | None: 購入日（取得できない場合は None）
+    """
+    if summary.date_obj is not None:
+        return summary.date_obj
+
+    date_iso: str = summary.date_iso.strip()
+    if not date_iso:
+        return None
+
+    try:
+        return datetime.fromisoformat(date_iso).date()
+    except ValueError:
+        return None
 
 
 def _parse_date(text: str) -> date | None:
@@ -185,7 +252,7 @@ def _parse_date(text: str) -> date | None:
     except ValueError:
         pass
 
-    m = re.search(r"(\d{4})\D+(\d{1,2})\D+(\d{1,2})", s)
+    m = DATE_RE.search(s)
     if m:
         try:
             return date(int(m.group(1)), int(m.group(2)), int(m.group(3)))
@@ -195,6 +262,45 @@ def _parse_date(text: str) -> date | None:
     return None
 
 
+def _move_file(src: Path, dst: Path) -> None:
+    """
+    ファイルを移動する。
+
+    - 同一ファイルシステム内では os.replace（rename 1回）で移動する
+    - 別デバイスへの移動（EXDEV）の場合のみ shutil.move（コピー＋削除）にフォールバックする
+    ※dst は衝突回避済みのパスを渡すこと（os.replace は既存ファイルを上書きする）
+
+    Args:
+        src (Path): 移動元ファイルパス
+        dst (Path): 移動先ファイルパス
+
+    Returns:
+        None
+    """
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(src), str(dst))
+
+
+def _ensure_dir(directory: Path) -> None:
+    """
+    ディレクトリを作成する（本プロセスで作成済みのディレクトリは mkdir を省略する）。
+
+    Args:
+        directory (Path): 作成するディレクトリパス
+
+    Returns:
+        None
+    """
+    if directory in _ensured_dirs:
+        return
+    directory.mkdir(parents=True, exist_ok=True)
+    _ensured_dirs.add(directory)
+
+
 def _parse_year_from_base_name(base: str) -> str:
     """
     basename(YYYYMMDD_...) から年(YYYY)を推定する。
@@ -223,30 +329,19 @@ def move_to_processed(src: Path, base: str, processed_dir: Path) -> Path:
     Returns:
         Path: 移動先ファイルパス
     """
-    processed_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(processed_dir)
 
     year = _parse_year_from_base_name(base)
     year_dir = processed_dir / year
-    year_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(year_dir)
 
     if not src.exists():
-        log_mod.error(f"SOURCE NOT FOUND -> SKIP MOVE TO PROCESSED: {src}")
+        log.error(f"SOURCE NOT FOUND -> SKIP MOVE TO PROCESSED: {src}")
         return src
 
-    suffix = src.suffix.lower()
-    dst = year_dir / f"{base}{suffix}"
-
-    if not dst.exists():
-        shutil.move(str(src), str(dst))
-        return dst
-
-    index = 1
-    while True:
-        candidate = year_dir / f"{base}_{index}{suffix}"
-        if not candidate.exists():
-            shutil.move(str(src), str(candidate))
-            return candidate
-        index += 1
+    dst = _next_free_path(year_dir, base, src.suffix.lower())
+    _move_file(src, dst)
+    return dst
 
 
 def move_to_error(src: Path, error_dir: Path) -> None:
@@ -260,24 +355,14 @@ def move_to_error(src: Path, error_dir: Path) -> None:
     Returns:
         None
     """
-    error_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(error_dir)
 
     if not src.exists():
-        log_mod.error(f"SOURCE NOT FOUND -> SKIP MOVE TO ERROR: {src}")
+        log.error(f"SOURCE NOT FOUND -> SKIP MOVE TO ERROR: {src}")
         return
 
-    dst = error_dir / src.name
-    if not dst.exists():
-        shutil.move(str(src), str(dst))
-        return
-
-    index = 1
-    while True:
-        candidate = error_dir / f"{src.stem}_{index}{src.suffix}"
-        if not candidate.exists():
-            shutil.move(str(src), str(candidate))
-            return
-        index += 1
+    dst = _next_free_path(error_dir, src.stem, src.suffix)
+    _move_file(src, dst)
 
 
 def save_result_json(
@@ -296,11 +381,11 @@ def save_result_json(
     Returns:
         Path: 保存先ファイルパス
     """
-    output_json_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(output_json_dir)
 
     year = _safe_parse_year(result, base)
     year_dir = output_json_dir / year
-    year_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(year_dir)
 
     out = year_dir / f"{base}.json"
 
@@ -321,7 +406,7 @@ def save_result_json(
                 "total_price": item.total_price_yen,
                 "unit_price": item.unit_price_yen,
                 "quantity": item.quantity,
-                "tag": item.tag.value if item.tag else None,
+                "tag": item.tag,
                 "tag_reason": item.tag_reason,
             }
             for item in result.items
@@ -342,20 +427,59 @@ def _save_json_dict(out: Path, data: dict[str, Any]) -> Path:
     Returns:
         Path: 保存先ファイルパス
     """
-    if not out.exists():
-        with out.open("w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        return out
+    dst = _next_free_path(out.parent, out.stem, out.suffix)
+    _write_json_file(dst, data)
+    return dst
+
+
+def _next_free_path(directory: Path, stem: str, suffix: str) -> Path:
+    """
+    衝突しない保存先パスを返す（"{stem}{suffix}" → "{stem}_1{suffix}" → ... の順）。
+
+    ディレクトリを1回だけ列挙し、既存ファイル名との照合はメモリ上で行う。
+    ※ファイル名は os.path.normcase で比較する（Windows では大文字小文字を区別しない）
+
+    Args:
+        directory (Path): 保存先ディレクトリパス
+        stem (str): ファイル名（拡張子なし）
+        suffix (str): 拡張子（"." 付き）
 
+    Returns:
+        Path: 保存先ファイルパス
+    """
+    with os.scandir(directory) as it:
+        existing: set[str] = {os.path.normcase(entry.name) for entry in it}
+
+    name = f"{stem}{suffix}"
     index = 1
-    while True:
-        candidate = out.parent / f"{out.stem}_{index}{out.suffix}"
-        if not candidate.exists():
-            with candidate.open("w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            return candidate
+    while os.path.normcase(name) in existing:
+        name = f"{stem}_{index}{suffix}"
         index += 1
 
+    return directory / name
+
+
+def _write_json_file(path: Path, data: dict[str, Any]) -> None:
+    """
+    JSON辞書をインデント付き UTF-8 でファイルに書き込む。
+
+    orjson が利用可能な場合は bytes を直接書き込み、
+    利用できない場合は json モジュールで書き込む。
+
+    Args:
+        path (Path): 出力先ファイルパス
+        data (dict[str, Any]): 保存するJSON辞書データ
+
+    Returns:
+        None
+    """
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
 
 def get_monthly_receipt_csv_path(
     result: type_def.ReceiptResult,
@@ -374,37 +498,35 @@ def get_monthly_receipt_csv_path(
     Returns:
         Path: 月別CSVファイルのパス
     """
-    date_iso = result.summary.date_iso.strip()
-
-    if date_iso:
-        try:
-            d = datetime.fromisoformat(date_iso).date()
-            return output_csv_root / f"{d:%Y}" / f"{d:%Y%m}_items.csv"
-        except ValueError:
-            pass
+    d = _summary_date(result.summary)
+    if d is not None:
+        return output_csv_root / f"{d.year:04d}" / f"{d.year:04d}{d.month:02d}_items.csv"
 
     # fallback: receipt_id (YYYYMMDD_...)
-    m = re.match(r"(\d{4})(\d{2})\d{2}_", receipt_id)
-    if m:
-        yyyy, mm = m.group(1), m.group(2)
-        log_mod.debug(
+    # ※isdecimal は正規表現の \d と同じ Unicode 10進数字を判定する
+    if len(receipt_id) >= 9 and receipt_id[8] == "_" and receipt_id[:8].isdecimal():
+        yyyy, mm = receipt_id[:4], receipt_id[4:6]
+        log.debug(
             f"USE BASENAME FOR CSV PATH: {receipt_id} -> {yyyy}{mm}"
         )
         return output_csv_root / yyyy / f"{yyyy}{mm}_items.csv"
 
     # 最終防衛ライン
     now = datetime.now()
-    log_mod.debug("USE CURRENT MONTH FOR CSV PATH")
-    return output_csv_root / f"{now:%Y}" / f"{now:%Y%m}_items.csv"
+    log.debug("USE CURRENT MONTH FOR CSV PATH")
+    return output_csv_root / f"{now.year:04d}" / f"{now.year:04d}{now.month:02d}_items.csv"
 
 
 def build_receipt_summary_csv_row(
     result: type_def.ReceiptResult,
     receipt_id: str,
     saved_json_path: Path,
-) -> dict[str, Any]:
+) -> list[tuple[Any, ...]]:
     """
-    レシートサマリ用のCSV 1行分のdictを生成する。
+    レシートサマリ用のCSV行（商品ごと）を生成する。
+
+    - 各行は RECEIPT_SUMMARY_CSV_HEADERS と同じ順序のタプル
+      （dict を経由せず、そのまま csv.writer.writerows に渡せる形で生成する）
 
     Args:
         result (ReceiptResult): レシート解析結果オブジェクト
@@ -412,41 +534,46 @@ def build_receipt_summary_csv_row(
         saved_json_path (Path): 保存済みJSONファイルのパス
 
     Returns:
-        dict[str, Any]: CSV 1行分のデータ辞書
+        list[tuple[Any, ...]]: CSV 行データ（ヘッダー順のタプル）リスト
     """
-    rows: list[dict[str, Any]] = []
-
-    for item in result.items:
-        rows.append(
-            {
-                "receipt_id": receipt_id,
-                "date": result.summary.date_iso,
-                "time": result.summary.time_norm,
-                "merchant_name": result.summary.merchant_name,
-                "item_name": item.name,
-                "item_tag": item.tag.value if hasattr(item, "tag") and item.tag else "",
-                "item_tag_reason": getattr(item, "tag_reason", ""),
-                "total_price_yen": item.total_price_yen,
-                "unit_price_yen": item.unit_price_yen,
-                "quantity": item.quantity,
-                "source_file": result.source_file,
-                "json_file": saved_json_path.name,
-            }
+    summary = result.summary
+    date_iso: str = summary.date_iso
+    time_norm: str = summary.time_norm
+    merchant_name: str = summary.merchant_name
+    source_file: str = result.source_file
+    json_file: str = saved_json_path.name
+
+    return [
+        (
+            receipt_id,                                 # receipt_id
+            date_iso,                                   # date
+            time_norm,                                  # time
+            merchant_name,                              # merchant_name
+            item.name,                                  # item_name
+            item.tag or "",                             # item_tag
+            item.tag_reason,                            # item_tag_reason
+            item.total_price_yen,                       # total_price_yen
+            item.unit_price_yen,                        # unit_price_yen
+            item.quantity,                              # quantity
+            source_file,                                # source_file
+            json_file,                                  # json_file
         )
-
-    return rows
+        for item in result.items
+    ]
 
 
 def append_monthly_receipt_item_csv(
     csv_path: Path,
-    rows: list[dict[str, Any]],
+    rows: list[tuple[Any, ...]],
 ) -> None:
     """
     月別の商品CSVへ複数行追記する。
 
+    - ファイルが存在しない場合のみヘッダーを書き込む
+
     Args:
         csv_path (Path): CSVファイルパス
-        rows (list[dict]): 商品CSV行データ
+        rows (list[tuple]): 商品CSV行データ（RECEIPT_SUMMARY_CSV_HEADERS 順のタプル）
 
     Returns:
         None
@@ -454,18 +581,231 @@ def append_monthly_receipt_item_csv(
     if not rows:
         return
 
-    csv_path.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(csv_path.parent)
     file_exists = csv_path.exists()
 
-    with csv_path.open("a", encoding="utf-8-sig", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=RECEIPT_SUMMARY_CSV_HEADERS)
-        if not file_exists:
-            writer.writeheader()
+    # 全行をメモリ上で整形し、1回の write でまとめて追記する
+    buf = io.StringIO(newline="")
+    writer = csv.writer(buf)
+    if not file_exists:
+        writer.writerow(RECEIPT_SUMMARY_CSV_HEADERS)
+    writer.writerows(rows)
+    data: bytes = buf.getvalue().encode("utf-8")
+
+    with csv_path.open("ab") as f:
+        # 空ファイルへの書き込み時のみ BOM を付与する（encoding="utf-8-sig" の追記と同じ挙動）
+        if f.tell() == 0:
+            data = codecs.BOM_UTF8 + data
+        f.write(data)
+
+    log.debug(f"ITEM CSV APPEND OK: {csv_path.name} ({len(rows)} rows)")
+
+
+def scan_monthly_csv_year_months(csv_root: Path) -> tuple[tuple[int, int], ...]:
+    """
+    CSVルート配下（YYYY/YYYYMM_items.csv）を走査し、月次CSVが存在する年月一覧を取得する。
+
+    - CSVルートと各年ディレクトリの更新時刻が前回走査時と同じ場合はキャッシュを返す
+      （ファイルの追加・削除でディレクトリの更新時刻が変わるため、stat のみで判定できる）
+
+    Args:
+        csv_root (Path): CSV出力ルートディレクトリ（data/output/csv）
+
+    Returns:
+        tuple[tuple[int, int], ...]: 昇順の ((year, month), ...)
+    """
+    if not csv_root.exists():
+        return ()
+
+    # DirEntry の種別・stat 情報を使い、Path 生成と追加の stat を省く
+    with os.scandir(csv_root) as it:
+        year_dirs: list[os.DirEntry] = sorted(
+            (entry for entry in it if len(entry.name) == 4 and entry.name.isdigit() and entry.is_dir(follow_symlinks=False)),
+            key=lambda entry: entry.name,
+        )
+    key: tuple[Any, ...] = (
+        os.stat(csv_root).st_mtime_ns,
+        tuple((entry.name, entry.stat(follow_symlinks=False).st_mtime_ns) for entry in year_dirs),
+    )
+
+    with _year_months_cache_lock:
+        cached = _year_months_cache.get(csv_root)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    results: set[tuple[int, int]] = set()
+    for year_entry in year_dirs:
+        with os.scandir(year_entry.path) as it:
+            for entry in it:
+                name: str = entry.name
+                # YYYYMM_items.csv のみ対象（正規表現を使わずスライスで判定）
+                if name[6:] != "_items.csv" or not name[:6].isdigit() or name[:4] != year_entry.name:
+                    continue
+                results.add((int(name[:4]), int(name[4:6])))
+
+    year_months: tuple[tuple[int, int], ...] = tuple(sorted(results))
+    with _year_months_cache_lock:
+        _year_months_cache[csv_root] = (key, year_months)
+    return year_months
+
+
+def aggregate_category_csv(csv_path: Path, *, empty_tag: str | None = None) -> dict[str, int]:
+    """
+    月別CSVからカテゴリー別の支出金額を集計する。
+
+    - 金額が整数でない行は集計対象外とする
+    - pyarrow がある場合は pyarrow（C++）側で解析・集計し、無い場合・失敗した場合は csv モジュールで集計する
+
+    Args:
+        csv_path (Path): 月別CSVパス
+        empty_tag (str | None): タグが空の行を集計するカテゴリー名（None の場合は集計対象外）
+
+    Returns:
+        dict[str, int]: {カテゴリー名: 合計金額}
+    """
+    if pa is not None:
+        try:
+            return _aggregate_category_csvs_arrow({0: csv_path}, empty_tag=empty_tag)[0]
+        except pa.ArrowException as e:
+            log.debug(f"ARROW CSV AGGREGATION FAILED, FALLBACK TO CSV MODULE: {csv_path} ({e})")
+
+    return _aggregate_category_csv_rows(csv_path, empty_tag=empty_tag)
+
+
+def aggregate_category_csvs(
+    csv_paths: dict[int, Path],
+    *,
+    empty_tag: str | None = None,
+) -> dict[int, dict[str, int]]:
+    """
+    複数の月別CSVからキーごと（月など）・カテゴリー別の支出金額を集計する。
+
+    - pyarrow がある場合は全CSVを連結して1回で集計する
+
+    Args:
+        csv_paths (dict[int, Path]): {キー: 月別CSVパス}
+        empty_tag (str | None): タグが空の行を集計するカテゴリー名（None の場合は集計対象外）
+
+    Returns:
+        dict[int, dict[str, int]]: {キー: {カテゴリー名: 合計金額}}
+    """
+    if pa is not None and csv_paths:
+        try:
+            return _aggregate_category_csvs_arrow(csv_paths, empty_tag=empty_tag)
+        except pa.ArrowException as e:
+            log.debug(f"ARROW CSV AGGREGATION FAILED, FALLBACK TO EACH FILE: ({e})")
+
+    return {
+        key: aggregate_category_csv(csv_path, empty_tag=empty_tag)
+        for key, csv_path in csv_paths.items()
+    }
+
+
+def _aggregate_category_csvs_arrow(
+    csv_paths: dict[int, Path],
+    *,
+    empty_tag: str | None,
+) -> dict[int, dict[str, int]]:
+    """
+    複数の月別CSVを pyarrow で読み込み、キー・カテゴリー別の集計を1回で行う。
+
+    Args:
+        csv_paths (dict[int, Path]): {キー: 月別CSVパス}
+        empty_tag (str | None): タグが空の行を集計するカテゴリー名（None の場合は集計対象外）
+
+    Returns:
+        dict[int, dict[str, int]]: {キー: {カテゴリー名: 合計金額}}
+
+    Raises:
+        pa.ArrowException: 金額が整数でない行がある等、読み込みに失敗した場合
+    """
+    tables = []
+    for key, csv_path in csv_paths.items():
+        table = _read_category_csv_arrow(csv_path, empty_tag=empty_tag)
+        tables.append(table.append_column("key", pa.array([key] * table.num_rows, pa.int32())))
+
+    grouped = (
+        pa.concat_tables(tables)
+        .group_by(["key", "item_tag"])
+        .aggregate([("total_price_yen", "sum")])
+    )
+
+    totals: dict[int, dict[str, int]] = {key: {} for key in csv_paths}
+    for key, tag, amount in zip(
+        grouped["key"].to_pylist(),
+        grouped["item_tag"].to_pylist(),
+        grouped["total_price_yen_sum"].to_pylist(),
+    ):
+        totals[key][tag] = amount
+    return totals
+
+
+def _read_category_csv_arrow(csv_path: Path, *, empty_tag: str | None) -> pa.Table:
+    """
+    月別CSVから集計に必要な列を pyarrow で読み込む。
+
+    - 金額が空の行は除外する
+    - タグが空の行は empty_tag に置き換える（None の場合は除外する）
+
+    Args:
+        csv_path (Path): 月別CSVパス
+        empty_tag (str | None): タグが空の行を集計するカテゴリー名（None の場合は集計対象外）
 
-        for row in rows:
-            writer.writerow({k: row.get(k, "") for k in RECEIPT_SUMMARY_CSV_HEADERS})
+    Returns:
+        pa.Table: item_tag / total_price_yen 列のテーブル
+
+    Raises:
+        pa.ArrowException: 金額が整数でない行がある等、読み込みに失敗した場合
+    """
+    table = pa_csv.read_csv(
+        csv_path,
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=list(CATEGORY_AGGREGATE_CSV_COLUMNS),
+            column_types={"item_tag": pa.string(), "total_price_yen": pa.int64()},
+            strings_can_be_null=True,
+        ),
+    )
+    table = table.filter(pa_compute.is_valid(table["total_price_yen"]))
 
-    log_mod.debug(f"ITEM CSV APPEND OK: {csv_path.name} ({len(rows)} rows)")
+    if empty_tag is None:
+        return table.filter(pa_compute.is_valid(table["item_tag"]))
+
+    tags = pa_compute.fill_null(pa_compute.utf8_trim_whitespace(table["item_tag"]), "")
+    tags = pa_compute.if_else(pa_compute.equal(tags, ""), empty_tag, tags)
+    return table.set_column(table.schema.get_field_index("item_tag"), "item_tag", tags)
+
+
+def _aggregate_category_csv_rows(csv_path: Path, *, empty_tag: str | None) -> dict[str, int]:
+    """
+    月別CSVを csv モジュールで1行ずつ読み込み、カテゴリー別の支出金額を集計する。
+
+    Args:
+        csv_path (Path): 月別CSVパス
+        empty_tag (str | None): タグが空の行を集計するカテゴリー名（None の場合は集計対象外）
+
+    Returns:
+        dict[str, int]: {カテゴリー名: 合計金額}
+    """
+    totals: dict[str, int] = {}
+
+    with csv_path.open("r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.DictReader(f)
+
+        for row in reader:
+            tag = row.get("item_tag")
+            if empty_tag is not None:
+                tag = (tag or "").strip() or empty_tag
+            elif not tag:
+                continue
+
+            try:
+                price = int(row.get("total_price_yen"))
+            except (TypeError, ValueError):
+                continue
+
+            totals[tag] = totals.get(tag, 0) + price
+
+    return totals
 
 
 def _convert_heic_to_jpg(src: Path) -> Path:
@@ -478,29 +818,32 @@ def _convert_heic_to_jpg(src: Path) -> Path:
     Returns:
         Path: 変換後の JPG ファイルパス
     """
-    if src.suffix.lower() not in (".heic", ".heif"):
+    if src.suffix.lower() not in HEIF_IMAGE_EXTS:
         return src
 
     dst = src.with_suffix(".jpg")
 
     try:
         with Image.open(src) as img:
+            # デコーダが縮小読み込みに対応している場合は縮小した解像度でデコードする
+            img.draft("RGB", (MAX_IMAGE_EDGE_PX, MAX_IMAGE_EDGE_PX))
             img = img.convert("RGB")
 
-            # リサイズ
-            w, h = img.size
-            if max(w, h) > MAX_IMAGE_EDGE_PX:
-                ratio = MAX_IMAGE_EDGE_PX / max(w, h)
-                new_size = (int(w * ratio), int(h * ratio))
-                img = img.resize(new_size, Image.LANCZOS)
+            # リサイズ（縦横比維持・縮小のみ）
+            # ※reducing_gap 指定で粗い縮小を先に行い、LANCZOS は目標サイズ付近のみに適用する
+            img.thumbnail(
+                (MAX_IMAGE_EDGE_PX, MAX_IMAGE_EDGE_PX),
+                Image.LANCZOS,
+                reducing_gap=IMAGE_RESIZE_REDUCING_GAP,
+            )
 
             img.save(dst, OUTPUT_IMAGE_FORMAT, quality=OUTPUT_IMAGE_QUALITY, optimize=True)
         src.unlink()
-        log_mod.info(f"HEIC CONVERTED & RESIZED -> JPG: {dst.name}")
+        log.info(f"HEIC CONVERTED & RESIZED -> JPG: {dst.name}")
         return dst
 
     except Exception as e:
-        log_mod.error(f"HEIC CONVERT FAILED: {src.name} ({e})")
+        log.error(f"HEIC CONVERT FAILED: {src.name} ({e})")
         raise
 
 
@@ -526,41 +869,65 @@ def import_from_cloud(
         int: 取り込んだファイル数
     """
     if not cloud_inbox_dir.exists():
-        log_mod.info(f"CLOUD INBOX NOT FOUND -> SKIP: {cloud_inbox_dir}")
+        log.info(f"CLOUD INBOX NOT FOUND -> SKIP: {cloud_inbox_dir}")
         return 0
 
     input_dir.mkdir(parents=True, exist_ok=True)
     cloud_error_dir.mkdir(parents=True, exist_ok=True)
 
-    count = 0
+    with os.scandir(cloud_inbox_dir) as it:
+        cloud_files: list[Path] = [Path(entry.path) for entry in it if entry.is_file()]
 
-    for p in cloud_inbox_dir.iterdir():
-        if not p.is_file():
-            continue
+    if not cloud_files:
+        return 0
 
-        try:
-            dst = input_dir / p.name
-            shutil.copy2(p, dst)
+    # コピー（I/O）と HEIC 変換（C 実装）はいずれも GIL を解放するため、スレッドで並列に実行する
+    max_workers: int = min(CLOUD_IMPORT_MAX_WORKERS, os.cpu_count() or 1, len(cloud_files))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results: list[bool] = list(executor.map(
+            lambda p: _import_cloud_file(p, input_dir, cloud_error_dir),
+            cloud_files,
+        ))
 
-            # HEIC → JPG 変換 & リサイズ
-            _convert_heic_to_jpg(dst)
+    count = sum(results)
 
-            # ※ 成功してもクラウド側は動かさない
-            count += 1
+    if count > 0:
+        log.info(f"IMPORTED FROM CLOUD: {count} FILES")
 
-        except Exception as e:
-            log_mod.error(f"CLOUD IMPORT FAILED: {p.name} ({e})")
+    return count
 
-            # 失敗時のみ cloud error へ
-            try:
-                shutil.move(str(p), str(cloud_error_dir / p.name))
-            except Exception:
-                pass
 
-    if count > 0:
-        log_mod.info(f"IMPORTED FROM CLOUD: {count} FILES")
+def _import_cloud_file(src: Path, input_dir: Path, cloud_error_dir: Path) -> bool:
+    """
+    クラウド受信箱のファイル1件を input ディレクトリへ取り込む。
 
-    return count
+    Args:
+        src (Path): クラウド受信箱内のファイルパス
+        input_dir (Path): input ディレクトリ
+        cloud_error_dir (Path): クラウド同期済みの error ディレクトリ
+
+    Returns:
+        bool: 取り込みに成功した場合 True
+    """
+    try:
+        dst = input_dir / src.name
+        shutil.copy2(src, dst)
+
+        # HEIC → JPG 変換 & リサイズ
+        _convert_heic_to_jpg(dst)
+
+        # ※ 成功してもクラウド側は動かさない
+        return True
+
+    except Exception as e:
+        log.error(f"CLOUD IMPORT FAILED: {src.name} ({e})")
+
+        # 失敗時のみ cloud error へ
+        try:
+            shutil.move(str(src), str(cloud_error_dir / src.name))
+        except Exception:
+            pass
+        return False
 
 
 def _safe_parse_year(
@@ -582,16 +949,13 @@ def _safe_parse_year(
     Returns:
         str: 年(YYYY)
     """
-    date_iso = result.summary.date_iso.strip()
-    if date_iso:
-        try:
-            return f"{datetime.fromisoformat(date_iso).date():%Y}"
-        except ValueError:
-            pass
+    d = _summary_date(result.summary)
+    if d is not None:
+        return f"{d.year:04d}"
 
     year_from_base = _parse_year_from_base_name(base)
     if year_from_base != "unknown":
         return year_from_base
 
-    log_mod.debug("USE CURRENT YEAR FOR OUTPUT PATH")
+    log.debug("USE CURRENT YEAR FOR OUTPUT PATH")
     return f"{datetime.now().year}"
@@ -5,12 +5,21 @@
 """
 from __future__ import annotations
 
+import datetime
+import sys
 from dataclasses import dataclass, field
 from typing import Any, Optional
 from enum import Enum
 
 
-@dataclass
+# ==================================================
+# 定数定義
+# ==================================================
+# データクラスの生成オプション（Python 3.10 以降は __slots__ を生成し、インスタンスごとの __dict__ を持たない）
+DATACLASS_OPTIONS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class ReceiptItem:
     """
     レシート明細データクラス
@@ -37,7 +46,7 @@ class ReceiptItem:
     tag_reason: str = ""
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ReceiptSummary:
     """
     レシートサマリデータクラス
@@ -51,6 +60,7 @@ class ReceiptSummary:
         total (float | None): 合計金額（raw）
         tax (float | None): 税金（raw）
         date_iso (str): 購入日（ISOフォーマット・正規化後）
+        date_obj (datetime.date | None): 購入日（date_iso をパース済みの値）
         time_norm (str): 購入時間（正規化後）
         total_yen (int | None): 合計金額（円・正規化後）
         tax_yen (int | None): 税金（円・正規化後）
@@ -68,6 +78,7 @@ class ReceiptSummary:
 
     # 正規化済み（CSV/JSONの基本はこちらを使用）
     date_iso: str = ""
+    date_obj: datetime.date | None = None   # date_iso のパース結果（保存処理で再パースしないために保持）
     time_norm: str = ""
     total_yen: int | None = None
     tax_yen: int | None = None
@@ -80,7 +91,7 @@ class ReceiptSummary:
     has_items: bool = True             # 明細が取得できたか
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ReceiptResult:
     """
     レシート解析結果データクラス
@@ -89,15 +100,15 @@ class ReceiptResult:
         source_file (str): 元ファイル名
         summary (ReceiptSummary): レシートサマリ情報
         items (list[ReceiptItem]): レシート明細リスト
-        raw (dict[str, Any]): AI 解析の生データ
+        raw (dict[str, Any] | None): AI 解析の生データ（保持しない場合は None）
     """
     source_file: str = ""
     summary: ReceiptSummary = field(default_factory=ReceiptSummary)
     items: list[ReceiptItem] = field(default_factory=list)
-    raw: dict[str, Any] = field(default_factory=dict)
+    raw: dict[str, Any] | None = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ReceiptProcessResult:
     """
     レシート処理結果クラス（receipt_manager の戻り値用）
@@ -110,10 +121,12 @@ class ReceiptProcessResult:
         ok (bool): 処理成功フラグ
         result (ReceiptResult | None): 成功時の解析結果
         error_reason (str): 失敗理由（ログ・UI表示用）
+        duplicate (bool): 処理済みレシートの重複としてスキップしたか
     """
     ok: bool
     result: Optional[ReceiptResult] = None
     error_reason: str = ""
+    duplicate: bool = False
 
     @classmethod
     def success(cls, result: ReceiptResult) -> "ReceiptProcessResult":
@@ -141,9 +154,22 @@ class ReceiptProcessResult:
         """
         return cls(ok=False, result=None, error_reason=reason)
 
+    @classmethod
+    def skipped_duplicate(cls) -> "ReceiptProcessResult":
+        """
+        重複スキップ結果を生成する（処理済みとして扱う）。
+
+        Args:
+            None
+
+        Returns:
+            ReceiptProcessResult: 重複スキップ結果
+        """
+        return cls(ok=True, result=None, error_reason="", duplicate=True)
+
 
-class ReceiptTag(Enum):
-    """レシートタグ列挙型"""
+class ReceiptTag(str, Enum):
+    """レシートタグ列挙型（str を継承し、日本語タグ文字列としてそのまま比較・シリアライズ可能）"""
     FOOD = "食費"
     EAT_OUT = "外食"
     DAILY_NECESSITIES = "日用品"
@@ -4,13 +4,14 @@
 """
 from __future__ import annotations
 
-import inspect
 import logging
 import os
-from datetime import datetime
+import time
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from queue import Empty, SimpleQueue
 from threading import Lock
-from typing import Literal
+from typing import Callable, Literal
 
 
 # =========================
@@ -22,6 +23,12 @@ LOG_LEVEL_MAP: dict[LOG_LEVEL, int] = {
     "INFO": logging.INFO,
     "ERROR": logging.ERROR,
 }
+LOG_TIME_FORMAT: str = "%Y年%m月%d日 %H時%M分%S秒"   # ログに表示する日時の書式
+LOG_LINE_FORMAT: str = "[%s]：[%s]：[%s]：%s"      # ログ1行の書式（日時、レベル、呼び出し元ファイル名、メッセージ）
+LOG_LINE_FORMAT_NO_CALLER: str = "[%s]：[%s]：%s"  # 呼び出し元ファイル名を持たないログ1行の書式
+CALLER_STACKLEVEL: int = 3                      # 呼び出し元フレームの位置（_log → debug/info/error → 呼び出し元）
+LOG_FLUSH_INTERVAL_SEC: float = 1.0             # ログファイルをフラッシュする最短間隔(秒)（ERROR は即時）
+LOG_QUEUE_BATCH_SIZE: int = 64                  # リスナースレッドが1回にまとめて書き込む最大レコード数
 
 
 class _CustomFormatter(logging.Formatter):
@@ -42,15 +49,229 @@ class _CustomFormatter(logging.Formatter):
         Returns:
             str: フォーマット済みのログ文字列
         """
-        # logging が保持している UNIX 時刻から表示用日時を生成
-        dt: datetime = datetime.fromtimestamp(record.created)
-        ts: str = dt.strftime("%Y年%m月%d日 %H時%M分%S秒")
+        # logging が保持している UNIX 時刻から表示用日時を生成（datetime オブジェクトは生成しない）
+        ts: str = time.strftime(LOG_TIME_FORMAT, time.localtime(record.created))
 
         level: str = record.levelname
-        src_file: str = os.path.basename(getattr(record, "src_file", record.filename))
-        msg: str = record.getMessage()
+        # 呼び出し元ファイル名（get_logger のロガーは生成時に確定した名前、それ以外は stacklevel 指定により logging が設定済み）
+        # ※呼び出し元を取得しなかったログ（DEBUG/INFO かつ capture_caller 無効）は空文字のため表示しない
+        src_file: str = record.filename
+        # 引数なしのログはメッセージをそのまま使う（getMessage の str() 変換を通さない。% 埋め込み時に文字列化される）
+        msg: str = record.msg if not record.args else record.getMessage()
 
-        return f"[{ts}]：[{level}]：[{src_file}]：{msg}"
+        # 固定の書式文字列に % で一括埋め込みする（f-string の分割組み立てを行わない）
+        if not src_file:
+            return LOG_LINE_FORMAT_NO_CALLER % (ts, level, msg)
+        return LOG_LINE_FORMAT % (ts, level, src_file, msg)
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """
+    レコードごとのフラッシュを間引くファイルハンドラ
+
+    - FileHandler はレコードごとに flush するため、書き込みのたびに write システムコールが発生する
+    - ERROR 以上のレコード、または前回フラッシュから LOG_FLUSH_INTERVAL_SEC 経過後のレコードでのみフラッシュする
+    - 次のレコードが来ない間に残ったバッファは flush_pending() で書き出す（_BatchingQueueListener が待機中に呼び出す）
+    - close() 時は必ずフラッシュする
+    """
+
+    def __init__(self, filename: Path, encoding: str) -> None:
+        """
+        バッファ付きファイルハンドラを初期化する
+
+        Args:
+            filename(Path): ログファイルパス
+            encoding(str): 文字コード
+
+        Returns:
+            None
+        """
+        super().__init__(filename, encoding=encoding)
+        self._flush_requested: bool = True
+        self._has_pending: bool = False      # 未フラッシュの書き込みがあるか
+        self._last_flush: float = time.monotonic()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        レコードを書き込み、必要な場合のみフラッシュする
+
+        Args:
+            record(logging.LogRecord): 出力するログ情報
+
+        Returns:
+            None
+        """
+        # StreamHandler.emit は書き込み後に必ず flush() を呼ぶため、ここでフラッシュ要否を決める
+        self._flush_requested = (
+            record.levelno >= logging.ERROR
+            or time.monotonic() - self._last_flush >= LOG_FLUSH_INTERVAL_SEC
+        )
+        super().emit(record)
+
+    def flush(self) -> None:
+        """
+        フラッシュ要求がある場合のみストリームをフラッシュする
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if not self._flush_requested:
+            self._has_pending = True
+            return
+        super().flush()
+        self._has_pending = False
+        self._last_flush = time.monotonic()
+
+    def flush_pending(self) -> None:
+        """
+        未フラッシュの書き込みがある場合にフラッシュする（ログ出力が途絶えた間の書き出し用）
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if not self._has_pending:
+            return
+
+        self.acquire()
+        try:
+            self._flush_requested = True
+            self.flush()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        """
+        バッファ内容をフラッシュしてからハンドラをクローズする
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self._flush_requested = True
+        super().close()
+
+    def emit_batch(self, records: list[logging.LogRecord]) -> None:
+        """
+        複数レコードをまとめて1回で書き込み、必要な場合のみフラッシュする
+
+        Args:
+            records(list[logging.LogRecord]): 出力するログ情報（出力順）
+
+        Returns:
+            None
+        """
+        # クローズ後などストリームが無い場合は、通常の1件ずつの書き込みに任せる
+        if self.stream is None:
+            for record in records:
+                self.handle(record)
+            return
+
+        self.acquire()
+        try:
+            terminator: str = self.terminator
+            fmt: Callable[[logging.LogRecord], str] = self.format
+            self.stream.write("".join([fmt(record) + terminator for record in records]))
+            self._flush_requested = (
+                any(record.levelno >= logging.ERROR for record in records)
+                or time.monotonic() - self._last_flush >= LOG_FLUSH_INTERVAL_SEC
+            )
+            self.flush()
+        except Exception:
+            self.handleError(records[-1])
+        finally:
+            self.release()
+
+
+class _BatchingQueueListener(QueueListener):
+    """
+    キューに溜まったレコードをまとめて書き込むキューリスナー
+
+    - QueueListener は1件ずつ取り出して書き込むため、レコードごとに書き込み・フラッシュ判定が発生する
+    - 取り出せるだけ（最大 LOG_QUEUE_BATCH_SIZE 件）取り出し、_BufferedFileHandler へ1回で書き込む
+    - レコードが LOG_FLUSH_INTERVAL_SEC 届かない間は、ハンドラに残ったバッファをフラッシュする
+      （Azure 応答待ち・リトライ待機中もそれまでのログをファイルに残すため）
+    - キューは SimpleQueue を前提とする（task_done を持たない）
+    """
+
+    def _monitor(self) -> None:
+        """
+        キューを監視し、取り出したレコードをまとめてハンドラへ渡す（リスナースレッドで実行）
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        stopped: bool = False
+        while not stopped:
+            try:
+                record: logging.LogRecord = self.queue.get(timeout=LOG_FLUSH_INTERVAL_SEC)
+            except Empty:
+                self.flush_pending()
+                continue
+            if record is self._sentinel:
+                break
+
+            records: list[logging.LogRecord] = [record]
+            while len(records) < LOG_QUEUE_BATCH_SIZE:
+                try:
+                    record = self.dequeue(False)
+                except Empty:
+                    break
+                # 停止要求より前に投入されたレコードは書き込んでから終了する
+                if record is self._sentinel:
+                    stopped = True
+                    break
+                records.append(record)
+
+            self.handle_batch(records)
+
+    def flush_pending(self) -> None:
+        """
+        各ハンドラに残った未フラッシュのバッファを書き出す
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        for handler in self.handlers:
+            if isinstance(handler, _BufferedFileHandler):
+                handler.flush_pending()
+
+    def handle_batch(self, records: list[logging.LogRecord]) -> None:
+        """
+        複数レコードを各ハンドラへ渡す
+
+        Args:
+            records(list[logging.LogRecord]): 出力するログ情報（出力順）
+
+        Returns:
+            None
+        """
+        prepared: list[logging.LogRecord] = [self.prepare(record) for record in records]
+        for handler in self.handlers:
+            targets: list[logging.LogRecord] = prepared
+            if self.respect_handler_level:
+                targets = [record for record in prepared if record.levelno >= handler.level]
+            if not targets:
+                continue
+
+            if isinstance(handler, _BufferedFileHandler):
+                handler.emit_batch(targets)
+            else:
+                for record in targets:
+                    handler.handle(record)
 
 
 class _LoggerCore:
@@ -59,7 +280,7 @@ class _LoggerCore:
 
     - コンソール出力／ファイル出力の制御
     - ログレベルの管理
-    - ログファイルの遅延生成（初回ログ出力時）
+    - ログファイルの生成（初期化時）
     """
 
     def __init__(
@@ -70,6 +291,7 @@ class _LoggerCore:
         enable_file: bool,
         file_level: LOG_LEVEL,
         log_dir: str,
+        capture_caller: bool,
     ) -> None:
         """
         ログ設定に基づいてロガーを初期化する
@@ -80,6 +302,7 @@ class _LoggerCore:
             enable_file(bool): ファイル出力を有効にするか
             file_level(LOG_LEVEL): ファイルに出力する最小ログレベル
             log_dir(str): ログファイルの保存先ディレクトリ
+            capture_caller(bool): DEBUG/INFO ログでも呼び出し元ファイル名を取得するか（ERROR は常に取得）
 
         Returns:
             None
@@ -89,18 +312,34 @@ class _LoggerCore:
         self.console_level: LOG_LEVEL = console_level
         self.file_level: LOG_LEVEL = file_level
         self.log_dir: str = log_dir
+        self.capture_caller: bool = capture_caller
+
+        # いずれかの出力先で出力される最小ログレベル（出力先が無い場合はどのレベルも出力しない）
+        enabled_levels: list[int] = []
+        if self.enable_console:
+            enabled_levels.append(LOG_LEVEL_MAP[self.console_level])
+        if self.enable_file:
+            enabled_levels.append(LOG_LEVEL_MAP[self.file_level])
+        self._min_level: int = min(enabled_levels) if enabled_levels else logging.CRITICAL + 1
+
         logger: logging.Logger = logging.getLogger("app_logger")
         logger.setLevel(logging.DEBUG)
         logger.propagate = False
         logger.handlers.clear()
         self._logger: logging.Logger = logger
 
+        # レベル別の出力メソッド（Logger.log の汎用ディスパッチを通さない）
+        self._emit: dict[int, Callable[..., None]] = {
+            logging.DEBUG: logger.debug,
+            logging.INFO: logger.info,
+            logging.ERROR: logger.error,
+        }
+
         self._formatter: _CustomFormatter = _CustomFormatter()
-        # ファイルハンドラは初回ログ出力時に生成
+        # ※ファイルへの書き込みは QueueListener のスレッドで行い、呼び出し側はキューへの投入のみ行う
         self._file_handler: logging.FileHandler | None = None
-
-        # ファイル生成競合防止用ロック
-        self._file_lock: Lock = Lock()
+        self._queue_handler: QueueHandler | None = None
+        self._queue_listener: QueueListener | None = None
 
         if self.enable_console:
             ch: logging.StreamHandler = logging.StreamHandler()
@@ -108,9 +347,14 @@ class _LoggerCore:
             ch.setFormatter(self._formatter)
             self._logger.addHandler(ch)
 
-    def _ensure_file_handler(self) -> None:
+        # ファイルハンドラは初期化時に生成する（ログ出力のたびに生成済みかを判定しない）
+        # ※init() は _core_lock 取得中に呼び出すため、生成競合の考慮は不要
+        if self.enable_file:
+            self._create_file_handler()
+
+    def _create_file_handler(self) -> None:
         """
-        ファイル出力用ハンドラを必要に応じて生成する
+        ファイル出力用ハンドラを生成する
 
         Args:
             None
@@ -118,40 +362,39 @@ class _LoggerCore:
         Returns:
             None
         """
-        if not self.enable_file or self._file_handler is not None:
-            return
-
-        # 複数スレッドからの同時生成を防止
-        with self._file_lock:
-            if self._file_handler is not None:
-                return
+        log_dir_path: Path = Path(self.log_dir)
+        log_dir_path.mkdir(parents=True, exist_ok=True)
 
-            log_dir_path: Path = Path(self.log_dir)
-            log_dir_path.mkdir(parents=True, exist_ok=True)
+        ts: str = time.strftime("%Y%m%d_%H%M%S")
+        log_path: Path = log_dir_path / f"{ts}.log"
 
-            ts: str = datetime.now().strftime("%Y%m%d_%H%M%S")
-            log_path: Path = log_dir_path / f"{ts}.log"
+        fh: logging.FileHandler = _BufferedFileHandler(log_path, encoding="utf-8")
+        fh.setLevel(LOG_LEVEL_MAP[self.file_level])
+        fh.setFormatter(self._formatter)
 
-            fh: logging.FileHandler = logging.FileHandler(log_path, encoding="utf-8")
-            fh.setLevel(LOG_LEVEL_MAP[self.file_level])
-            fh.setFormatter(self._formatter)
+        # ロガーにはキュー投入用ハンドラのみを追加し、ファイル書き込みはリスナースレッドに任せる
+        log_queue: SimpleQueue[logging.LogRecord] = SimpleQueue()
+        qh: QueueHandler = QueueHandler(log_queue)
+        qh.setLevel(LOG_LEVEL_MAP[self.file_level])
+        listener: QueueListener = _BatchingQueueListener(log_queue, fh, respect_handler_level=True)
+        listener.start()
 
-            self._logger.addHandler(fh)
-            self._file_handler = fh
+        self._logger.addHandler(qh)
+        self._queue_handler = qh
+        self._queue_listener = listener
+        self._file_handler = fh
 
-    def _caller_file(self) -> str:
+    def is_enabled_for(self, level: int) -> bool:
         """
-        ログ呼び出し元のファイル名を取得する
+        指定されたログレベルがいずれかの出力先で出力対象か判定する
 
         Args:
-            None
+            level(int): logging モジュールのログレベル
 
         Returns:
-            str: 呼び出し元ファイルのパス
+            bool: コンソール／ファイルのいずれかで出力される場合 True
         """
-        stack: list[inspect.FrameInfo] = inspect.stack()
-        caller: str = stack[3].filename if len(stack) > 3 else ""
-        return caller
+        return level >= self._min_level
 
     def _log(self, level: int, message: str) -> None:
         """
@@ -164,11 +407,52 @@ class _LoggerCore:
         Returns:
             None
         """
-        if self.enable_file:
-            self._ensure_file_handler()
+        # どの出力先でも出力されないログは、呼び出し元の取得・LogRecord 生成を行わない
+        # （ロガー自体は DEBUG 固定のため、出力先ごとのレベルで判定する）
+        if level < self._min_level:
+            return
 
-        src_file: str = self._caller_file()
-        self._logger.log(level, message, extra={"src_file": src_file})
+        # 呼び出し元の特定は logging 側のフレーム探索（findCaller）に stacklevel で任せる
+        # （独自のフレーム探索や extra 用 dict の生成を行わない）
+        # ※フレーム探索は ERROR（または capture_caller 有効時）のみ行う
+        if level >= logging.ERROR or self.capture_caller:
+            self._emit[level](message, stacklevel=CALLER_STACKLEVEL)
+            return
+
+        # DEBUG/INFO は呼び出し元を空にした LogRecord を直接生成し、findCaller を通さずに出力する
+        self._handle(level, message, "")
+
+    def _log_with_file(self, level: int, message: str, filename: str) -> None:
+        """
+        呼び出し元ファイル名を指定してログを出力する（フレーム探索を行わない）
+
+        Args:
+            level(int): logging モジュールのログレベル
+            message(str): 出力するログメッセージ
+            filename(str): 呼び出し元ファイル名
+
+        Returns:
+            None
+        """
+        if level < self._min_level:
+            return
+
+        self._handle(level, message, filename)
+
+    def _handle(self, level: int, message: str, filename: str) -> None:
+        """
+        LogRecord を直接生成してハンドラへ渡す
+
+        Args:
+            level(int): logging モジュールのログレベル
+            message(str): 出力するログメッセージ
+            filename(str): 呼び出し元ファイル名（空文字の場合は表示しない）
+
+        Returns:
+            None
+        """
+        logger: logging.Logger = self._logger
+        logger.handle(logger.makeRecord(logger.name, level, filename, 0, message, (), None))
 
     def close(self) -> None:
         """
@@ -180,24 +464,125 @@ class _LoggerCore:
         Returns:
             None
         """
+        # ※init()/delete() から _core_lock 取得中に呼び出される
         if self._file_handler is None:
             return
 
-        with self._file_lock:
-            if self._file_handler is None:
-                return
+        # キュー投入を止めてから、キューに残ったログを書き込み終えるまで待つ
+        if self._queue_handler is not None:
+            self._logger.removeHandler(self._queue_handler)
+            self._queue_handler = None
+        if self._queue_listener is not None:
+            self._queue_listener.stop()
+            self._queue_listener = None
 
-            fh: logging.FileHandler = self._file_handler
-            fh.flush()
-            fh.close()
-            self._logger.removeHandler(fh)
-            self._file_handler = None
+        fh: logging.FileHandler = self._file_handler
+        fh.close()
+        self._file_handler = None
+
+
+class _ModuleLogger:
+    """
+    呼び出し元ファイル名を保持するロガー（get_logger で生成）
+
+    - ファイル名はモジュール読み込み時に1回だけ確定し、ログ出力時のフレーム探索を行わない
+    - 出力可否はモジュールレベルの debug/info/error と同じフラグで判定する
+    """
+
+    __slots__ = ("_filename",)
+
+    def __init__(self, filename: str) -> None:
+        """
+        ロガーを初期化する
+
+        Args:
+            filename(str): ログに表示する呼び出し元ファイル名
+
+        Returns:
+            None
+        """
+        self._filename: str = filename
+
+    def debug(self, message: str) -> None:
+        """
+        DEBUG レベルのログを出力する
+
+        Args:
+            message(str): 出力するログメッセージ
+
+        Returns:
+            None
+        """
+        if not _debug_enabled:
+            return
+        _core._log_with_file(logging.DEBUG, message, self._filename)
+
+    def info(self, message: str) -> None:
+        """
+        INFO レベルのログを出力する
+
+        Args:
+            message(str): 出力するログメッセージ
+
+        Returns:
+            None
+        """
+        if not _info_enabled:
+            return
+        _core._log_with_file(logging.INFO, message, self._filename)
+
+    def error(self, message: str) -> None:
+        """
+        ERROR レベルのログを出力する
+
+        Args:
+            message(str): 出力するログメッセージ
+
+        Returns:
+            None
+        """
+        if not _error_enabled:
+            return
+        _core._log_with_file(logging.ERROR, message, self._filename)
+
+    def is_debug_enabled(self) -> bool:
+        """
+        DEBUG レベルのログが出力されるか判定する
+
+        Args:
+            None
+
+        Returns:
+            bool: DEBUG ログが出力される場合 True
+        """
+        return _debug_enabled
 
 
 # ----- Public API -----
 # グローバル変数定義
 _core: _LoggerCore | None = None
 _core_lock: Lock = Lock()
+# レベル別の出力可否（init/delete 時に更新し、出力されないログは debug/info/error の入口で破棄する）
+_debug_enabled: bool = False
+_info_enabled: bool = False
+_error_enabled: bool = False
+
+
+def _update_level_flags(core: _LoggerCore | None) -> None:
+    """
+    レベル別の出力可否フラグを更新する（_core_lock 取得中に呼び出すこと）
+
+    Args:
+        core(_LoggerCore | None): 出力先のロガー（None の場合はすべて出力しない）
+
+    Returns:
+        None
+    """
+    global _debug_enabled, _info_enabled, _error_enabled
+
+    _debug_enabled = core is not None and core.is_enabled_for(logging.DEBUG)
+    _info_enabled = core is not None and core.is_enabled_for(logging.INFO)
+    _error_enabled = core is not None and core.is_enabled_for(logging.ERROR)
 
 
 def init(
@@ -207,6 +592,7 @@ def init(
     enable_file: bool = True,
     file_level: LOG_LEVEL = "DEBUG",
     log_dir: str = "logs",
+    capture_caller: bool = False,
 ) -> None:
     """
     ロガーを初期化する
@@ -217,6 +603,7 @@ def init(
         enable_file(bool): ファイル出力を有効にするか
         file_level(LOG_LEVEL): ファイル出力のログレベル
         log_dir(str): ログファイルの保存先ディレクトリ
+        capture_caller(bool): DEBUG/INFO ログでも呼び出し元ファイル名を出力するか（ERROR は常に出力）
 
     Returns:
         None
@@ -233,8 +620,10 @@ def init(
             enable_file=enable_file,
             file_level=file_level,
             log_dir=log_dir,
+            capture_caller=capture_caller,
         )
         _core = core
+        _update_level_flags(core)
 
 
 def debug(message: str) -> None:
@@ -247,6 +636,8 @@ def debug(message: str) -> None:
     Returns:
         None
     """
+    if not _debug_enabled:
+        return
     level: int = logging.DEBUG
     _core._log(level, message)
 
@@ -261,6 +652,8 @@ def info(message: str) -> None:
     Returns:
         None
     """
+    if not _info_enabled:
+        return
     level: int = logging.INFO
     _core._log(level, message)
 
@@ -275,10 +668,42 @@ def error(message: str) -> None:
     Returns:
         None
     """
+    if not _error_enabled:
+        return
     level: int = logging.ERROR
     _core._log(level, message)
 
 
+def get_logger(filename: str) -> _ModuleLogger:
+    """
+    呼び出し元ファイル名を保持するロガーを取得する
+
+    - 各モジュールの先頭で log = log_mod.get_logger(__file__) として1回だけ生成する
+
+    Args:
+        filename(str): 呼び出し元モジュールのファイルパス（__file__）
+
+    Returns:
+        _ModuleLogger: 呼び出し元ファイル名を保持するロガー
+    """
+    return _ModuleLogger(os.path.basename(filename))
+
+
+def is_debug_enabled() -> bool:
+    """
+    DEBUG レベルのログが出力されるか判定する
+
+    - 組み立てに時間のかかる DEBUG メッセージは、本関数で判定してから生成する
+
+    Args:
+        None
+
+    Returns:
+        bool: DEBUG ログが出力される場合 True
+    """
+    return _debug_enabled
+
+
 def delete() -> None:
     """
     ロガーを破棄する
@@ -292,6 +717,7 @@ def delete() -> None:
     global _core
     with _core_lock:
         if _core is not None:
+            _update_level_flags(None)
             _core.close()
             _core = None
 # ----- Public API -----
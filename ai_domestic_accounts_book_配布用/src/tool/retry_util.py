@@ -0,0 +1,65 @@
+"""
+初回作成日：2026/10/14
+ファイル名：retry_util.py
+"""
+# Azure へのリクエストのリトライ設定・待機時間算出を共通化するモジュール
+# ※リトライ対象のエラー判定は SDK ごとに異なるため、各モジュールで行う
+from __future__ import annotations
+
+import random
+
+
+# ==================================================
+# 定数定義
+# ==================================================
+REQUEST_MAX_ATTEMPTS: int = 5                   # リクエストの最大試行回数（初回を含む）
+RETRY_BASE_DELAY_SEC: float = 1.0               # リトライ待機時間の基準値(秒)（試行ごとに2倍）
+RETRY_JITTER_SEC: float = 0.5                   # リトライ待機時間に加えるゆらぎの最大値(秒)
+RETRY_MAX_DELAY_SEC: float = 60.0               # リトライ待機時間の上限(秒)（Retry-After 指定時も含む）
+RETRYABLE_STATUS_CODES: frozenset[int] = frozenset({408, 429, 500, 502, 503, 504})     # リトライ対象のHTTPステータス
+
+
+def retry_delay(e: Exception, attempt: int) -> float:
+    """
+    リトライまでの待機時間を算出する
+
+    - 応答に Retry-After ヘッダ（秒）がある場合はその値を優先する（429 などのレート制限用）
+    - それ以外は指数バックオフ + ゆらぎ
+    - openai / azure-core いずれの例外も e.response.headers から Retry-After を参照する
+
+    Args:
+        e (Exception): 発生したエラー
+        attempt (int): 失敗した試行のインデックス（0 始まり）
+
+    Returns:
+        float: 待機時間(秒)
+    """
+    delay: float = RETRY_BASE_DELAY_SEC * (2 ** attempt)
+
+    retry_after: float | None = _parse_retry_after(e)
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+
+    return min(delay, RETRY_MAX_DELAY_SEC) + random.uniform(0, RETRY_JITTER_SEC)
+
+
+def _parse_retry_after(e: Exception) -> float | None:
+    """
+    エラーの応答ヘッダから Retry-After（秒）を取得する
+
+    Args:
+        e (Exception): 発生したエラー
+
+    Returns:
+        float | None: Retry-After の秒数（ヘッダが無い・秒数として解釈できない場合は None）
+    """
+    response = getattr(e, "response", None)
+    headers = getattr(response, "headers", None)
+    retry_after = headers.get("retry-after") if headers is not None else None
+    if retry_after is None:
+        return None
+
+    try:
+        return float(retry_after)
+    except (TypeError, ValueError):
+        return None